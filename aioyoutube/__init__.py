@@ -1 +1,13 @@
 from .api import *
+from .cache import *
+from .cassette import *
+from .dedup import *
+from .export import *
+from .checkpoint import *
+from .key_pool import *
+from .limiter import *
+from .metrics import *
+from .retry import *
+from .runner import *
+from .models import *
+from .pipeline import *
@@ -1,21 +1,36 @@
-from aiohttp import ClientSession
-from typing import List
+from aiohttp import ClientSession, TCPConnector
+from json import loads
+from typing import (
+    AsyncIterator, Callable, Dict, Iterable, List, Tuple, Union, Type,
+)
 
-from aioyoutube.helpers import insert_name, time_converting
+from aioyoutube.cache import BaseCache
+from aioyoutube.cassette import Cassette
+from aioyoutube.checkpoint import BaseCheckpointStore
+from aioyoutube.helpers import (
+    time_converting, fields_converting, paginate, crawl_comments,
+    channel_videos, sync_search, sync_playlist_items, ShardedSearch,
+    RawResponse,
+)
+from aioyoutube.key_pool import ApiKeyPool
+from aioyoutube.limiter import ConcurrencyLimiter
+from aioyoutube.metrics import ApiMetrics
+from aioyoutube.pipeline import (
+    Handler, Middleware, Request, Response, api_method, build_pipeline,
+)
+from aioyoutube.retry import RetryPolicy
 from aioyoutube.handlers import (
-    response_error_handler,
-    search_validation,
-    comment_threads_validation,
-    comment_threads_error_handler,
-    channels_validation,
-    channels_error_handler,
-    playlist_items_error_handler,
-    playlist_items_validation,
-    playlists_validation,
-    playlist_error_handler,
-    comments_validation,
-    comments_error_handler,
-    videos_validation,
+    IDS_METHODS,
+    cache_middleware,
+    cassette_middleware,
+    error_middleware,
+    ids_middleware,
+    key_pool_middleware,
+    limiter_middleware,
+    metrics_middleware,
+    models_middleware,
+    retry_middleware,
+    validation_middleware,
 )
 
 __all__ = [
@@ -27,13 +42,115 @@ class Api:
     """youtube.com REST API."""
     _API_VERSION = 3
     _API_URL_TEMP = 'https://www.googleapis.com/youtube/v{version}/'
+    _MAX_IDS = 50
+    # Api compresses responses only for user agent containing "gzip".
+    _HEADERS = {
+        'Accept-Encoding': 'gzip',
+        'User-Agent': 'aioyoutube (gzip)',
+    }
+
+    __slots__ = ('_session', '_session_class', '_own_session',
+                 '_connector_options', '_api_version', '_api_url',
+                 '_fan_out', '_key_pool', '_retry_policy', '_cache',
+                 '_json_loads', '_validate', '_middlewares', '_pipelines',
+                 '_metrics', '_limiter', '_cassette')
+
+    def __init__(self,
+                 session: Union[ClientSession, Type[ClientSession]] = None,
+                 version: int = None, limit: int = 100,
+                 limit_per_host: int = 0, keepalive_timeout: float = 30,
+                 ttl_dns_cache: int = 300, fan_out: int = 10,
+                 key_pool: ApiKeyPool = None,
+                 retry_policy: RetryPolicy = None, cache: BaseCache = None,
+                 json_loads: Callable[[bytes], dict] = loads,
+                 validate: bool = True,
+                 middlewares: Iterable[Middleware] = (),
+                 metrics: Union[ApiMetrics, bool] = True,
+                 limiter: ConcurrencyLimiter = None, base_url: str = None,
+                 cassette: Cassette = None):
+        """
+        Args:
+            session (ClientSession, optional): Session used for all api
+                requests. Session passed by instance isn't closed by api,
+                session passed by class is created on first request and
+                closed by api. Default is ClientSession class.
+            version (int, optional): Youtube api version. Default value is 3.
+            limit (int, optional): Total number of simultaneous connections
+                in pool. Default value is 100, 0 is unlimited.
+            limit_per_host (int, optional): Number of simultaneous connections
+                to one host. Default value is 0 (unlimited).
+            keepalive_timeout (float, optional): Seconds of keeping idle
+                connection open. Default value is 30.
+            ttl_dns_cache (int, optional): Seconds of caching resolved dns
+                records. Default value is 300.
+            fan_out (int, optional): Maximum count of simultaneous requests
+                of one method call, when passed ids are split into chunks.
+                Default value is 10.
+            key_pool (ApiKeyPool, optional): Pool of application keys used
+                by requests without passed key. Key with most remaining
+                quota is taken, key with exceeded quota is replaced by
+                other key and request is repeated.
+            retry_policy (RetryPolicy, optional): Policy of repeating
+                requests failed with transient errors. Can be overridden
+                for one call by method parameter "retry". By default
+                requests aren't repeated.
+            cache (BaseCache, optional): Cache of api responses, responses
+                are cached by method name and parameters except key.
+            json_loads (Callable, optional): Function decoding response
+                body bytes, for example orjson.loads. Default is json.loads.
+            validate (bool, optional): Validate methods parameters before
+                request. Disable it only for trusted callers. Default value
+                is True.
+            middlewares (Iterable[Middleware], optional): Middlewares of api
+                request pipeline, called in passed order after built-in
+                validation and retry middlewares and before cache. Every
+                middleware is coroutine function taking request and handler
+                of the next pipeline step and returning response.
+            metrics (ApiMetrics | bool, optional): Metrics of api http
+                requests, can be shared by several apis. By default new
+                metrics are created, False disables metrics.
+            limiter (ConcurrencyLimiter, optional): Global and per method
+                limits of simultaneous requests, can be shared by several
+                apis. By default only connections pool is limited.
+            base_url (str, optional): Url of api server, for example of
+                local fake server. Placeholder "{version}" is replaced by
+                api version. Default is youtube api url.
+            cassette (Cassette, optional): Cassette recording responses of
+                api or replaying them without network.
 
-    __slots__ = ('_session', '_api_version', '_api_url')
-
-    def __init__(self, session: ClientSession = None, version: int = None):
-        self._session = session or ClientSession
+        """
+        if isinstance(session, ClientSession):
+            self._session = session
+            self._session_class = None
+        else:
+            self._session = None
+            self._session_class = session or ClientSession
+        self._own_session = False
+        self._connector_options = {
+            'limit': limit,
+            'limit_per_host': limit_per_host,
+            'keepalive_timeout': keepalive_timeout,
+            'ttl_dns_cache': ttl_dns_cache,
+        }
         self._api_version = version or self._API_VERSION
-        self._api_url = self._API_URL_TEMP.format(version=self.api_version)
+        self._api_url = (base_url or self._API_URL_TEMP).format(
+            version=self.api_version
+        )
+        if not self._api_url.endswith('/'):
+            self._api_url += '/'
+        self._fan_out = fan_out
+        self._key_pool = key_pool
+        self._retry_policy = retry_policy
+        self._cache = cache
+        self._json_loads = json_loads
+        self._validate = validate
+        self._middlewares = list(middlewares)
+        self._pipelines: Dict[Tuple[str, bool, bool], Handler] = {}
+        if metrics is True:
+            metrics = ApiMetrics()
+        self._metrics = metrics or None
+        self._limiter = limiter
+        self._cassette = cassette
 
     def __repr__(self):
         return f'<class {self.__class__.__name__} version={self.api_version}>'
@@ -41,6 +158,12 @@ class Api:
     def __str__(self):
         return f'Youtube Api v{self.api_version} requester.'
 
+    async def __aenter__(self) -> 'Api':
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
     @property
     def api_url(self) -> str:
         return self._api_url
@@ -49,31 +172,164 @@ class Api:
     def api_version(self) -> int:
         return self._api_version
 
-    async def _request(self, method_name: str, params: dict) -> dict:
-        """Sending request and getting data from youtube api server.
+    @property
+    def key_pool(self) -> ApiKeyPool:
+        return self._key_pool
+
+    @property
+    def retry_policy(self) -> RetryPolicy:
+        return self._retry_policy
+
+    @property
+    def cache(self) -> BaseCache:
+        return self._cache
+
+    @property
+    def validate(self) -> bool:
+        return self._validate
+
+    @property
+    def metrics(self) -> ApiMetrics:
+        return self._metrics
+
+    @property
+    def limiter(self) -> ConcurrencyLimiter:
+        return self._limiter
+
+    @property
+    def cassette(self) -> Cassette:
+        return self._cassette
+
+    @property
+    def middlewares(self) -> Tuple[Middleware, ...]:
+        return tuple(self._middlewares)
+
+    @property
+    def closed(self) -> bool:
+        return self._session is None or self._session.closed
+
+    @property
+    def session(self) -> ClientSession:
+        """Session used by api, created on first request if it wasn't
+        passed into api."""
+        if self._session is None:
+            connector = TCPConnector(**self._connector_options)
+            self._session = self._session_class(connector=connector)
+            self._own_session = True
+        return self._session
+
+    async def close(self):
+        """Closing api session and its connections pool. Session passed
+        into api by instance isn't closed. Background refreshes of api
+        cache are cancelled, as they are sent by api session."""
+        if self._cache is not None:
+            await self._cache.cancel_refreshes()
+        if self._own_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+            self._own_session = False
+
+    def add_middleware(self, middleware: Middleware):
+        """Appending middleware into api request pipeline.
 
         Args:
-            method_name (str): Request method api name.
-            params (dict): Dict of request parameters.
+            middleware (Middleware): Coroutine function taking request and
+                handler of the next pipeline step and returning response.
 
         """
-        url = self.api_url + method_name
-
-        async with self._session() as sess:
-            async with sess.get(url, params=params) as res:
-                return await res.json()
-
-    @search_validation
-    @response_error_handler
-    @insert_name
-    async def search(self, *, key: str, text: str, max_results: int = 50,
-                     page_token: str = None, published_after: int = None,
-                     published_before: int = None, order: str = 'date',
-                     search_by: str = 'video', **kwargs) -> dict:
+        self._middlewares.append(middleware)
+        self._pipelines.clear()
+
+    def _pipeline(self, method_name: str, retry: bool = False,
+                  models: bool = False) -> Handler:
+        """Request pipeline of api method, assembled on first call.
+
+        Pipeline contains only middlewares needed by method, api settings
+        and call options, in order: validation, models, ids chunks, retry,
+        user middlewares, cache, concurrency limits, key pool, metrics,
+        errors, cassette.
+
+        Args:
+            method_name (str): Api method name.
+            retry (bool, optional): Retry policy is passed into call.
+            models (bool, optional): Response items are converted into
+                models.
+
+        """
+        pipeline = self._pipelines.get((method_name, retry, models))
+        if pipeline is not None:
+            return pipeline
+
+        middlewares = []
+        if self._validate:
+            middlewares.append(validation_middleware(method_name))
+        if models:
+            middlewares.append(models_middleware(method_name))
+        if method_name in IDS_METHODS:
+            middlewares.append(ids_middleware(self._MAX_IDS, self._fan_out))
+        if retry or self._retry_policy is not None:
+            middlewares.append(retry_middleware(self._retry_policy))
+        middlewares.extend(self._middlewares)
+        if self._cache is not None:
+            middlewares.append(cache_middleware(self._cache))
+        if self._limiter is not None:
+            middlewares.append(limiter_middleware(self._limiter, method_name))
+        middlewares.append(key_pool_middleware(self._key_pool))
+        if self._metrics is not None:
+            middlewares.append(metrics_middleware(self._metrics, method_name))
+        middlewares.append(error_middleware(method_name, self._json_loads))
+        if self._cassette is not None:
+            middlewares.append(cassette_middleware(self._cassette))
+
+        pipeline = build_pipeline(middlewares, self._send)
+        self._pipelines[(method_name, retry, models)] = pipeline
+        return pipeline
+
+    async def _call(self, request: Request) -> Union[dict, RawResponse]:
+        """Passing api method request through method pipeline.
+
+        Args:
+            request (Request): Request of api method.
+
+        """
+        kwargs = request.kwargs
+        key = (
+            request.method, 'retry' in kwargs, bool(kwargs.get('as_models'))
+        )
+        pipeline = self._pipeline(*key)
+
+        response = await pipeline(request)
+        if request.raw:
+            return RawResponse(response.body, response.status)
+        return response.json
+
+    async def _send(self, request: Request) -> Response:
+        """Sending one http request to youtube api server, last step of
+        api request pipeline.
+
+        Args:
+            request (Request): Request of api method.
+
+        """
+        async with self.session.get(self.api_url + request.method,
+                                    params=request.params,
+                                    headers=self._HEADERS) as res:
+            body = await res.read()
+
+        return Response(res.status, res.headers, body)
+
+    @api_method
+    def search(self, *, key: str = None, text: str,
+               max_results: int = 50, page_token: str = None,
+               published_after: int = None,
+               published_before: int = None, order: str = 'date',
+               search_by: str = 'video',
+               fields: Union[str, List[str]] = None, **kwargs) -> dict:
         """Getting result of searching in youtube service search.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             text (str): Text of searching.
             max_results (int, optional): Count of items in response.
                 Minimal value is 1, maximum value is 50. Default value is 50.
@@ -103,6 +359,9 @@ class Api:
                 specified time.
             search_by (str, optional): Type of api response items. Default
                 value is "video". Acceptable values: video, channel, playlist.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"].
 
         """
         params = {
@@ -113,6 +372,8 @@ class Api:
             'order': order,
             'type': search_by,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
         if page_token:
             params['pageToken'] = page_token
         if published_after:
@@ -120,21 +381,21 @@ class Api:
         if published_before:
             params['publishedBefore'] = time_converting(published_before)
 
-        return await self._request(kwargs.get('name'), params)
-
-    @comment_threads_validation
-    @response_error_handler
-    @comment_threads_error_handler
-    @insert_name
-    async def commentThreads(self, *, key: str, part: List[str], video_id: str,
-                             max_results: int = 100, order: str = 'time',
-                             text_format: str = 'plainText',
-                             page_token: str = None, search_text: str = None,
-                             **kwargs) -> dict:
+        return params
+
+    @api_method
+    def commentThreads(self, *, key: str = None, part: List[str],
+                       video_id: str, max_results: int = 100,
+                       order: str = 'time',
+                       text_format: str = 'plainText',
+                       page_token: str = None, search_text: str = None,
+                       fields: Union[str, List[str]] = None,
+                       **kwargs) -> dict:
         """Getting comment threads for video.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: id, replies, snippet.
             video_id (str): Id of youtube video.
@@ -151,6 +412,10 @@ class Api:
                 - plainText – Returns the comments in plain text format.
                 - html – Returns the comments text in HTML format.
             search_text (str, optional): Filtering response comment by text.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
         """
         params = {
@@ -161,25 +426,28 @@ class Api:
             'order': order,
             'textFormat': text_format,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
 
         if search_text:
             params['searchTerms'] = search_text
         if page_token:
             params['pageToken'] = page_token
 
-        return await self._request(kwargs.get('name'), params=params)
+        return params
 
-    @comments_validation
-    @response_error_handler
-    @comments_error_handler
-    @insert_name
-    async def comments(self, *, key: str, part: List[str], parent_id: str,
-                       max_results: int = 100, text_format: str = 'plainText',
-                       page_token: str = None, **kwargs) -> dict:
+    @api_method
+    def comments(self, *, key: str = None, part: List[str],
+                 parent_id: str, max_results: int = 100,
+                 text_format: str = 'plainText',
+                 page_token: str = None,
+                 fields: Union[str, List[str]] = None,
+                 **kwargs) -> dict:
         """Getting comments for comment thread.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: id, replies, snippet.
             parent_id (str): Id of parent comment thread.
@@ -191,6 +459,10 @@ class Api:
                 Default value is "plainText". Acceptable values are:
                 - plainText – Returns the comments in plain text format.
                 - html – Returns the comments text in HTML format.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
         """
         params = {
@@ -200,24 +472,26 @@ class Api:
             'maxResults': max_results,
             'textFormat': text_format,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
 
         if page_token:
             params['pageToken'] = page_token
 
-        return await self._request(kwargs.get('name'), params=params)
+        return params
 
-    @channels_validation
-    @response_error_handler
-    @channels_error_handler
-    @insert_name
-    async def channels(self, *, key: str, part: List[str],
-                       max_results: int = 50,
-                       channel_id: str = None, user_name: str = None,
-                       **kwargs) -> dict:
+    @api_method
+    def channels(self, *, key: str = None, part: List[str],
+                 max_results: int = 50,
+                 channel_id: Union[str, List[str]] = None,
+                 user_name: str = None,
+                 fields: Union[str, List[str]] = None,
+                 **kwargs) -> dict:
         """Getting channel data.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: brandingSettings, contentDetails,
                 contentOwnerDetails, id, localizations, snippet, statistics,
@@ -227,10 +501,16 @@ class Api:
 
             Acceptable and required only one identifier parameter at the
                 same time:
-            channel_id (str): Youtube channel id. Can take from
-                youtube url: ./channel/<user_id>.
+            channel_id (str | List[str]): Youtube channel id or list of
+                ids. Can take from youtube url: ./channel/<user_id>. Ids are
+                requested by chunks of 50, repeated ids are requested once,
+                ids without channel are listed in response "missingIds".
             user_name (str): Youtube channel owner. Can take from
                 youtube url: ./user/<user_name>.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
         """
         params = {
@@ -238,24 +518,27 @@ class Api:
             'part': ','.join(part),
             'maxResults': max_results,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
         if user_name:
             params['forUsername'] = user_name
         else:
+            # List of ids is split into chunks by ids middleware.
             params['id'] = channel_id
 
-        return await self._request(kwargs.get('name'), params=params)
+        return params
 
-    @playlist_items_validation
-    @response_error_handler
-    @playlist_items_error_handler
-    @insert_name
-    async def playlistItems(self, *, key: str, part: List[str],
-                            playlist_id: str, max_results: int = 50,
-                            page_token: str = None, **kwargs) -> dict:
+    @api_method
+    def playlistItems(self, *, key: str = None, part: List[str],
+                      playlist_id: str, max_results: int = 50,
+                      page_token: str = None,
+                      fields: Union[str, List[str]] = None,
+                      **kwargs) -> dict:
         """Getting playlist videos.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: contentDetails, id, snippet, status.
             playlist_id (str): Id of playlist which contain videos.
@@ -263,6 +546,10 @@ class Api:
                 Minimal value is 1, maximum value is 50. Default value is 50.
             page_token (str, optional): Identifies a specific page in the
                 result set that should be returned.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
         """
         params = {
@@ -271,22 +558,24 @@ class Api:
             'playlistId': playlist_id,
             'maxResults': max_results,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
         if page_token:
             params['pageToken'] = page_token
 
-        return await self._request(kwargs.get('name'), params=params)
+        return params
 
-    @playlists_validation
-    @response_error_handler
-    @playlist_error_handler
-    @insert_name
-    async def playlists(self, *, key: str, part: List[str], channel_id: str,
-                        max_results: int = 50, page_token: str = None,
-                        **kwargs) -> dict:
+    @api_method
+    def playlists(self, *, key: str = None, part: List[str],
+                  channel_id: str, max_results: int = 50,
+                  page_token: str = None,
+                  fields: Union[str, List[str]] = None,
+                  **kwargs) -> dict:
         """Getting channel playlists.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: contentDetails, id, snippet, status,
                 localizations, player.
@@ -296,47 +585,240 @@ class Api:
                 Minimal value is 1, maximum value is 50. Default value is 50.
             page_token (str, optional): Identifies a specific page in the
                 result set that should be returned.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
-            """
+        """
         params = {
             'key': key,
             'part': ','.join(part),
             'channelId': channel_id,
             'maxResults': max_results,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
         if page_token:
             params['pageToken'] = page_token
 
-        return await self._request(kwargs.get('name'), params=params)
+        return params
 
-    @videos_validation
-    @response_error_handler
-    @insert_name
-    async def videos(self, *, key: str, part: List[str], video_ids: List[str],
-                     max_results: int = 50, page_token: str = None,
-                     **kwargs):
+    @api_method
+    def videos(self, *, key: str = None, part: List[str],
+               video_ids: List[str], max_results: int = 50,
+               page_token: str = None,
+               fields: Union[str, List[str]] = None, **kwargs):
         """Getting videos by id.
 
         Args:
-            key (str): Key of youtube application, for access to youtube api.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
             part (List[str]): Sections list which must contained in response.
                 Acceptable part sections: contentDetails, id,
                 liveStreamingDetails, localizations, player, recordingDetails,
                 snippet, statistics, status, topicDetails.
-            video_ids (List[str]): list of youtube video ids.
+            video_ids (List[str]): list of youtube video ids. Ids are
+                requested by chunks of 50, repeated ids are requested once,
+                ids without video are listed in response "missingIds".
             max_results (int, optional): Count of items in response.
                 Minimal value is 1, maximum value is 50. Default value is 50.
             page_token (str, optional): Identifies a specific page in the
                 result set that should be returned.
+            fields (str | List[str], optional): Response fields selector,
+                api "fields" string or list of item fields in dotted
+                notation, for example ["snippet.title"]. Top level of item
+                field must be one of requested part sections.
 
         """
         params = {
             'key': key,
-            'id': ','.join(video_ids),
             'part': ','.join(part),
             'maxResults': max_results,
         }
+        if fields:
+            params['fields'] = fields_converting(fields)
         if page_token:
             params['pageToken'] = page_token
 
-        return await self._request(kwargs.get('name'), params=params)
+        params['id'] = video_ids
+
+        return params
+
+    def iter_search(self, *, max_items: int = None, max_pages: int = None,
+                    pages: bool = False, **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all pages of api method "search", next page is
+        requested while current page is processed.
+
+        Args:
+            max_items (int, optional): Maximum count of yielded items.
+            max_pages (int, optional): Maximum count of requested pages.
+            pages (bool, optional): Yield whole pages instead of items.
+            **kwargs: Parameter "dedup" and parameters of method
+                "search".
+
+        """
+        return paginate(self.search, max_items=max_items,
+                        max_pages=max_pages, pages=pages, **kwargs)
+
+    def iter_comment_threads(self, *, max_items: int = None,
+                             max_pages: int = None, pages: bool = False,
+                             **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all pages of api method "commentThreads", next
+        page is requested while current page is processed.
+
+        Args:
+            max_items (int, optional): Maximum count of yielded items.
+            max_pages (int, optional): Maximum count of requested pages.
+            pages (bool, optional): Yield whole pages instead of items.
+            **kwargs: Parameter "dedup" and parameters of method
+                "commentThreads".
+
+        """
+        return paginate(self.commentThreads, max_items=max_items,
+                        max_pages=max_pages, pages=pages, **kwargs)
+
+    def iter_comments(self, *, max_items: int = None, max_pages: int = None,
+                      pages: bool = False, **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all pages of api method "comments", next page is
+        requested while current page is processed.
+
+        Args:
+            max_items (int, optional): Maximum count of yielded items.
+            max_pages (int, optional): Maximum count of requested pages.
+            pages (bool, optional): Yield whole pages instead of items.
+            **kwargs: Parameter "dedup" and parameters of method
+                "comments".
+
+        """
+        return paginate(self.comments, max_items=max_items,
+                        max_pages=max_pages, pages=pages, **kwargs)
+
+    def iter_playlist_items(self, *, max_items: int = None,
+                            max_pages: int = None, pages: bool = False,
+                            **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all pages of api method "playlistItems", next
+        page is requested while current page is processed.
+
+        Args:
+            max_items (int, optional): Maximum count of yielded items.
+            max_pages (int, optional): Maximum count of requested pages.
+            pages (bool, optional): Yield whole pages instead of items.
+            **kwargs: Parameter "dedup" and parameters of method
+                "playlistItems".
+
+        """
+        return paginate(self.playlistItems, max_items=max_items,
+                        max_pages=max_pages, pages=pages, **kwargs)
+
+    def iter_playlists(self, *, max_items: int = None, max_pages: int = None,
+                       pages: bool = False, **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all pages of api method "playlists", next page is
+        requested while current page is processed.
+
+        Args:
+            max_items (int, optional): Maximum count of yielded items.
+            max_pages (int, optional): Maximum count of requested pages.
+            pages (bool, optional): Yield whole pages instead of items.
+            **kwargs: Parameter "dedup" and parameters of method
+                "playlists".
+
+        """
+        return paginate(self.playlists, max_items=max_items,
+                        max_pages=max_pages, pages=pages, **kwargs)
+
+    def crawl_comments(self, video_id: str, *, key: str = None,
+                       concurrency: int = 10, buffer: int = 1000,
+                       **kwargs) -> AsyncIterator[dict]:
+        """Iterating over all comments of video, top level comments and
+        their replies. Replies are requested by api method "comments" only
+        for threads which inline replies are incomplete.
+
+        Args:
+            video_id (str): Id of youtube video.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
+            concurrency (int, optional): Maximum count of threads which
+                replies are requested simultaneously. Default value is 10.
+            buffer (int, optional): Maximum count of received and not
+                yielded comments. Default value is 1000.
+            **kwargs: Parameters "order", "text_format", "dedup",
+                "as_models" and parameters of api methods, for example
+                "retry".
+
+        """
+        return crawl_comments(self, video_id, key=key,
+                              concurrency=concurrency, buffer=buffer,
+                              **kwargs)
+
+    def iter_channel_videos(self, channel_id: Union[str, List[str]], *,
+                            key: str = None,
+                            part: List[str] = ('snippet', 'statistics'),
+                            concurrency: int = 5, buffer: int = 500,
+                            **kwargs) -> AsyncIterator[dict]:
+        """Iterating over uploaded videos of channels with details, videos
+        of playlist page are requested while next page is loading.
+
+        Args:
+            channel_id (str | List[str]): Youtube channel id or list of ids.
+            key (str, optional): Key of youtube application, for access to
+                youtube api. Can be omitted for api with key pool.
+            part (List[str], optional): Sections of videos. Default value
+                is ["snippet", "statistics"].
+            concurrency (int, optional): Maximum count of channels which
+                videos are requested simultaneously. Default value is 5.
+            buffer (int, optional): Maximum count of received and not
+                yielded videos. Default value is 500.
+            **kwargs: Parameters "max_videos", "dedup", "as_models" and
+                parameters of api methods, for example "retry".
+
+        """
+        return channel_videos(self, channel_id, key=key, part=part,
+                              concurrency=concurrency, buffer=buffer,
+                              **kwargs)
+
+    def sync_search(self, store: BaseCheckpointStore, name: str,
+                    **kwargs) -> AsyncIterator[dict]:
+        """Iterating over new results of api method "search" since
+        previous run of query, run is continued from checkpoint of query.
+
+        Args:
+            store (BaseCheckpointStore): Store of checkpoints.
+            name (str): Name of query in store, checkpoint must be used
+                only with the same parameters.
+            **kwargs: Parameters of api method "search" and "as_models".
+
+        """
+        return sync_search(self, store, name, **kwargs)
+
+    def sync_playlist_items(self, store: BaseCheckpointStore, name: str,
+                            **kwargs) -> AsyncIterator[dict]:
+        """Iterating over items added into playlist since previous run of
+        query, run is continued from checkpoint of query.
+
+        Args:
+            store (BaseCheckpointStore): Store of checkpoints.
+            name (str): Name of query in store, checkpoint must be used
+                only with the same parameters.
+            **kwargs: Parameters of api method "playlistItems",
+                "stop_at_seen" and "as_models".
+
+        """
+        return sync_playlist_items(self, store, name, **kwargs)
+
+    def sharded_search(self, *, published_after: int, published_before: int,
+                       **kwargs) -> ShardedSearch:
+        """Runner of api method "search" over time range split into
+        windows, window which results exceed api cap is split further.
+        Results are deduplicated by id.
+
+        Args:
+            published_after (int): Start of time range in unixtime.
+            published_before (int): End of time range in unixtime.
+            **kwargs: Parameters "windows", "concurrency", "quota_budget",
+                "result_cap", "min_window", "dedup", "as_models" and
+                parameters of api method "search".
+
+        """
+        return ShardedSearch(self, published_after=published_after,
+                             published_before=published_before, **kwargs)
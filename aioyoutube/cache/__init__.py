@@ -0,0 +1,3 @@
+from .base import *
+from .memory import *
+from .sqlite import *
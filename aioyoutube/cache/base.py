@@ -0,0 +1,151 @@
+import asyncio
+import time
+from typing import Awaitable, Callable, Dict, Optional, Tuple
+from urllib.parse import urlencode
+
+__all__ = [
+    'BaseCache',
+]
+
+# Cached response, unixtime of its expiration and unixtime until which
+# expired response can be returned while it is refreshed.
+CacheEntry = Tuple[dict, float, float]
+
+
+class BaseCache:
+    """Base class of api responses caches.
+
+    Responses are cached by api method name and request parameters
+    except application key. Only responses without error are cached.
+    Backends implement methods "get", "set" and "clear".
+
+    Cached responses are shared between callers and mustn't be changed.
+    """
+
+    def __init__(self, ttl: float = 300, method_ttl: Dict[str, float] = None,
+                 stale_ttl: float = 0):
+        """
+        Args:
+            ttl (float, optional): Seconds of keeping response fresh.
+                Default value is 300.
+            method_ttl (Dict[str, float], optional): Seconds of keeping
+                response fresh by api method name, overrides "ttl". Zero
+                value disable caching of method responses.
+            stale_ttl (float, optional): Seconds after expiration, during
+                which expired response is returned and refreshed in
+                background (stale-while-revalidate). Default value is 0.
+
+        """
+        self._ttl = ttl
+        self._method_ttl = method_ttl or {}
+        self._stale_ttl = stale_ttl
+        self._refreshing = {}
+        self._stats = {
+            'hits': 0,
+            'stale_hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'refreshes': 0,
+            'refresh_errors': 0,
+        }
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} ttl={self._ttl}>'
+
+    @property
+    def stats(self) -> dict:
+        """Counters of fresh and stale hits, misses, evicted entries and
+        background refreshes."""
+        return dict(self._stats)
+
+    def ttl(self, method_name: str) -> float:
+        """Seconds of keeping api method response fresh."""
+        return self._method_ttl.get(method_name, self._ttl)
+
+    @staticmethod
+    def make_key(method_name: str, params: dict) -> str:
+        """Cache key of request, application key is excluded."""
+        return method_name + '?' + urlencode(sorted(
+            (name, value) for name, value in params.items() if name != 'key'
+        ))
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        """Getting cached entry, entries expired more then stale ttl ago
+        aren't returned."""
+        raise NotImplementedError
+
+    async def set(self, key: str, value: dict, expires_at: float,
+                  stale_until: float):
+        """Saving response into cache."""
+        raise NotImplementedError
+
+    async def clear(self):
+        """Removing all cached responses."""
+        raise NotImplementedError
+
+    async def cancel_refreshes(self):
+        """Cancelling background refreshes of expired responses and
+        waiting for their end."""
+        tasks = list(self._refreshing.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def fetch(self, method_name: str, params: dict,
+                    request: Callable[[str, dict], Awaitable[dict]]) -> dict:
+        """Getting response from cache or requesting and caching it.
+
+        Args:
+            method_name (str): Request method api name.
+            params (dict): Dict of request parameters.
+            request: Coroutine function sending request.
+
+        """
+        ttl = self.ttl(method_name)
+        if not ttl:
+            return await request(method_name, params)
+
+        key = self.make_key(method_name, params)
+        entry = await self.get(key)
+        if entry is not None:
+            value, expires_at, _ = entry
+            if time.time() < expires_at:
+                self._stats['hits'] += 1
+            else:
+                self._stats['stale_hits'] += 1
+                self._revalidate(key, method_name, params, request)
+            return value
+
+        self._stats['misses'] += 1
+        value = await request(method_name, params)
+        await self._save(key, ttl, value)
+        return value
+
+    async def _save(self, key: str, ttl: float, value: dict):
+        if isinstance(value, dict) and 'error' not in value:
+            now = time.time()
+            await self.set(key, value, now + ttl, now + ttl + self._stale_ttl)
+
+    def _revalidate(self, key: str, method_name: str, params: dict,
+                    request: Callable[[str, dict], Awaitable[dict]]):
+        """Refreshing expired response in background, only one refresh of
+        key at the same time."""
+        if key in self._refreshing:
+            return
+
+        async def refresh():
+            value = await request(method_name, params)
+            await self._save(key, self.ttl(method_name), value)
+
+        def done(task: asyncio.Task):
+            self._refreshing.pop(key, None)
+            if task.cancelled():
+                return
+            if task.exception() is not None:
+                self._stats['refresh_errors'] += 1
+            else:
+                self._stats['refreshes'] += 1
+
+        task = asyncio.ensure_future(refresh())
+        self._refreshing[key] = task
+        task.add_done_callback(done)
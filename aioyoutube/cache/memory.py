@@ -0,0 +1,93 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Dict, Optional
+
+from .base import BaseCache, CacheEntry
+
+__all__ = [
+    'MemoryCache',
+]
+
+
+class MemoryCache(BaseCache):
+    """In-process LRU cache of api responses bounded by count of entries
+    and, optionally, by size of responses."""
+
+    def __init__(self, ttl: float = 300, method_ttl: Dict[str, float] = None,
+                 stale_ttl: float = 0, max_entries: int = 10000,
+                 max_bytes: int = None):
+        """
+        Args:
+            ttl (float, optional): Seconds of keeping response fresh.
+                Default value is 300.
+            method_ttl (Dict[str, float], optional): Seconds of keeping
+                response fresh by api method name, overrides "ttl".
+            stale_ttl (float, optional): Seconds after expiration, during
+                which expired response is returned and refreshed in
+                background. Default value is 0.
+            max_entries (int, optional): Maximum count of cached responses.
+                Default value is 10000.
+            max_bytes (int, optional): Maximum summary size of cached
+                responses serialized into json. By default size isn't
+                limited and isn't counted.
+
+        """
+        super().__init__(ttl=ttl, method_ttl=method_ttl, stale_ttl=stale_ttl)
+        self._max_entries = max_entries
+        self._max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    @property
+    def size(self) -> int:
+        """Summary size of cached responses, counted only for cache with
+        "max_bytes"."""
+        return self._bytes
+
+    @property
+    def stats(self) -> dict:
+        return {**super().stats, 'entries': len(self), 'bytes': self._bytes}
+
+    def _remove(self, key: str):
+        *_, size = self._entries.pop(key)
+        self._bytes -= size
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        value, expires_at, stale_until, _ = entry
+        if time.time() >= stale_until:
+            self._remove(key)
+            return None
+
+        self._entries.move_to_end(key)
+        return value, expires_at, stale_until
+
+    async def set(self, key: str, value: dict, expires_at: float,
+                  stale_until: float):
+        size = 0
+        if self._max_bytes is not None:
+            size = len(json.dumps(value, ensure_ascii=False).encode())
+            if size > self._max_bytes:
+                return
+
+        if key in self._entries:
+            self._remove(key)
+        self._entries[key] = (value, expires_at, stale_until, size)
+        self._bytes += size
+
+        while len(self._entries) > self._max_entries or \
+                (self._max_bytes is not None and
+                 self._bytes > self._max_bytes):
+            self._remove(next(iter(self._entries)))
+            self._stats['evictions'] += 1
+
+    async def clear(self):
+        self._entries.clear()
+        self._bytes = 0
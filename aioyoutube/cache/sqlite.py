@@ -0,0 +1,197 @@
+import asyncio
+import json
+import sqlite3
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .base import BaseCache, CacheEntry
+
+__all__ = [
+    'SqliteCache',
+]
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS responses ('
+    ' key TEXT PRIMARY KEY,'
+    ' value BLOB NOT NULL,'
+    ' expires_at REAL NOT NULL,'
+    ' stale_until REAL NOT NULL,'
+    ' accessed_at REAL NOT NULL,'
+    ' size INTEGER NOT NULL)',
+    'CREATE INDEX IF NOT EXISTS responses_accessed_at '
+    'ON responses (accessed_at)',
+    'CREATE INDEX IF NOT EXISTS responses_stale_until '
+    'ON responses (stale_until)',
+)
+
+
+class SqliteCache(BaseCache):
+    """On-disk cache of api responses in SQLite database, shared by many
+    processes.
+
+    Database works in WAL mode, so processes read it concurrently with
+    writing. Responses are stored compressed by zlib. When summary size
+    of stored responses exceeds "max_bytes", least recently used responses
+    are removed. Queries are executed in separate thread and don't block
+    event loop.
+    """
+    # Count of saved responses between checks of database size.
+    _EVICT_EVERY = 64
+    # Seconds of accuracy of response last access time.
+    _ACCESS_ACCURACY = 60
+
+    def __init__(self, path: str, ttl: float = 300,
+                 method_ttl: Dict[str, float] = None, stale_ttl: float = 0,
+                 max_bytes: int = 256 * 1024 * 1024,
+                 compress_level: int = 6, timeout: float = 30):
+        """
+        Args:
+            path (str): Path of database file.
+            ttl (float, optional): Seconds of keeping response fresh.
+                Default value is 300.
+            method_ttl (Dict[str, float], optional): Seconds of keeping
+                response fresh by api method name, overrides "ttl".
+            stale_ttl (float, optional): Seconds after expiration, during
+                which expired response is returned and refreshed in
+                background. Default value is 0.
+            max_bytes (int, optional): Maximum summary size of compressed
+                responses. Default value is 256 MiB.
+            compress_level (int, optional): Zlib compression level.
+                Default value is 6.
+            timeout (float, optional): Seconds of waiting database lock
+                held by other process. Default value is 30.
+
+        """
+        super().__init__(ttl=ttl, method_ttl=method_ttl, stale_ttl=stale_ttl)
+        self._path = path
+        self._max_bytes = max_bytes
+        self._compress_level = compress_level
+        self._timeout = timeout
+        self._conn = None
+        self._saved = 0
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='aioyoutube-cache'
+        )
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=NORMAL')
+            for query in _SCHEMA:
+                conn.execute(query)
+            self._conn = conn
+        return self._conn
+
+    async def _execute(self, function, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _get(self, key: str) -> Optional[CacheEntry]:
+        conn = self._connect()
+        row = conn.execute(
+            'SELECT value, expires_at, stale_until, accessed_at '
+            'FROM responses WHERE key = ?', (key,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        value, expires_at, stale_until, accessed_at = row
+        now = time.time()
+        if now >= stale_until:
+            conn.execute(
+                'DELETE FROM responses WHERE key = ? AND stale_until <= ?',
+                (key, now),
+            )
+            return None
+        if now - accessed_at >= self._ACCESS_ACCURACY:
+            conn.execute(
+                'UPDATE responses SET accessed_at = ? WHERE key = ?',
+                (now, key),
+            )
+
+        return json.loads(zlib.decompress(value)), expires_at, stale_until
+
+    def _set(self, key: str, value: dict, expires_at: float,
+             stale_until: float):
+        data = zlib.compress(
+            json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+            .encode(),
+            self._compress_level,
+        )
+        if len(data) > self._max_bytes:
+            return
+
+        conn = self._connect()
+        conn.execute(
+            'INSERT OR REPLACE INTO responses '
+            '(key, value, expires_at, stale_until, accessed_at, size) '
+            'VALUES (?, ?, ?, ?, ?, ?)',
+            (key, data, expires_at, stale_until, time.time(), len(data)),
+        )
+
+        self._saved += 1
+        if self._saved % self._EVICT_EVERY == 0:
+            self._evict()
+
+    def _evict(self):
+        """Removing expired responses and least recently used responses
+        exceeded size limit."""
+        conn = self._connect()
+        conn.execute(
+            'DELETE FROM responses WHERE stale_until <= ?', (time.time(),)
+        )
+        total, = conn.execute(
+            'SELECT COALESCE(SUM(size), 0) FROM responses'
+        ).fetchone()
+        excess = total - self._max_bytes
+        if excess <= 0:
+            return
+
+        keys = []
+        rows = conn.execute(
+            'SELECT key, size FROM responses ORDER BY accessed_at'
+        )
+        for key, size in rows:
+            keys.append((key,))
+            excess -= size
+            if excess <= 0:
+                break
+        conn.executemany('DELETE FROM responses WHERE key = ?', keys)
+        self._stats['evictions'] += len(keys)
+
+    def _clear(self):
+        self._connect().execute('DELETE FROM responses')
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def get(self, key: str) -> Optional[CacheEntry]:
+        return await self._execute(self._get, key)
+
+    async def set(self, key: str, value: dict, expires_at: float,
+                  stale_until: float):
+        await self._execute(self._set, key, value, expires_at, stale_until)
+
+    async def evict(self):
+        """Removing expired responses and responses exceeded size limit
+        without waiting periodical check."""
+        await self._execute(self._evict)
+
+    async def clear(self):
+        await self._execute(self._clear)
+
+    async def close(self):
+        """Closing database connection."""
+        await self._execute(self._close)
+        self._executor.shutdown(wait=False)
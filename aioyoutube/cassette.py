@@ -0,0 +1,218 @@
+import asyncio
+import base64
+import json
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional
+
+from aioyoutube.cache import BaseCache
+from aioyoutube.exeptions import UnknownCassetteRequest, VariableValueError
+from aioyoutube.pipeline import Handler, Request, Response
+
+__all__ = [
+    'Cassette',
+]
+
+MODES = ('record', 'replay')
+# Response headers kept in cassette, others aren't used by api.
+_HEADERS = ('Content-Type', 'Retry-After')
+
+
+class _Episode:
+    """Recorded response of one request."""
+    __slots__ = ('status', 'headers', 'body', 'elapsed')
+
+    def __init__(self, status: int, headers: Dict[str, str], body: bytes,
+                 elapsed: float):
+        self.status = status
+        self.headers = headers
+        self.body = body
+        self.elapsed = elapsed
+
+
+class Cassette:
+    """File of recorded api responses for deterministic replay.
+
+    In record mode requests are sent to api and responses, including
+    error responses, are appended into cassette. In replay mode responses
+    are served from cassette without network. Requests are matched by api
+    method name and parameters except application key, so keys aren't
+    stored. Responses of repeated request are replayed in recorded order,
+    the last one is repeated after that.
+
+    Cassette is json lines file, bodies are compressed by zlib. File is
+    read and written in separate thread.
+    """
+    __slots__ = ('_path', '_mode', '_strict', '_latency', '_real_latency',
+                 '_compress_level', '_episodes', '_positions', '_file',
+                 '_loading', '_executor', '_stats')
+
+    def __init__(self, path: str, mode: str = 'replay', strict: bool = True,
+                 latency: float = 0., real_latency: bool = False,
+                 compress_level: int = 6):
+        """
+        Args:
+            path (str): Path of cassette file.
+            mode (str, optional): "record" appends responses of api into
+                cassette, "replay" serves responses from cassette. Default
+                value is "replay".
+            strict (bool, optional): Replayed request which isn't
+                recorded raises UnknownCassetteRequest. Lenient cassette
+                sends such request to api and records its response.
+                Default value is True.
+            latency (float, optional): Seconds of delay of replayed
+                response. Default value is 0.
+            real_latency (bool, optional): Delay replayed response by
+                recorded duration of request, "latency" is added to it.
+                Default value is False.
+            compress_level (int, optional): Zlib level of recorded bodies.
+                Default value is 6.
+
+        """
+        if mode not in MODES:
+            raise VariableValueError(
+                f'Argument "mode" must be one of {MODES}, current value is '
+                f'{mode}.'
+            )
+        self._path = path
+        self._mode = mode
+        self._strict = strict
+        self._latency = latency
+        self._real_latency = real_latency
+        self._compress_level = compress_level
+        self._episodes: Optional[Dict[str, List[_Episode]]] = None
+        self._positions: Dict[str, int] = {}
+        self._file = None
+        self._loading = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='aioyoutube-cassette'
+        )
+        self._stats = {
+            'recorded': 0,
+            'replayed': 0,
+            'unknown': 0,
+        }
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path} ' \
+               f'mode={self._mode}>'
+
+    @property
+    def mode(self) -> str:
+        return self._mode
+
+    @property
+    def stats(self) -> dict:
+        """Counters of recorded responses, replayed responses and replayed
+        requests missed in cassette."""
+        return dict(self._stats)
+
+    async def _execute(self, function, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _read(self) -> Dict[str, List[_Episode]]:
+        episodes = {}
+        try:
+            with open(self._path, encoding='utf-8') as file:
+                for line in file:
+                    if not line.strip():
+                        continue
+                    data = json.loads(line)
+                    episodes.setdefault(data['key'], []).append(_Episode(
+                        data['status'], data['headers'],
+                        zlib.decompress(base64.b64decode(data['body'])),
+                        data['elapsed'],
+                    ))
+        except FileNotFoundError:
+            pass
+        return episodes
+
+    def _append(self, line: str):
+        if self._file is None:
+            self._file = open(self._path, 'a', encoding='utf-8')
+        self._file.write(line)
+        self._file.flush()
+
+    async def _loaded(self) -> Dict[str, List[_Episode]]:
+        if self._episodes is None:
+            if self._loading is None:
+                self._loading = asyncio.ensure_future(self._execute(self._read))
+            episodes = await self._loading
+            if self._episodes is None:
+                self._episodes = episodes
+        return self._episodes
+
+    async def play(self, request: Request, send: Handler) -> Response:
+        """Getting response of request from cassette or from api with
+        recording it.
+
+        Args:
+            request (Request): Request of api method.
+            send (Handler): Function sending request to api.
+
+        """
+        key = BaseCache.make_key(request.method, request.params)
+        if self._mode == 'replay':
+            episodes = (await self._loaded()).get(key)
+            if episodes:
+                return await self._replay(key, episodes)
+            self._stats['unknown'] += 1
+            if self._strict:
+                raise UnknownCassetteRequest(
+                    f'Request {key} is not recorded in cassette '
+                    f'{self._path}.'
+                )
+        return await self._record(key, request, send)
+
+    async def _replay(self, key: str, episodes: List[_Episode]) -> Response:
+        position = self._positions.get(key, 0)
+        self._positions[key] = position + 1
+        episode = episodes[min(position, len(episodes) - 1)]
+
+        delay = self._latency
+        if self._real_latency:
+            delay += episode.elapsed
+        if delay:
+            await asyncio.sleep(delay)
+        self._stats['replayed'] += 1
+        return Response(episode.status, dict(episode.headers), episode.body)
+
+    async def _record(self, key: str, request: Request,
+                      send: Handler) -> Response:
+        started = time.monotonic()
+        response = await send(request)
+        elapsed = time.monotonic() - started
+
+        headers = {
+            name: response.headers[name]
+            for name in _HEADERS if name in response.headers
+        }
+        body = response.body or b''
+        line = json.dumps({
+            'key': key,
+            'status': response.status,
+            'headers': headers,
+            'body': base64.b64encode(
+                zlib.compress(body, self._compress_level)
+            ).decode(),
+            'elapsed': round(elapsed, 6),
+        }) + '\n'
+        await self._execute(self._append, line)
+        if self._episodes is not None:
+            self._episodes.setdefault(key, []).append(
+                _Episode(response.status, headers, body, elapsed)
+            )
+        self._stats['recorded'] += 1
+        return response
+
+    async def close(self):
+        """Closing cassette file."""
+        def close():
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+        await self._execute(close)
+        self._executor.shutdown(wait=True)
@@ -0,0 +1,3 @@
+from .base import *
+from .file import *
+from .sqlite import *
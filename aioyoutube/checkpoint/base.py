@@ -0,0 +1,121 @@
+from typing import Iterable, Optional
+
+__all__ = [
+    'Checkpoint',
+    'BaseCheckpointStore',
+]
+
+
+class Checkpoint:
+    """Cursor of incremental iteration over api query results.
+
+    Committed state is high-water publication time of items and ids of
+    items published at that time, items not newer then it are treated as
+    already seen. State of unfinished run is token of current page, count
+    of its processed items, latest publication time and its ids among
+    items of run, it becomes committed when run is finished.
+    """
+    __slots__ = ('page_token', 'page_offset', 'published_at', 'seen_ids',
+                 'run_published_at', 'run_ids')
+
+    def __init__(self, page_token: str = None, published_at: float = None,
+                 seen_ids: Iterable[str] = (),
+                 run_published_at: float = None,
+                 run_ids: Iterable[str] = (), page_offset: int = 0):
+        """
+        Args:
+            page_token (str, optional): Token of current page of
+                unfinished run.
+            published_at (float, optional): High-water publication time
+                of seen items in unixtime.
+            seen_ids (Iterable[str], optional): Ids of seen items
+                published at high-water time.
+            run_published_at (float, optional): Latest publication time of
+                items of unfinished run in unixtime.
+            run_ids (Iterable[str], optional): Ids of items of unfinished
+                run published at its latest publication time.
+            page_offset (int, optional): Count of processed items of
+                current page of unfinished run. Default value is 0.
+
+        """
+        self.page_token = page_token
+        self.page_offset = page_offset
+        self.published_at = published_at
+        self.seen_ids = set(seen_ids)
+        self.run_published_at = run_published_at
+        self.run_ids = set(run_ids)
+
+    def __repr__(self):
+        return (
+            f'<class {self.__class__.__name__} '
+            f'published_at={self.published_at} '
+            f'page_token={self.page_token}>'
+        )
+
+    def is_new(self, item_id: str, published_at: float) -> bool:
+        """Checking that item wasn't seen by previous runs."""
+        if self.published_at is None or published_at > self.published_at:
+            return True
+        return published_at == self.published_at and \
+            item_id not in self.seen_ids
+
+    def observe(self, item_id: str, published_at: float):
+        """Remembering item of current run."""
+        if self.run_published_at is None or \
+                published_at > self.run_published_at:
+            self.run_published_at = published_at
+            self.run_ids = {item_id}
+        elif published_at == self.run_published_at:
+            self.run_ids.add(item_id)
+
+    def finish(self):
+        """Committing state of finished run."""
+        run_published_at = self.run_published_at
+        if run_published_at is not None:
+            if self.published_at is None or \
+                    run_published_at > self.published_at:
+                self.published_at = run_published_at
+                self.seen_ids = self.run_ids
+            elif run_published_at == self.published_at:
+                self.seen_ids |= self.run_ids
+        self.page_token = None
+        self.page_offset = 0
+        self.run_published_at = None
+        self.run_ids = set()
+
+    def to_dict(self) -> dict:
+        return {
+            'page_token': self.page_token,
+            'page_offset': self.page_offset,
+            'published_at': self.published_at,
+            'seen_ids': sorted(self.seen_ids),
+            'run_published_at': self.run_published_at,
+            'run_ids': sorted(self.run_ids),
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'Checkpoint':
+        return cls(**data)
+
+
+class BaseCheckpointStore:
+    """Base class of checkpoints stores.
+
+    Checkpoints are stored by name of query, chosen by caller. Backends
+    implement methods "load", "save" and "delete".
+    """
+
+    async def load(self, name: str) -> Optional[Checkpoint]:
+        """Getting checkpoint of query, None for unknown query."""
+        raise NotImplementedError
+
+    async def save(self, name: str, checkpoint: Checkpoint):
+        """Saving checkpoint of query."""
+        raise NotImplementedError
+
+    async def delete(self, name: str):
+        """Removing checkpoint of query."""
+        raise NotImplementedError
+
+    async def close(self):
+        """Releasing store resources."""
@@ -0,0 +1,79 @@
+import asyncio
+import json
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Optional
+
+from .base import BaseCheckpointStore, Checkpoint
+
+__all__ = [
+    'FileCheckpointStore',
+]
+
+
+class FileCheckpointStore(BaseCheckpointStore):
+    """Checkpoints stored in one json file of single process.
+
+    File is read on first access and rewritten atomically on every save
+    in separate thread.
+    """
+
+    def __init__(self, path: str):
+        """
+        Args:
+            path (str): Path of json file.
+
+        """
+        self._path = path
+        self._data: Optional[Dict[str, dict]] = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='aioyoutube-checkpoint'
+        )
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    async def _execute(self, function, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _read(self) -> Dict[str, dict]:
+        try:
+            with open(self._path, encoding='utf-8') as file:
+                return json.load(file)
+        except FileNotFoundError:
+            return {}
+
+    def _write(self, data: Dict[str, dict]):
+        temp_path = self._path + '.tmp'
+        with open(temp_path, 'w', encoding='utf-8') as file:
+            json.dump(data, file, ensure_ascii=False)
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temp_path, self._path)
+
+    async def _loaded(self) -> Dict[str, dict]:
+        if self._data is None:
+            self._data = await self._execute(self._read)
+        return self._data
+
+    async def load(self, name: str) -> Optional[Checkpoint]:
+        data = (await self._loaded()).get(name)
+        return Checkpoint.from_dict(data) if data is not None else None
+
+    async def save(self, name: str, checkpoint: Checkpoint):
+        data = await self._loaded()
+        data[name] = checkpoint.to_dict()
+        await self._execute(self._write, dict(data))
+
+    async def delete(self, name: str):
+        data = await self._loaded()
+        if data.pop(name, None) is not None:
+            await self._execute(self._write, dict(data))
+
+    async def close(self):
+        """Waiting for started writes and stopping writer thread."""
+        # Calls run in order in one thread, so all writes are finished
+        # after empty call and shutdown doesn't block event loop.
+        await self._execute(lambda: None)
+        self._executor.shutdown(wait=False)
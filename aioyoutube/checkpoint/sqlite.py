@@ -0,0 +1,100 @@
+import asyncio
+import json
+import sqlite3
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional
+
+from .base import BaseCheckpointStore, Checkpoint
+
+__all__ = [
+    'SqliteCheckpointStore',
+]
+
+_SCHEMA = (
+    'CREATE TABLE IF NOT EXISTS checkpoints ('
+    ' name TEXT PRIMARY KEY,'
+    ' value TEXT NOT NULL,'
+    ' updated_at REAL NOT NULL)',
+)
+
+
+class SqliteCheckpointStore(BaseCheckpointStore):
+    """Checkpoints stored in SQLite database, shared by many processes.
+
+    Database works in WAL mode, queries are executed in separate thread
+    and don't block event loop.
+    """
+
+    def __init__(self, path: str, timeout: float = 30):
+        """
+        Args:
+            path (str): Path of database file.
+            timeout (float, optional): Seconds of waiting database lock
+                held by other process. Default value is 30.
+
+        """
+        self._path = path
+        self._timeout = timeout
+        self._conn = None
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='aioyoutube-checkpoint'
+        )
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(
+                self._path, timeout=self._timeout, isolation_level=None,
+                check_same_thread=False,
+            )
+            conn.execute('PRAGMA journal_mode=WAL')
+            for query in _SCHEMA:
+                conn.execute(query)
+            self._conn = conn
+        return self._conn
+
+    async def _execute(self, function, *args):
+        loop = asyncio.get_event_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _load(self, name: str) -> Optional[Checkpoint]:
+        row = self._connect().execute(
+            'SELECT value FROM checkpoints WHERE name = ?', (name,)
+        ).fetchone()
+        if row is None:
+            return None
+        return Checkpoint.from_dict(json.loads(row[0]))
+
+    def _save(self, name: str, value: str):
+        self._connect().execute(
+            'INSERT OR REPLACE INTO checkpoints (name, value, updated_at) '
+            'VALUES (?, ?, ?)', (name, value, time.time()),
+        )
+
+    def _delete(self, name: str):
+        self._connect().execute(
+            'DELETE FROM checkpoints WHERE name = ?', (name,)
+        )
+
+    def _close(self):
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+    async def load(self, name: str) -> Optional[Checkpoint]:
+        return await self._execute(self._load, name)
+
+    async def save(self, name: str, checkpoint: Checkpoint):
+        value = json.dumps(checkpoint.to_dict(), ensure_ascii=False)
+        await self._execute(self._save, name, value)
+
+    async def delete(self, name: str):
+        await self._execute(self._delete, name)
+
+    async def close(self):
+        """Closing database connection."""
+        await self._execute(self._close)
+        self._executor.shutdown(wait=False)
@@ -0,0 +1,374 @@
+import math
+import os
+import sqlite3
+import sys
+import tempfile
+from hashlib import blake2b
+from typing import Iterable, Optional, Union
+
+from aioyoutube.exeptions import VariableValueError
+from aioyoutube.models import Model
+
+__all__ = [
+    'BaseIdSet',
+    'CompactIdSet',
+    'BloomIdFilter',
+    'SpillingIdSet',
+    'item_id',
+]
+
+
+def item_id(item: Union[dict, Model]) -> Optional[str]:
+    """Id of api item or model, id of search result is id of found
+    resource."""
+    if isinstance(item, Model):
+        item = item._data
+    value = item.get('id')
+    if isinstance(value, dict):
+        return value.get('videoId') or value.get('channelId') or \
+            value.get('playlistId')
+    return value
+
+
+class BaseIdSet:
+    """Base class of sets of seen item ids used for deduplication.
+
+    Every check is counted, hit is check of id which was seen before.
+    Backends implement methods "_seen", "__len__" and property
+    "memory_bytes".
+    """
+    __slots__ = ('_checks', '_hits')
+
+    def __init__(self):
+        self._checks = 0
+        self._hits = 0
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} size={len(self)}>'
+
+    def __len__(self):
+        raise NotImplementedError
+
+    @property
+    def memory_bytes(self) -> int:
+        """Approximate count of bytes of memory used by set."""
+        raise NotImplementedError
+
+    @property
+    def stats(self) -> dict:
+        """Count of ids, checks, hits, hit rate and memory usage."""
+        return {
+            'size': len(self),
+            'checks': self._checks,
+            'hits': self._hits,
+            'hit_rate': self._hits / self._checks if self._checks else 0.,
+            'memory_bytes': self.memory_bytes,
+        }
+
+    def seen(self, item_id: str) -> bool:
+        """Adding id into set, True when id was added before."""
+        self._checks += 1
+        if self._seen(item_id):
+            self._hits += 1
+            return True
+        return False
+
+    def update(self, item_ids: Iterable[str]):
+        for value in item_ids:
+            self._seen(value)
+
+    def close(self):
+        """Releasing set resources."""
+
+    def _seen(self, item_id: str) -> bool:
+        raise NotImplementedError
+
+
+class CompactIdSet(BaseIdSet):
+    """Exact set of ids stored as fixed-width hashes in one bytearray.
+
+    Ids are hashed by blake2b into "width" bytes and kept in open
+    addressing table, which takes about "width" / 0.5 bytes per id
+    instead of hundred bytes of python string in set. Hashes of 16
+    bytes make collision of different ids practically impossible.
+    """
+    __slots__ = ('_width', '_table', '_slots', '_size', '_empty')
+    # Maximum share of filled table slots, table is doubled after it.
+    _LOAD = 0.7
+
+    def __init__(self, width: int = 16, capacity: int = 1024):
+        """
+        Args:
+            width (int, optional): Bytes of id hash, from 8 to 64.
+                Default value is 16.
+            capacity (int, optional): Initial count of ids without table
+                growth. Default value is 1024.
+
+        """
+        if not 8 <= width <= 64:
+            raise VariableValueError(
+                f'Argument "width" must be in range from 8 to 64, current '
+                f'value is {width}.'
+            )
+        super().__init__()
+        self._width = width
+        self._empty = bytes(width)
+        self._slots = 1 << max(3, math.ceil(math.log2(capacity / self._LOAD)))
+        self._table = bytearray(self._slots * width)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item_id: str):
+        return self._find(self._digest(item_id))[1]
+
+    @property
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._table)
+
+    def clear(self):
+        self._slots = 8
+        self._table = bytearray(self._slots * self._width)
+        self._size = 0
+
+    def digests(self) -> Iterable[bytes]:
+        """Hashes of all ids of set."""
+        table, width, empty = self._table, self._width, self._empty
+        for start in range(0, len(table), width):
+            digest = bytes(table[start:start + width])
+            if digest != empty:
+                yield digest
+
+    def _digest(self, item_id: str) -> bytes:
+        digest = blake2b(item_id.encode(), digest_size=self._width).digest()
+        # Zero hash marks empty slot.
+        return digest if digest != self._empty else b'\1' + digest[1:]
+
+    def _find(self, digest: bytes):
+        """Offset of slot of hash and flag that hash is in slot."""
+        table, width, empty = self._table, self._width, self._empty
+        mask = self._slots - 1
+        index = int.from_bytes(digest[:8], 'little') & mask
+        while True:
+            start = index * width
+            slot = table[start:start + width]
+            if slot == digest:
+                return start, True
+            if slot == empty:
+                return start, False
+            index = (index + 1) & mask
+
+    def _insert(self, digest: bytes) -> bool:
+        start, found = self._find(digest)
+        if found:
+            return True
+        self._table[start:start + self._width] = digest
+        self._size += 1
+        if self._size > self._slots * self._LOAD:
+            self._grow()
+        return False
+
+    def _grow(self):
+        digests = list(self.digests())
+        self._slots *= 2
+        self._table = bytearray(self._slots * self._width)
+        for digest in digests:
+            start, _ = self._find(digest)
+            self._table[start:start + self._width] = digest
+
+    def _seen(self, item_id: str) -> bool:
+        return self._insert(self._digest(item_id))
+
+
+class BloomIdFilter(BaseIdSet):
+    """Probabilistic set of ids with fixed memory usage.
+
+    New id can be reported as seen with "error_rate" probability, while
+    count of ids doesn't exceed "capacity". Seen id is never reported as
+    new.
+    """
+    __slots__ = ('_capacity', '_error_rate', '_bits', '_bit_count',
+                 '_hashes', '_size')
+
+    def __init__(self, capacity: int = 1000000, error_rate: float = 0.001):
+        """
+        Args:
+            capacity (int, optional): Expected count of ids. Default value
+                is 1000000.
+            error_rate (float, optional): Probability of false positive
+                check. Default value is 0.001.
+
+        """
+        if not 0 < error_rate < 1:
+            raise VariableValueError(
+                f'Argument "error_rate" must be in range from 0 to 1, '
+                f'current value is {error_rate}.'
+            )
+        super().__init__()
+        self._capacity = capacity
+        self._error_rate = error_rate
+        self._bit_count = max(8, math.ceil(
+            -capacity * math.log(error_rate) / math.log(2) ** 2
+        ))
+        self._hashes = max(
+            1, round(self._bit_count / capacity * math.log(2))
+        )
+        self._bits = bytearray((self._bit_count + 7) // 8)
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def __contains__(self, item_id: str):
+        bits = self._bits
+        return all(
+            bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item_id)
+        )
+
+    @property
+    def memory_bytes(self) -> int:
+        return sys.getsizeof(self._bits)
+
+    @property
+    def stats(self) -> dict:
+        """Count of ids, checks, hits, hit rate, memory usage and
+        estimated false positive rate for current count of ids."""
+        stats = super().stats
+        stats['error_rate'] = (
+            1 - math.exp(-self._hashes * self._size / self._bit_count)
+        ) ** self._hashes
+        return stats
+
+    def _positions(self, item_id: str):
+        digest = blake2b(item_id.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], 'little')
+        second = int.from_bytes(digest[8:], 'little') | 1
+        count = self._bit_count
+        return [(first + i * second) % count for i in range(self._hashes)]
+
+    def _seen(self, item_id: str) -> bool:
+        bits = self._bits
+        found = True
+        for position in self._positions(item_id):
+            byte, mask = position >> 3, 1 << (position & 7)
+            if not bits[byte] & mask:
+                found = False
+                bits[byte] |= mask
+        if not found:
+            self._size += 1
+        return found
+
+
+class SpillingIdSet(BaseIdSet):
+    """Exact set of ids kept in memory until memory cap, then moved into
+    SQLite database on disk.
+
+    Ids are kept as hashes like in CompactIdSet. Checks of new ids after
+    spill read database, which is slower then memory lookup but keeps
+    memory usage flat.
+    """
+    __slots__ = ('_memory', '_max_bytes', '_path', '_own_path', '_conn',
+                 '_disk_size', '_spills')
+
+    def __init__(self, max_bytes: int = 64 * 1024 * 1024, path: str = None,
+                 width: int = 16):
+        """
+        Args:
+            max_bytes (int, optional): Memory usage, after which ids are
+                moved to disk. Default value is 64 MiB.
+            path (str, optional): Path of database file. By default
+                temporary file is created and removed on close.
+            width (int, optional): Bytes of id hash. Default value is 16.
+
+        """
+        super().__init__()
+        self._memory = CompactIdSet(width=width)
+        self._max_bytes = max_bytes
+        self._own_path = path is None
+        if path is None:
+            descriptor, path = tempfile.mkstemp(
+                prefix='aioyoutube-dedup-', suffix='.db'
+            )
+            os.close(descriptor)
+        self._path = path
+        self._conn = None
+        self._disk_size = 0
+        self._spills = 0
+
+    def __len__(self):
+        return len(self._memory) + self._disk_size
+
+    def __contains__(self, item_id: str):
+        digest = self._memory._digest(item_id)
+        return self._memory._find(digest)[1] or self._on_disk(digest)
+
+    @property
+    def memory_bytes(self) -> int:
+        return self._memory.memory_bytes
+
+    @property
+    def stats(self) -> dict:
+        """Count of ids, checks, hits, hit rate, memory usage, count of
+        ids on disk and count of spills."""
+        stats = super().stats
+        stats['disk_size'] = self._disk_size
+        stats['spills'] = self._spills
+        return stats
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self._path, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('PRAGMA synchronous=OFF')
+            conn.execute(
+                'CREATE TABLE IF NOT EXISTS ids (digest BLOB PRIMARY KEY) '
+                'WITHOUT ROWID'
+            )
+            self._disk_size, = conn.execute(
+                'SELECT COUNT(*) FROM ids'
+            ).fetchone()
+            self._conn = conn
+        return self._conn
+
+    def _on_disk(self, digest: bytes) -> bool:
+        if not self._disk_size and self._conn is None and self._own_path:
+            return False
+        return self._connect().execute(
+            'SELECT 1 FROM ids WHERE digest = ?', (digest,)
+        ).fetchone() is not None
+
+    def _spill(self):
+        conn = self._connect()
+        conn.execute('BEGIN')
+        conn.executemany(
+            'INSERT OR IGNORE INTO ids (digest) VALUES (?)',
+            ((digest,) for digest in self._memory.digests()),
+        )
+        conn.execute('COMMIT')
+        self._disk_size, = conn.execute('SELECT COUNT(*) FROM ids').fetchone()
+        self._memory.clear()
+        self._spills += 1
+
+    def _seen(self, item_id: str) -> bool:
+        memory = self._memory
+        digest = memory._digest(item_id)
+        if memory._find(digest)[1] or self._on_disk(digest):
+            return True
+        memory._insert(digest)
+        if memory.memory_bytes > self._max_bytes:
+            self._spill()
+        return False
+
+    def close(self):
+        """Closing database connection, temporary database is removed."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+        if self._own_path:
+            for suffix in ('', '-wal', '-shm'):
+                try:
+                    os.remove(self._path + suffix)
+                except FileNotFoundError:
+                    pass
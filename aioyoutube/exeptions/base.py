@@ -1,10 +1,14 @@
 class YoutubeApiError(Exception):
     """Base class for youtube api exceptions"""
+    # Request raised retryable exception can succeed if it will be repeated.
+    retryable = False
 
-    def __init__(self, mess: str, code: int = None, json: dict = None):
+    def __init__(self, mess: str, code: int = None, json: dict = None,
+                 retry_after: float = None):
         self._mess = mess
         self._code = code
         self._json = json
+        self._retry_after = retry_after
 
     def __repr__(self):
         return f'{self.__class__.__name__} code={self.code} mess={self.mess}'
@@ -23,3 +27,9 @@ class YoutubeApiError(Exception):
     @property
     def json(self) -> dict:
         return self._json
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds to wait before repeating request, if api passed it
+        in "Retry-After" header."""
+        return self._retry_after
@@ -60,7 +60,7 @@ class WrongApiName(YoutubeApiError):
 class ProcessingFailure(YoutubeApiError):
     """Exception raises when api can't process request. Try repeat this
      request after some time later, if this error was raised."""
-    pass
+    retryable = True
 
 
 class InvalidParameterValue(RequestValidationError):
@@ -77,3 +77,9 @@ class InvalidUserName(InvalidParameterValue):
 class NoAuthorized(RequestValidationError):
     """Exception raises when request required OAuth2 authorization."""
     pass
+
+
+class UnknownCassetteRequest(YoutubeApiError):
+    """Exception raises when replayed request isn't recorded in strict
+    cassette."""
+    pass
@@ -6,6 +6,16 @@ class ResponseApiError(YoutubeApiError):
     pass
 
 
+class ServerError(ResponseApiError):
+    """Exception raises when api server failed with 5xx status."""
+    retryable = True
+
+
+class RateLimitExceeded(ResponseApiError):
+    """Exception raises when too many requests was sent in short time."""
+    retryable = True
+
+
 class ForbiddenError(ResponseApiError):
     """Exception raises when api work only for app with OAuth2.0
     authentication."""
@@ -0,0 +1,4 @@
+from .base import *
+from .csv import *
+from .ndjson import *
+from .parquet import *
@@ -0,0 +1,142 @@
+import asyncio
+import json
+from concurrent.futures import ThreadPoolExecutor
+from typing import AsyncIterable, Dict, Iterable, List, Tuple, Union
+
+from aioyoutube.exeptions import VariableValueError
+from aioyoutube.models import Field, Model
+
+__all__ = [
+    'BaseSink',
+]
+
+Columns = Union[Iterable[str], Dict[str, str]]
+
+
+def _projection(columns: Columns) -> List[Tuple[str, Field]]:
+    """Column names with fields reading values by dotted paths."""
+    if columns is None:
+        raise VariableValueError('Argument "columns" must be passed.')
+    if isinstance(columns, dict):
+        pairs = list(columns.items())
+    else:
+        pairs = [(path, path) for path in columns]
+    if not pairs:
+        raise VariableValueError('Argument "columns" must not be empty.')
+    return [(name, Field(path)) for name, path in pairs]
+
+
+def _scalar(value):
+    """Column value, nested objects are encoded into json."""
+    if isinstance(value, (dict, list)):
+        return json.dumps(value, ensure_ascii=False)
+    return value
+
+
+class BaseSink:
+    """Base class of export sinks of api items.
+
+    Items are collected into batches, batch is written in separate thread
+    while next batch is collected. Writing waits for previous batch, so
+    not more then two batches are kept in memory. Backends implement
+    methods "_write_batch" and "_close", both are called in sink thread.
+
+    Usage:
+        async with NdjsonSink('comments.ndjson', batch_size=500) as sink:
+            await sink.consume(api.crawl_comments('video id'))
+    """
+
+    def __init__(self, batch_size: int = 1000):
+        """
+        Args:
+            batch_size (int, optional): Count of items written by one
+                batch. Default value is 1000.
+
+        """
+        if batch_size < 1:
+            raise VariableValueError('Argument "batch_size" must be positive.')
+        self._batch_size = batch_size
+        self._batch = []
+        self._pending = None
+        self._items = 0
+        self._batches = 0
+        self._closed = False
+        self._executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix='aioyoutube-export'
+        )
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def stats(self) -> dict:
+        """Count of written items and batches, items of current batch."""
+        return {
+            'items': self._items,
+            'batches': self._batches,
+            'buffered': len(self._batch),
+        }
+
+    async def write(self, item: Union[dict, Model]):
+        """Adding item into batch, full batch is written."""
+        if self._closed:
+            raise VariableValueError('Sink is closed.')
+        self._batch.append(item.to_dict() if isinstance(item, Model)
+                           else item)
+        if len(self._batch) >= self._batch_size:
+            await self.flush()
+
+    async def consume(self, items: Union[AsyncIterable, Iterable]) -> int:
+        """Writing all items of iterator, returns count of items."""
+        count = 0
+        if hasattr(items, '__aiter__'):
+            async for item in items:
+                await self.write(item)
+                count += 1
+        else:
+            for item in items:
+                await self.write(item)
+                count += 1
+        return count
+
+    async def flush(self):
+        """Starting writing of current batch after previous batch."""
+        await self._wait()
+        if not self._batch:
+            return
+        batch, self._batch = self._batch, []
+        loop = asyncio.get_event_loop()
+        self._pending = loop.run_in_executor(
+            self._executor, self._write_batch, batch
+        )
+        self._items += len(batch)
+        self._batches += 1
+
+    async def close(self):
+        """Writing buffered items and closing output."""
+        if self._closed:
+            return
+        try:
+            await self.flush()
+            await self._wait()
+        finally:
+            self._closed = True
+            loop = asyncio.get_event_loop()
+            try:
+                await loop.run_in_executor(self._executor, self._close)
+            finally:
+                self._executor.shutdown(wait=True)
+
+    async def _wait(self):
+        pending, self._pending = self._pending, None
+        if pending is not None:
+            await pending
+
+    def _write_batch(self, items: List[dict]):
+        raise NotImplementedError
+
+    def _close(self):
+        raise NotImplementedError
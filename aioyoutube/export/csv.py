@@ -0,0 +1,57 @@
+import csv
+from typing import List
+
+from .base import BaseSink, Columns, _projection, _scalar
+
+__all__ = [
+    'CsvSink',
+]
+
+
+class CsvSink(BaseSink):
+    """Sink writing items as rows of csv file with header.
+
+    Columns are projection of items by dotted paths, for example
+    "snippet.title" or "statistics.viewCount". Missing values are written
+    as empty strings, nested objects as json.
+    """
+
+    def __init__(self, path: str, columns: Columns, delimiter: str = ',',
+                 batch_size: int = 1000):
+        """
+        Args:
+            path (str): Path of output file, it's overwritten.
+            columns (Iterable[str] | Dict[str, str]): Dotted paths of
+                values or dictionary of column names and paths.
+            delimiter (str, optional): Delimiter of values. Default value
+                is ",".
+            batch_size (int, optional): Count of items written by one
+                batch. Default value is 1000.
+
+        """
+        self._columns = _projection(columns)
+        super().__init__(batch_size=batch_size)
+        self._path = path
+        self._delimiter = delimiter
+        self._file = None
+        self._writer = None
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    def _write_batch(self, items: List[dict]):
+        if self._file is None:
+            self._file = open(self._path, 'w', encoding='utf-8', newline='')
+            self._writer = csv.writer(self._file, delimiter=self._delimiter)
+            self._writer.writerow([name for name, _ in self._columns])
+        fields = [field for _, field in self._columns]
+        self._writer.writerows([
+            [_scalar(field._extract(item)) for field in fields]
+            for item in items
+        ])
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+            self._writer = None
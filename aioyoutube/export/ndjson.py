@@ -0,0 +1,72 @@
+import gzip
+import json
+from typing import List
+
+from aioyoutube.exeptions import VariableValueError
+from .base import BaseSink
+
+__all__ = [
+    'NdjsonSink',
+]
+
+COMPRESSIONS = (None, 'gzip', 'zstd')
+
+
+class NdjsonSink(BaseSink):
+    """Sink writing items as lines of json, optionally compressed by gzip
+    or by zstd, which requires package "zstandard"."""
+
+    def __init__(self, path: str, compression: str = None, level: int = None,
+                 batch_size: int = 1000):
+        """
+        Args:
+            path (str): Path of output file, it's overwritten.
+            compression (str, optional): Compression of file, "gzip" or
+                "zstd". By default file isn't compressed.
+            level (int, optional): Compression level. Default value is 6
+                for gzip and 3 for zstd.
+            batch_size (int, optional): Count of items written by one
+                batch. Default value is 1000.
+
+        """
+        if compression not in COMPRESSIONS:
+            raise VariableValueError(
+                f'Argument "compression" must be one of {COMPRESSIONS}, '
+                f'current value is {compression}.'
+            )
+        if compression == 'zstd':
+            # Optional dependency is checked before any writing.
+            import zstandard  # noqa: F401
+        super().__init__(batch_size=batch_size)
+        self._path = path
+        self._compression = compression
+        self._level = level
+        self._file = None
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    def _open(self):
+        if self._compression == 'gzip':
+            level = 6 if self._level is None else self._level
+            return gzip.open(self._path, 'wb', compresslevel=level)
+        if self._compression == 'zstd':
+            import zstandard
+            level = 3 if self._level is None else self._level
+            return zstandard.ZstdCompressor(level=level).stream_writer(
+                open(self._path, 'wb')
+            )
+        return open(self._path, 'wb')
+
+    def _write_batch(self, items: List[dict]):
+        if self._file is None:
+            self._file = self._open()
+        dumps = json.dumps
+        self._file.write(''.join([
+            dumps(item, ensure_ascii=False) + '\n' for item in items
+        ]).encode())
+
+    def _close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
@@ -0,0 +1,70 @@
+from typing import List
+
+from .base import BaseSink, Columns, _projection, _scalar
+
+__all__ = [
+    'ParquetSink',
+]
+
+
+class ParquetSink(BaseSink):
+    """Sink writing items into parquet file, requires package "pyarrow".
+
+    Columns are projection of items by dotted paths like in CsvSink. Every
+    batch is written as one row group, schema of file is inferred from
+    first row group, nested objects are stored as json strings.
+    """
+
+    def __init__(self, path: str, columns: Columns,
+                 row_group_size: int = 10000, compression: str = 'snappy'):
+        """
+        Args:
+            path (str): Path of output file, it's overwritten.
+            columns (Iterable[str] | Dict[str, str]): Dotted paths of
+                values or dictionary of column names and paths.
+            row_group_size (int, optional): Count of items of one row
+                group. Default value is 10000.
+            compression (str, optional): Compression of columns. Default
+                value is "snappy".
+
+        """
+        # Optional dependency is checked before any writing.
+        import pyarrow  # noqa: F401
+        self._columns = _projection(columns)
+        super().__init__(batch_size=row_group_size)
+        self._path = path
+        self._compression = compression
+        self._writer = None
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} path={self._path}>'
+
+    def _write_batch(self, items: List[dict]):
+        import pyarrow
+        import pyarrow.parquet
+
+        data = {
+            name: [_scalar(field._extract(item)) for item in items]
+            for name, field in self._columns
+        }
+        if self._writer is None:
+            table = pyarrow.table(data)
+            schema = table.schema
+            for index, field in enumerate(schema):
+                # Column without values in first group is typed as string.
+                if pyarrow.types.is_null(field.type):
+                    schema = schema.set(
+                        index, pyarrow.field(field.name, pyarrow.string())
+                    )
+            table = table.cast(schema)
+            self._writer = pyarrow.parquet.ParquetWriter(
+                self._path, table.schema, compression=self._compression
+            )
+        else:
+            table = pyarrow.table(data, schema=self._writer.schema)
+        self._writer.write_table(table)
+
+    def _close(self):
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
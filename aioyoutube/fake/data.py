@@ -0,0 +1,433 @@
+import time
+from hashlib import blake2b
+from typing import Callable, FrozenSet, Optional, Tuple
+
+from aioyoutube.exeptions import VariableValueError
+
+__all__ = [
+    'FakeDataset',
+]
+
+# Count of listed items and function building item by its position.
+Listing = Tuple[int, Callable[[int], dict]]
+
+_EPOCH = 1577836800
+# Maximum count of replies of thread returned by "commentThreads".
+_INLINE_REPLIES = 5
+
+
+def _time(timestamp: float) -> str:
+    return time.strftime('%Y-%m-%dT%H:%M:%SZ', time.gmtime(timestamp))
+
+
+def _number(value: str, maximum: int) -> int:
+    """Stable pseudo random number of value."""
+    digest = blake2b(value.encode(), digest_size=8).digest()
+    return int.from_bytes(digest, 'little') % maximum
+
+
+def _etag(value: str) -> str:
+    return blake2b(value.encode(), digest_size=12).hexdigest()
+
+
+def _index(value: str, prefix: str, size: int, limit: int) -> Optional[int]:
+    """Index encoded into id, None for id of other format."""
+    if len(value) != len(prefix) + size or not value.startswith(prefix):
+        return None
+    digits = value[len(prefix):]
+    if not digits.isdigit() or int(digits) >= limit:
+        return None
+    return int(digits)
+
+
+class FakeDataset:
+    """Deterministic synthetic youtube data.
+
+    Nothing is stored, items are built from indexes encoded into their ids
+    on request, so dataset of any size takes no memory. Video "j" of
+    channel "i" is published at "start + (j * channels + i) * interval",
+    uploads of channel are listed from newest video. Thread "k" of video
+    has "k % (max_replies + 1)" replies.
+    """
+    __slots__ = ('channels', 'videos_per_channel', 'playlists_per_channel',
+                 'comments_per_video', 'max_replies', 'start', 'interval',
+                 'comments_disabled_every')
+
+    def __init__(self, channels: int = 10, videos_per_channel: int = 100,
+                 playlists_per_channel: int = 2, comments_per_video: int = 50,
+                 max_replies: int = 8, start: int = _EPOCH,
+                 interval: int = 3600, comments_disabled_every: int = None):
+        """
+        Args:
+            channels (int, optional): Count of channels. Default value is
+                10.
+            videos_per_channel (int, optional): Count of uploaded videos of
+                every channel. Default value is 100.
+            playlists_per_channel (int, optional): Count of playlists of
+                every channel besides uploads. Default value is 2.
+            comments_per_video (int, optional): Count of comment threads
+                of every video. Default value is 50.
+            max_replies (int, optional): Maximum count of replies of one
+                thread. Default value is 8.
+            start (int, optional): Publication unixtime of first video.
+                Default value is 1577836800 (2020-01-01).
+            interval (int, optional): Seconds between publications of
+                videos. Default value is 3600.
+            comments_disabled_every (int, optional): Every video which
+                number in channel is divisible by value has disabled
+                comments. By default comments of all videos are enabled.
+
+        """
+        if channels > 10 ** 5 or videos_per_channel > 10 ** 6:
+            raise VariableValueError(
+                'Dataset can contain at most 100000 channels and 1000000 '
+                'videos per channel.'
+            )
+        self.channels = channels
+        self.videos_per_channel = videos_per_channel
+        self.playlists_per_channel = playlists_per_channel
+        self.comments_per_video = comments_per_video
+        self.max_replies = max_replies
+        self.start = start
+        self.interval = interval
+        self.comments_disabled_every = comments_disabled_every
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} channels={self.channels} ' \
+               f'videos_per_channel={self.videos_per_channel}>'
+
+    # Ids.
+
+    @staticmethod
+    def channel_id(channel: int) -> str:
+        return f'UC{channel:022d}'
+
+    @staticmethod
+    def uploads_id(channel: int) -> str:
+        return f'UU{channel:022d}'
+
+    @staticmethod
+    def playlist_id(channel: int, playlist: int) -> str:
+        return f'PL{channel:020d}{playlist:02d}'
+
+    @staticmethod
+    def video_id(channel: int, video: int) -> str:
+        return f'{channel:05d}{video:06d}'
+
+    @staticmethod
+    def thread_id(video_id: str, thread: int) -> str:
+        return f'Ug{video_id}{thread:05d}'
+
+    @staticmethod
+    def reply_id(thread_id: str, reply: int) -> str:
+        return f'{thread_id}.{reply:04d}'
+
+    @staticmethod
+    def user_name(channel: int) -> str:
+        return f'user{channel}'
+
+    def parse_channel(self, channel_id: str) -> Optional[int]:
+        return _index(channel_id, 'UC', 22, self.channels)
+
+    def parse_user_name(self, user_name: str) -> Optional[int]:
+        return _index(user_name, 'user', len(user_name) - 4, self.channels) \
+            if len(user_name) > 4 else None
+
+    def parse_video(self, video_id: str) -> Optional[Tuple[int, int]]:
+        if len(video_id) != 11 or not video_id.isdigit():
+            return None
+        channel, video = int(video_id[:5]), int(video_id[5:])
+        if channel >= self.channels or video >= self.videos_per_channel:
+            return None
+        return channel, video
+
+    def parse_thread(self, thread_id: str
+                     ) -> Optional[Tuple[int, int, int]]:
+        if len(thread_id) != 18 or not thread_id.startswith('Ug'):
+            return None
+        video = self.parse_video(thread_id[2:13])
+        thread = _index(thread_id[13:], '', 5, self.comments_per_video)
+        if video is None or thread is None:
+            return None
+        return (*video, thread)
+
+    # Times.
+
+    def video_published(self, channel: int, video: int) -> int:
+        return self.start + \
+            (video * self.channels + channel) * self.interval
+
+    def thread_published(self, channel: int, video: int, thread: int) -> int:
+        return self.video_published(channel, video) + (thread + 1) * 60
+
+    def comments_disabled(self, video: int) -> bool:
+        every = self.comments_disabled_every
+        return bool(every) and video % every == every - 1
+
+    def replies_count(self, thread: int) -> int:
+        return thread % (self.max_replies + 1)
+
+    # Items.
+
+    def channel(self, channel: int, parts: FrozenSet[str]) -> dict:
+        channel_id = self.channel_id(channel)
+        item = {
+            'kind': 'youtube#channel',
+            'etag': _etag(channel_id),
+            'id': channel_id,
+        }
+        if 'snippet' in parts:
+            item['snippet'] = {
+                'title': f'Channel {channel}',
+                'description': f'Synthetic channel {channel}.',
+                'customUrl': self.user_name(channel),
+                'publishedAt': _time(self.start - (channel + 1) * 86400),
+            }
+        if 'statistics' in parts:
+            item['statistics'] = {
+                'viewCount': str(_number(channel_id, 10 ** 9)),
+                'subscriberCount': str(_number(channel_id + 's', 10 ** 7)),
+                'hiddenSubscriberCount': False,
+                'videoCount': str(self.videos_per_channel),
+            }
+        if 'contentDetails' in parts:
+            item['contentDetails'] = {'relatedPlaylists': {
+                'likes': '', 'uploads': self.uploads_id(channel),
+            }}
+        return item
+
+    def video(self, channel: int, video: int, parts: FrozenSet[str]) -> dict:
+        video_id = self.video_id(channel, video)
+        item = {
+            'kind': 'youtube#video',
+            'etag': _etag(video_id),
+            'id': video_id,
+        }
+        if 'snippet' in parts:
+            item['snippet'] = {
+                'publishedAt': _time(self.video_published(channel, video)),
+                'channelId': self.channel_id(channel),
+                'title': f'Video {video} of channel {channel}',
+                'description': f'Synthetic video {video_id}.',
+                'channelTitle': f'Channel {channel}',
+                'tags': ['synthetic', f'channel{channel}'],
+                'categoryId': '22',
+            }
+        if 'contentDetails' in parts:
+            seconds = 30 + _number(video_id, 3600)
+            item['contentDetails'] = {
+                'duration': f'PT{seconds // 60}M{seconds % 60}S',
+                'dimension': '2d',
+                'definition': 'hd',
+                'caption': 'false',
+            }
+        if 'statistics' in parts:
+            statistics = {
+                'viewCount': str(_number(video_id, 10 ** 7)),
+                'likeCount': str(_number(video_id + 'l', 10 ** 5)),
+                'favoriteCount': '0',
+            }
+            if not self.comments_disabled(video):
+                statistics['commentCount'] = str(self.comments_per_video)
+            item['statistics'] = statistics
+        if 'status' in parts:
+            item['status'] = {
+                'uploadStatus': 'processed', 'privacyStatus': 'public',
+            }
+        return item
+
+    def comment(self, channel: int, video: int, thread: int,
+                reply: int = None) -> dict:
+        video_id = self.video_id(channel, video)
+        thread_id = self.thread_id(video_id, thread)
+        published = self.thread_published(channel, video, thread)
+        if reply is None:
+            comment_id = thread_id
+        else:
+            comment_id = self.reply_id(thread_id, reply)
+            published += (reply + 1) * 10
+        text = f'Comment {comment_id}'
+        snippet = {
+            'videoId': video_id,
+            'textDisplay': text,
+            'textOriginal': text,
+            'authorDisplayName': f'Author {_number(comment_id, 1000)}',
+            'authorChannelId': {
+                'value': self.channel_id(_number(comment_id, self.channels)),
+            },
+            'canRate': True,
+            'viewerRating': 'none',
+            'likeCount': _number(comment_id, 1000),
+            'publishedAt': _time(published),
+            'updatedAt': _time(published),
+        }
+        if reply is not None:
+            snippet['parentId'] = thread_id
+        return {
+            'kind': 'youtube#comment',
+            'etag': _etag(comment_id),
+            'id': comment_id,
+            'snippet': snippet,
+        }
+
+    def thread(self, channel: int, video: int, thread: int,
+               parts: FrozenSet[str]) -> dict:
+        video_id = self.video_id(channel, video)
+        thread_id = self.thread_id(video_id, thread)
+        replies = self.replies_count(thread)
+        item = {
+            'kind': 'youtube#commentThread',
+            'etag': _etag(thread_id),
+            'id': thread_id,
+        }
+        if 'snippet' in parts:
+            item['snippet'] = {
+                'channelId': self.channel_id(channel),
+                'videoId': video_id,
+                'topLevelComment': self.comment(channel, video, thread),
+                'canReply': True,
+                'totalReplyCount': replies,
+                'isPublic': True,
+            }
+        if 'replies' in parts and replies:
+            item['replies'] = {'comments': [
+                self.comment(channel, video, thread, reply)
+                for reply in range(min(replies, _INLINE_REPLIES))
+            ]}
+        return item
+
+    def playlist(self, channel: int, playlist: int,
+                 parts: FrozenSet[str]) -> dict:
+        playlist_id = self.playlist_id(channel, playlist)
+        item = {
+            'kind': 'youtube#playlist',
+            'etag': _etag(playlist_id),
+            'id': playlist_id,
+        }
+        if 'snippet' in parts:
+            item['snippet'] = {
+                'publishedAt': _time(self.start + playlist * 86400),
+                'channelId': self.channel_id(channel),
+                'title': f'Playlist {playlist} of channel {channel}',
+                'description': f'Synthetic playlist {playlist_id}.',
+                'channelTitle': f'Channel {channel}',
+            }
+        if 'contentDetails' in parts:
+            item['contentDetails'] = {
+                'itemCount': self._playlist_size(playlist),
+            }
+        if 'status' in parts:
+            item['status'] = {'privacyStatus': 'public'}
+        return item
+
+    def playlist_item(self, playlist_id: str, channel: int, video: int,
+                      position: int, parts: FrozenSet[str]) -> dict:
+        video_id = self.video_id(channel, video)
+        published = _time(self.video_published(channel, video))
+        item = {
+            'kind': 'youtube#playlistItem',
+            'etag': _etag(playlist_id + video_id),
+            'id': f'{playlist_id}{video_id}',
+        }
+        if 'snippet' in parts:
+            item['snippet'] = {
+                'publishedAt': published,
+                'channelId': self.channel_id(channel),
+                'title': f'Video {video} of channel {channel}',
+                'description': f'Synthetic video {video_id}.',
+                'channelTitle': f'Channel {channel}',
+                'playlistId': playlist_id,
+                'position': position,
+                'resourceId': {'kind': 'youtube#video', 'videoId': video_id},
+            }
+        if 'contentDetails' in parts:
+            item['contentDetails'] = {
+                'videoId': video_id, 'videoPublishedAt': published,
+            }
+        if 'status' in parts:
+            item['status'] = {'privacyStatus': 'public'}
+        return item
+
+    def search_result(self, channel: int, video: int) -> dict:
+        video_id = self.video_id(channel, video)
+        return {
+            'kind': 'youtube#searchResult',
+            'etag': _etag('search' + video_id),
+            'id': {'kind': 'youtube#video', 'videoId': video_id},
+            'snippet': {
+                'publishedAt': _time(self.video_published(channel, video)),
+                'channelId': self.channel_id(channel),
+                'title': f'Video {video} of channel {channel}',
+                'description': f'Synthetic video {video_id}.',
+                'channelTitle': f'Channel {channel}',
+                'liveBroadcastContent': 'none',
+            },
+        }
+
+    # Listings.
+
+    def _playlist_size(self, playlist: int) -> int:
+        step = playlist + 2
+        return (self.videos_per_channel + step - 1) // step
+
+    def search(self, published_after: float = None,
+               published_before: float = None) -> Listing:
+        """Videos published in time range from newest."""
+        count = self.channels * self.videos_per_channel
+        first, last = 0, count - 1
+        if published_after is not None:
+            first = max(first, -(-(published_after - self.start) //
+                                 self.interval))
+        if published_before is not None:
+            last = min(last, (published_before - self.start) //
+                       self.interval)
+        first, last = int(first), int(last)
+
+        def result(position: int) -> dict:
+            video, channel = divmod(last - position, self.channels)
+            return self.search_result(channel, video)
+
+        return max(0, last - first + 1), result
+
+    def channel_playlists(self, channel: int,
+                          parts: FrozenSet[str]) -> Listing:
+        return self.playlists_per_channel, \
+            lambda position: self.playlist(channel, position, parts)
+
+    def playlist_items(self, playlist_id: str,
+                       parts: FrozenSet[str]) -> Optional[Listing]:
+        """Videos of playlist from newest, None for unknown playlist."""
+        channel = _index(playlist_id, 'UU', 22, self.channels)
+        if channel is not None:
+            last, step = self.videos_per_channel - 1, 1
+            count = self.videos_per_channel
+        else:
+            channel = _index(playlist_id[:-2], 'PL', 20, self.channels)
+            playlist = _index(playlist_id[-2:], '', 2,
+                              self.playlists_per_channel)
+            if channel is None or playlist is None:
+                return None
+            step = playlist + 2
+            count = self._playlist_size(playlist)
+            last = (count - 1) * step
+
+        def item(position: int) -> dict:
+            return self.playlist_item(
+                playlist_id, channel, last - position * step, position, parts
+            )
+
+        return count, item
+
+    def threads(self, channel: int, video: int, parts: FrozenSet[str],
+                order: str = 'time') -> Listing:
+        count = self.comments_per_video
+
+        def thread(position: int) -> dict:
+            number = count - 1 - position if order == 'time' else position
+            return self.thread(channel, video, number, parts)
+
+        return count, thread
+
+    def replies(self, channel: int, video: int, thread: int) -> Listing:
+        return self.replies_count(thread), \
+            lambda position: self.comment(channel, video, thread, position)
@@ -0,0 +1,474 @@
+import asyncio
+import base64
+import random
+from typing import Dict, FrozenSet, Iterable, Optional
+
+from aiohttp import web
+
+from aioyoutube.key_pool import ApiKeyPool
+from aioyoutube.models import timestamp_converting
+from .data import FakeDataset, Listing
+
+__all__ = [
+    'FakeYoutubeServer',
+]
+
+# Sections of items by api method name.
+PARTS: Dict[str, FrozenSet[str]] = {
+    'search': frozenset(('snippet',)),
+    'commentThreads': frozenset(('id', 'snippet', 'replies')),
+    'comments': frozenset(('id', 'snippet')),
+    'channels': frozenset((
+        'id', 'snippet', 'statistics', 'contentDetails', 'brandingSettings',
+        'status', 'topicDetails', 'localizations', 'contentOwnerDetails',
+    )),
+    'playlistItems': frozenset(('id', 'snippet', 'contentDetails', 'status')),
+    'playlists': frozenset((
+        'id', 'snippet', 'contentDetails', 'status', 'player',
+        'localizations',
+    )),
+    'videos': frozenset((
+        'id', 'snippet', 'contentDetails', 'statistics', 'status', 'player',
+        'topicDetails', 'recordingDetails', 'liveStreamingDetails',
+        'localizations',
+    )),
+}
+_MAX_IDS = 50
+# Maximum "maxResults" by api method name, other methods allow 50.
+_MAX_RESULTS = {
+    'commentThreads': 100,
+    'comments': 100,
+}
+_TOKEN_PREFIX = 'page:'
+
+
+class _ApiError(Exception):
+    """Error response of fake api."""
+
+    def __init__(self, status: int, reason: str, message: str,
+                 retry_after: float = None):
+        super().__init__(message)
+        self.status = status
+        self.reason = reason
+        self.message = message
+        self.retry_after = retry_after
+
+
+def _kind(method_name: str) -> str:
+    """Item kind of api method, for example "video" of "videos"."""
+    return method_name.rstrip('s')
+
+
+def _encode_token(offset: int) -> str:
+    token = f'{_TOKEN_PREFIX}{offset}'.encode()
+    return base64.urlsafe_b64encode(token).decode().rstrip('=')
+
+
+def _decode_token(token: str) -> int:
+    try:
+        value = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        value = value.decode()
+        if value.startswith(_TOKEN_PREFIX):
+            return int(value[len(_TOKEN_PREFIX):])
+    except ValueError:
+        pass
+    raise _ApiError(
+        400, 'invalidPageToken',
+        'The request specifies an invalid page token.',
+    )
+
+
+class FakeYoutubeServer:
+    """Local aiohttp server imitating youtube data api with synthetic data.
+
+    Server implements list methods "search", "commentThreads",
+    "comments", "channels", "playlistItems", "playlists" and "videos".
+    Pages are chained by "nextPageToken", errors are answered with
+    statuses and reasons of real api: invalid and missing keys, spent
+    quota of key, exceeded rate, invalid parameters, unknown items and
+    random server failures. Parameter "fields" is ignored.
+
+    Usage:
+        async with FakeYoutubeServer(latency=0.05, quota=10000) as server:
+            async with Api(base_url=server.base_url) as api:
+                await api.videos(key='key', part=['snippet'],
+                                 video_ids=['00000000000'])
+    """
+    __slots__ = ('_dataset', '_host', '_port', '_version', '_keys',
+                 '_quota', '_latency', '_jitter', '_error_rate',
+                 '_rate_limit', '_random', '_tokens', '_updated', '_used',
+                 '_requests', '_errors', '_app', '_runner', '_site')
+
+    def __init__(self, dataset: FakeDataset = None, *,
+                 host: str = '127.0.0.1', port: int = 0, version: int = 3,
+                 keys: Iterable[str] = None, quota: int = None,
+                 latency: float = 0., jitter: float = 0.,
+                 error_rate: float = 0., rate_limit: float = None,
+                 seed: int = None):
+        """
+        Args:
+            dataset (FakeDataset, optional): Served data. Default is
+                dataset with default sizes.
+            host (str, optional): Listened host. Default value is
+                "127.0.0.1".
+            port (int, optional): Listened port. Default value is 0, free
+                port is chosen.
+            version (int, optional): Api version in url. Default value
+                is 3.
+            keys (Iterable[str], optional): Valid application keys. By
+                default any passed key is valid.
+            quota (int, optional): Daily quota units of every key. By
+                default quota is unlimited.
+            latency (float, optional): Seconds of delay of every response.
+                Default value is 0.
+            jitter (float, optional): Maximum seconds of random delay
+                added to latency. Default value is 0.
+            error_rate (float, optional): Share of requests failed with
+                server error. Default value is 0.
+            rate_limit (float, optional): Maximum requests per second of
+                all keys, excess requests are answered with rate limit
+                error. By default rate isn't limited.
+            seed (int, optional): Seed of random jitter and errors.
+
+        """
+        self._dataset = dataset or FakeDataset()
+        self._host = host
+        self._port = port
+        self._version = version
+        self._keys = frozenset(keys) if keys is not None else None
+        self._quota = quota
+        self._latency = latency
+        self._jitter = jitter
+        self._error_rate = error_rate
+        self._rate_limit = rate_limit
+        self._random = random.Random(seed)
+        self._tokens = max(1., rate_limit or 0.)
+        self._updated = None
+        self._used: Dict[str, int] = {}
+        self._requests: Dict[str, int] = {}
+        self._errors: Dict[str, int] = {}
+        self._runner = None
+        self._site = None
+
+        self._app = web.Application()
+        for method_name in PARTS:
+            self._app.router.add_get(
+                f'/youtube/v{version}/{method_name}', self._handle
+            )
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} ' \
+               f'host={self._host} port={self._port}>'
+
+    async def __aenter__(self) -> 'FakeYoutubeServer':
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.close()
+
+    @property
+    def app(self) -> web.Application:
+        """Application of server, for running by aiohttp test utils."""
+        return self._app
+
+    @property
+    def dataset(self) -> FakeDataset:
+        return self._dataset
+
+    @property
+    def port(self) -> int:
+        return self._port
+
+    @property
+    def base_url(self) -> str:
+        """Url template for "base_url" parameter of Api."""
+        return f'http://{self._host}:{self._port}/youtube/v{{version}}/'
+
+    @property
+    def stats(self) -> dict:
+        """Count of requests by api method, spent quota by key and count
+        of error responses by reason."""
+        return {
+            'requests': dict(self._requests),
+            'quota': dict(self._used),
+            'errors': dict(self._errors),
+        }
+
+    def reset(self):
+        """Resetting spent quota and stats."""
+        self._used.clear()
+        self._requests.clear()
+        self._errors.clear()
+
+    async def start(self):
+        """Starting listening of host and port."""
+        self._runner = web.AppRunner(self._app, access_log=None)
+        await self._runner.setup()
+        self._site = web.TCPSite(self._runner, self._host, self._port)
+        await self._site.start()
+        if not self._port:
+            self._port = self._site._server.sockets[0].getsockname()[1]
+
+    async def close(self):
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+            self._site = None
+
+    # Request processing.
+
+    async def _handle(self, request: web.Request) -> web.Response:
+        method_name = request.path.rsplit('/', 1)[-1]
+        query = request.query
+        self._requests[method_name] = self._requests.get(method_name, 0) + 1
+
+        delay = self._latency
+        if self._jitter:
+            delay += self._random.uniform(0, self._jitter)
+        if delay:
+            await asyncio.sleep(delay)
+
+        try:
+            self._check_access(method_name, query.get('key'))
+            body = getattr(self, f'_{method_name}')(query)
+        except _ApiError as err:
+            self._errors[err.reason] = self._errors.get(err.reason, 0) + 1
+            headers = None
+            if err.retry_after is not None:
+                headers = {'Retry-After': f'{err.retry_after:.3f}'}
+            return web.json_response({'error': {
+                'code': err.status,
+                'message': err.message,
+                'errors': [{
+                    'message': err.message,
+                    'domain': 'youtube.api',
+                    'reason': err.reason,
+                }],
+            }}, status=err.status, headers=headers)
+        return web.json_response(body)
+
+    def _check_access(self, method_name: str, key: Optional[str]):
+        if not key:
+            raise _ApiError(
+                403, 'forbidden',
+                'The request is missing a valid API key.',
+            )
+        if self._keys is not None and key not in self._keys:
+            raise _ApiError(
+                400, 'keyInvalid',
+                'API key not valid. Please pass a valid API key.',
+            )
+
+        if self._rate_limit:
+            now = asyncio.get_event_loop().time()
+            if self._updated is not None:
+                self._tokens = min(
+                    max(1., self._rate_limit),
+                    self._tokens + (now - self._updated) * self._rate_limit,
+                )
+            self._updated = now
+            if self._tokens < 1:
+                raise _ApiError(
+                    403, 'rateLimitExceeded', 'The request rate is too high.',
+                    retry_after=(1 - self._tokens) / self._rate_limit,
+                )
+            self._tokens -= 1
+
+        cost = ApiKeyPool.cost(method_name)
+        used = self._used.get(key, 0)
+        if self._quota is not None and used + cost > self._quota:
+            raise _ApiError(
+                403, 'quotaExceeded',
+                'The request cannot be completed because you have exceeded '
+                'your quota.',
+            )
+        self._used[key] = used + cost
+
+        if self._error_rate and self._random.random() < self._error_rate:
+            raise _ApiError(503, 'backendError', 'Backend Error')
+
+    @staticmethod
+    def _parts(method_name: str, query) -> FrozenSet[str]:
+        part = query.get('part')
+        if not part:
+            raise _ApiError(400, 'missingRequiredParameter',
+                            'No filter selected. Expected one of: part')
+        parts = frozenset(part.split(','))
+        unknown = parts - PARTS[method_name]
+        if unknown:
+            raise _ApiError(400, 'unknownPart', ','.join(sorted(unknown)))
+        return parts
+
+    @staticmethod
+    def _required(query, name: str) -> str:
+        value = query.get(name)
+        if not value:
+            raise _ApiError(400, 'missingRequiredParameter',
+                            f'No filter selected. Expected one of: {name}')
+        return value
+
+    @staticmethod
+    def _max_results(method_name: str, query) -> int:
+        try:
+            max_results = int(query.get('maxResults', 5))
+        except ValueError:
+            max_results = -1
+        if not 0 <= max_results <= _MAX_RESULTS.get(method_name, 50):
+            raise _ApiError(
+                400, 'invalidParameter',
+                f'Invalid value {query.get("maxResults")} for parameter '
+                f'maxResults',
+            )
+        return max_results
+
+    def _page(self, method_name: str, query, listing: Listing,
+              cap: int = None) -> dict:
+        """Page of listing by "pageToken" and "maxResults" parameters."""
+        total, build = listing
+        kind = _kind(method_name)
+        max_results = self._max_results(method_name, query)
+        token = query.get('pageToken')
+        offset = _decode_token(token) if token else 0
+        limit = total if cap is None else min(total, cap)
+        end = min(offset + max_results, limit)
+
+        body = {
+            'kind': f'youtube#{kind}ListResponse',
+            'etag': f'{kind}-{offset}-{end}',
+        }
+        if end < limit:
+            body['nextPageToken'] = _encode_token(end)
+        if offset:
+            body['prevPageToken'] = _encode_token(max(0, offset - max_results))
+        body['pageInfo'] = {
+            'totalResults': total, 'resultsPerPage': max_results,
+        }
+        body['items'] = [build(position) for position in range(offset, end)]
+        return body
+
+    @staticmethod
+    def _ids(query) -> list:
+        ids = [value for value in query['id'].split(',') if value]
+        if len(ids) > _MAX_IDS:
+            raise _ApiError(400, 'invalidParameter',
+                            f'Too many ids, maximum is {_MAX_IDS}')
+        return ids
+
+    @staticmethod
+    def _list(method_name: str, items: list) -> dict:
+        kind = _kind(method_name)
+        return {
+            'kind': f'youtube#{kind}ListResponse',
+            'etag': f'{kind}-{len(items)}',
+            'pageInfo': {
+                'totalResults': len(items), 'resultsPerPage': len(items),
+            },
+            'items': items,
+        }
+
+    # Api methods.
+
+    def _search(self, query) -> dict:
+        self._parts('search', query)
+        if query.get('type', 'video') != 'video':
+            return self._page('search', query, (0, None))
+
+        bounds = []
+        for name in ('publishedAfter', 'publishedBefore'):
+            value = query.get(name)
+            try:
+                bounds.append(
+                    timestamp_converting(value).timestamp() if value else None
+                )
+            except ValueError:
+                raise _ApiError(400, 'invalidParameter',
+                                f'Invalid value {value} for parameter {name}')
+        # Api returns at most 500 results of one query.
+        return self._page('search', query, self._dataset.search(*bounds),
+                          cap=500)
+
+    def _commentThreads(self, query) -> dict:
+        parts = self._parts('commentThreads', query)
+        video_id = self._required(query, 'videoId')
+        video = self._dataset.parse_video(video_id)
+        if video is None:
+            raise _ApiError(
+                404, 'videoNotFound',
+                'The video identified by the videoId parameter could not be '
+                'found.',
+            )
+        if self._dataset.comments_disabled(video[1]):
+            raise _ApiError(
+                403, 'commentsDisabled',
+                'The video identified by the videoId parameter has disabled '
+                'comments.',
+            )
+        return self._page('commentThreads', query, self._dataset.threads(
+            *video, parts, query.get('order', 'time')
+        ))
+
+    def _comments(self, query) -> dict:
+        self._parts('comments', query)
+        thread = self._dataset.parse_thread(
+            self._required(query, 'parentId')
+        )
+        if thread is None:
+            raise _ApiError(
+                404, 'commentNotFound',
+                'The comment identified by the parentId parameter could not '
+                'be found.',
+            )
+        return self._page('comments', query, self._dataset.replies(*thread))
+
+    def _channels(self, query) -> dict:
+        parts = self._parts('channels', query)
+        dataset = self._dataset
+        if query.get('forUsername'):
+            channel = dataset.parse_user_name(query['forUsername'])
+            channels = [] if channel is None else [channel]
+        else:
+            self._required(query, 'id')
+            channels = [dataset.parse_channel(value)
+                        for value in self._ids(query)]
+        return self._list('channels', [
+            dataset.channel(channel, parts)
+            for channel in channels if channel is not None
+        ])
+
+    def _playlistItems(self, query) -> dict:
+        parts = self._parts('playlistItems', query)
+        listing = self._dataset.playlist_items(
+            self._required(query, 'playlistId'), parts
+        )
+        if listing is None:
+            raise _ApiError(
+                404, 'playlistNotFound',
+                'The playlist identified by the playlistId parameter cannot '
+                'be found.',
+            )
+        return self._page('playlistItems', query, listing)
+
+    def _playlists(self, query) -> dict:
+        parts = self._parts('playlists', query)
+        channel = self._dataset.parse_channel(
+            self._required(query, 'channelId')
+        )
+        if channel is None:
+            raise _ApiError(
+                404, 'channelNotFound',
+                'The channel specified in the channelId parameter cannot be '
+                'found.',
+            )
+        return self._page('playlists', query,
+                          self._dataset.channel_playlists(channel, parts))
+
+    def _videos(self, query) -> dict:
+        parts = self._parts('videos', query)
+        self._required(query, 'id')
+        dataset = self._dataset
+        videos = [dataset.parse_video(value) for value in self._ids(query)]
+        return self._list('videos', [
+            dataset.video(*video, parts) for video in videos
+            if video is not None
+        ])
@@ -1,2 +1,10 @@
+from .cache import *
+from .cassette import *
 from .error import *
+from .ids import *
+from .key_pool import *
+from .limiter import *
+from .metrics import *
+from .models import *
+from .retry import *
 from .validation import *
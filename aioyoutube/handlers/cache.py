@@ -0,0 +1,25 @@
+from aioyoutube.cache import BaseCache
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+
+def cache_middleware(cache: BaseCache) -> Middleware:
+    """Building middleware getting response from api cache, requests with
+    raw response aren't cached.
+
+    Args:
+        cache (BaseCache): Cache of api responses.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        if request.raw:
+            return await handler(request)
+
+        async def send(method_name: str, params: dict) -> dict:
+            response = await handler(request)
+            return response.json
+
+        json = await cache.fetch(request.method, request.params, send)
+        return Response(200, json=json)
+
+    return middleware
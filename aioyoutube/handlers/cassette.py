@@ -0,0 +1,17 @@
+from aioyoutube.cassette import Cassette
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+
+def cassette_middleware(cassette: Cassette) -> Middleware:
+    """Building middleware replaying responses from cassette or
+    recording them, last step before sending request.
+
+    Args:
+        cassette (Cassette): Cassette of recorded responses.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        return await cassette.play(request, handler)
+
+    return middleware
@@ -1,249 +1,241 @@
-from aiohttp.client_exceptions import ContentTypeError
-from functools import wraps
+from typing import Callable, Dict, Optional, Tuple, Type
 
 from aioyoutube.exeptions import *
-
-
-def response_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api response."""
-
-        try:
-            json = await coroutine(*args, **kwargs)
-        except ContentTypeError as err:
-            url = err.request_info.url
-            raise WrongApiName(mess=(
-                f'Wrong api name "{url.parts[-1]}" has been passed '
-                f'into request url.'
-            ))
-
-        try:
-            reason = json['error']['errors'][0]['reason']
-            message = json['error']['message']
-            code = json['error']['code']
-        except KeyError:
-            return json
-        else:
-            if code == 400:
-                if reason == 'keyInvalid':
-                    key = kwargs.get('key')
-                    raise InvalidApiKey(code=400, json=json, mess=(
-                        f'Passed youtube api key:{key} is invalid.'
-                    ))
-                elif reason == 'unknownPart':
-                    raise UnknownField(code=400, json=json, mess=(
-                        f'Unknown parameter: {message} has been passed.'
-                    ))
-                elif reason == 'invalidParameter':
-                    raise InvalidParameterValue(code=400, json=json, mess=(
-                        'One of passed parameters value is not '
-                        f'allowed: {message}.'
-                    ))
-                elif reason == 'invalidPageToken':
-                    token = kwargs.get('page_token')
-                    raise InvalidPageToken(code=400, json=json, mess=(
-                        f'Passed invalid page token {token}.'
-                    ))
-                elif reason == 'processingFailure':
-                    raise ProcessingFailure(code=400, json=json, mess=(
-                        "Youtube can't process request, try repeat after "
-                        "some time later."
-                    ))
-                elif reason == 'missingRequiredParameter':
-                    raise MissingRequiredParameter(code=400, json=json, mess=(
-                        "Some required parameter has been miss."
-                    ))
-                elif reason == 'unexpectedParameter':
-                    raise UnexpectedParameter(code=400, json=json, mess=(
-                        'Unexpected parameter has been passed.'
-                    ))
-
-            elif code == 401:
-                if reason == 'authorizationRequired':
-                    raise NoAuthorized(code=401, json=json, mess=(
-                        'Request required OAuth2 authorization.'
-                    ))
-
-            elif code == 403:
-                if reason in ('dailyLimitExceededUnreg', 'quotaExceeded',
-                              'dailyLimitExceeded',):
-                    raise ExceededDailyLimit(code=403, json=json, mess=(
-                        f'Day request limit for api key {kwargs.get("key")} '
-                        'was exceeded.'
-                    ))
-                elif reason == 'channelClosed':
-                    raise ChannelClosed(code=403, json=json, mess=(
-                        f'Channel {kwargs.get("channel_id")} was closed.'
-                    ))
-                elif reason == 'channelSuspended':
-                    raise ChannelSuspended(code=403, json=json, mess=(
-                        f'Channel {kwargs.get("channel_id")} was suspended.'
-                    ))
-                elif reason == 'forbidden':
-                    raise ForbiddenError(code=403, json=json, mess=(
-                        f'Some of the parameter passed: {args}, {kwargs}, work'
-                        ' only with OAuth2 authenticated app.'
-                    ))
-
-            elif code == 404:
-                if reason == 'channelNotFound':
-                    raise ChannelNotExist(code=404, json=json, mess=(
-                        f"Channel {kwargs.get('channel_id')} doesn't exist."
-                    ))
-                elif reason == 'contentOwnerAccountNotFound':
-                    raise InvalidOwnerAccount(code=404, json=json, mess=(
-                        f"Owner account not found."
-                    ))
-                elif reason == 'videoNotFound':
-                    raise InvalidVideoId(code=404, json=json, mess=(
-                        f"Video with passed id:{kwargs.get('id')} "
-                        "doesn't exist."
-                    ))
-
-    return wrapper
-
-
-def comment_threads_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api comments response."""
-        video_id = kwargs.get('video_id')
-
-        json = await coroutine(*args, **kwargs)
-
-        if json.get('error'):
-            reason = json['error']['errors'][0]['reason']
-
-            if json['error']['code'] == 403:
-                if reason == 'commentsDisabled':
-                    raise CommentsDisabled(code=403, json=json, mess=(
-                        f'Comments for video: {video_id}, is disabled.'
-                    ))
-
-        return json
-
-    return wrapper
-
-
-def comments_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api comments response."""
-        parent_id = kwargs.get('parentId')
-
-        json = await coroutine(*args, **kwargs)
-
-        if json.get('error'):
-            reason = json['error']['errors'][0]['reason']
-
-            if json['error']['code'] == 404:
-                if reason == 'commentNotFound':
-                    raise InvalidCommentThreadId(code=404, json=json, mess=(
-                        f"Comment thread with id={parent_id} doesn't exist."
-                    ))
-
-        return json
-
-    return wrapper
-
-
-def channels_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api channels response."""
-        channel_id = kwargs.get('channel_id')
-        user_name = kwargs.get('user_name')
-
-        json = await coroutine(*args, **kwargs)
-
-        if not json.get('items') and not json.get('error'):
-            if user_name:
-                raise InvalidUserName(json=json, mess=(
-                    f"Channel with user name {user_name} doesn't exist."
-                ))
-            elif channel_id:
-                raise ChannelNotExist(code=404, json=json, mess=(
-                    f"Channel with id {channel_id} doesn't exist."
-                ))
-
-        elif json.get('error'):
-            reason = json['error']['errors'][0]['reason']
-
-            if json['error']['code'] == 400:
-                if reason == 'invalidChannelId':
-                    raise InvalidChannelId(code=400, json=json, mess=(
-                        f'Passed channel id parameter: {channel_id} is invalid.'
-                    ))
-
-            if json['error']['code'] == 403:
-                if reason == 'channelForbidden':
-                    raise ChannelForbidden(code=403, json=json, mess=(
-                        f"Channel with id {channel_id} doesn't support "
-                        "requests."
-                    ))
-
-        return json
-
-    return wrapper
-
-
-def playlist_items_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api playlist items response."""
-        playlist_id = kwargs.get('playlist_id')
-
-        json = await coroutine(*args, **kwargs)
-
-        if json.get('error'):
-            reason = json['error']['errors'][0]['reason']
-
-            if json['error']['code'] == 403:
-                if reason == 'playlistItemsNotAccessible':
-                    raise PlaylistItemsNotAccessible(code=403, json=json, mess=(
-                        f'Playlist with id={playlist_id} required OAuth2 '
-                        f'authorization.'
-                    ))
-                elif reason == 'watchHistoryNotAccessible':
-                    raise HistoryNotAccessible(code=403, json=json, mess=(
-                        f"Items of playlist 'history' can't be get through API."
-                    ))
-                elif reason == 'watchLaterNotAccessible':
-                    raise WatchLaterNotAccessible(code=403, json=json, mess=(
-                        f"Items of playlist 'watch later' can't be get "
-                        f"through API."
-                    ))
-
-            if json['error']['code'] == 404:
-                if reason == 'playlistNotFound':
-                    raise InvalidPlaylistId(code=404, json=json, mess=(
-                        f"Playlist with id {kwargs.get('playlist_id')} "
-                        "doesn't exist."
-                    ))
-
-        return json
-
-    return wrapper
-
-
-def playlist_error_handler(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator checker api playlist response."""
-
-        json = await coroutine(*args, **kwargs)
-
-        if json.get('error'):
-            reason = json['error']['errors'][0]['reason']
-
-            if json['error']['code'] == 403:
-                if reason == 'playlistForbidden':
-                    raise PlaylistForbidden(code=403, json=json, mess=(
-                        "Request playlist required OAuth2 authentication "
-                        "or doesn't support api requests."
-                    ))
-
-        return json
-
-    return wrapper
+from aioyoutube.helpers import retry_after_converting
+from aioyoutube.key_pool import QUOTA_ERROR_REASONS
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+ErrorRule = Tuple[Type[YoutubeApiError], str]
+
+
+class _Fields(dict):
+    """Request parameters for error message, missed parameter is empty."""
+
+    def __missing__(self, key):
+        return ''
+
+
+# Exception and its message by api method name (None is any method),
+# response http status and error reason. Message is formatted by request
+# parameters and api error message.
+ERRORS: Dict[Tuple[Optional[str], int, str], ErrorRule] = {
+    (None, 400, 'keyInvalid'): (
+        InvalidApiKey, 'Passed youtube api key:{key} is invalid.',
+    ),
+    (None, 400, 'unknownPart'): (
+        UnknownField, 'Unknown parameter: {message} has been passed.',
+    ),
+    (None, 400, 'invalidParameter'): (
+        InvalidParameterValue,
+        'One of passed parameters value is not allowed: {message}.',
+    ),
+    (None, 400, 'invalidPageToken'): (
+        InvalidPageToken, 'Passed invalid page token {pageToken}.',
+    ),
+    (None, 400, 'processingFailure'): (
+        ProcessingFailure,
+        "Youtube can't process request, try repeat after some time later.",
+    ),
+    (None, 400, 'missingRequiredParameter'): (
+        MissingRequiredParameter, 'Some required parameter has been miss.',
+    ),
+    (None, 400, 'unexpectedParameter'): (
+        UnexpectedParameter, 'Unexpected parameter has been passed.',
+    ),
+    (None, 401, 'authorizationRequired'): (
+        NoAuthorized, 'Request required OAuth2 authorization.',
+    ),
+    (None, 403, 'channelClosed'): (
+        ChannelClosed, 'Channel {channelId}{id} was closed.',
+    ),
+    (None, 403, 'channelSuspended'): (
+        ChannelSuspended, 'Channel {channelId}{id} was suspended.',
+    ),
+    (None, 403, 'forbidden'): (
+        ForbiddenError,
+        'Some of the parameter passed: {params}, work only with OAuth2 '
+        'authenticated app.',
+    ),
+    (None, 403, 'rateLimitExceeded'): (
+        RateLimitExceeded, 'Too many requests was sent in short time.',
+    ),
+    (None, 403, 'userRateLimitExceeded'): (
+        RateLimitExceeded, 'Too many requests was sent in short time.',
+    ),
+    (None, 404, 'channelNotFound'): (
+        ChannelNotExist, "Channel {channelId}{id} doesn't exist.",
+    ),
+    (None, 404, 'contentOwnerAccountNotFound'): (
+        InvalidOwnerAccount, 'Owner account not found.',
+    ),
+    (None, 404, 'videoNotFound'): (
+        InvalidVideoId, "Video with passed id:{videoId}{id} doesn't exist.",
+    ),
+    ('commentThreads', 403, 'commentsDisabled'): (
+        CommentsDisabled, 'Comments for video: {videoId}, is disabled.',
+    ),
+    ('comments', 404, 'commentNotFound'): (
+        InvalidCommentThreadId,
+        "Comment thread with id={parentId} doesn't exist.",
+    ),
+    ('channels', 400, 'invalidChannelId'): (
+        InvalidChannelId, 'Passed channel id parameter: {id} is invalid.',
+    ),
+    ('channels', 403, 'channelForbidden'): (
+        ChannelForbidden, "Channel with id {id} doesn't support requests.",
+    ),
+    ('playlistItems', 403, 'playlistItemsNotAccessible'): (
+        PlaylistItemsNotAccessible,
+        'Playlist with id={playlistId} required OAuth2 authorization.',
+    ),
+    ('playlistItems', 403, 'watchHistoryNotAccessible'): (
+        HistoryNotAccessible,
+        "Items of playlist 'history' can't be get through API.",
+    ),
+    ('playlistItems', 403, 'watchLaterNotAccessible'): (
+        WatchLaterNotAccessible,
+        "Items of playlist 'watch later' can't be get through API.",
+    ),
+    ('playlistItems', 404, 'playlistNotFound'): (
+        InvalidPlaylistId, "Playlist with id {playlistId} doesn't exist.",
+    ),
+    ('playlists', 403, 'playlistForbidden'): (
+        PlaylistForbidden,
+        "Request playlist required OAuth2 authentication or doesn't support "
+        "api requests.",
+    ),
+}
+ERRORS.update({
+    (None, 403, reason): (
+        ExceededDailyLimit,
+        'Day request limit for api key {key} was exceeded.',
+    )
+    for reason in QUOTA_ERROR_REASONS
+})
+
+# Exception and its message for error without own rule by http status.
+# Rule of status 404 is used only for response without json body, json
+# error of unknown reason keeps api error message.
+STATUS_ERRORS: Dict[int, ErrorRule] = {
+    404: (WrongApiName, 'Wrong api name "{method}" has been passed into '
+                        'request url.'),
+    429: (RateLimitExceeded, 'Too many requests was sent in short time.'),
+}
+SERVER_ERROR: ErrorRule = (
+    ServerError, 'Youtube api server failed with status {status}.',
+)
+DEFAULT_ERROR: ErrorRule = (
+    ResponseApiError, 'Api responded with status {status}: {message}.',
+)
+
+# Exception code, exception and its message for successful response
+# without items, by api method name and request parameter identifying
+# requested item.
+EMPTY_RESULT_ERRORS: Dict[
+    str, Tuple[Tuple[str, Optional[int], ErrorRule], ...]
+] = {
+    'channels': (
+        ('forUsername', None, (
+            InvalidUserName, "Channel with user name {forUsername} doesn't "
+                             "exist.",
+        )),
+        ('id', 404, (
+            ChannelNotExist, "Channel with id {id} doesn't exist.",
+        )),
+    ),
+}
+
+
+def response_error(method_name: str, status: int, json: Optional[dict],
+                   params: dict, retry_after: float = None
+                   ) -> YoutubeApiError:
+    """Building exception of api error response by dispatch table.
+
+    Rule is searched by method, http status and error reason, then by
+    any method, then by http status. Error without rule is generic
+    ResponseApiError, or ServerError for 5xx status. Status 404 without
+    json body means wrong api method name.
+
+    Args:
+        method_name (str): Request method api name.
+        status (int): Response http status.
+        json (dict, optional): Decoded response body, None for body which
+            isn't json.
+        params (dict): Dict of request parameters.
+        retry_after (float, optional): Seconds from "Retry-After" header.
+
+    """
+    error = json.get('error') if isinstance(json, dict) else None
+    try:
+        reason = error['errors'][0]['reason']
+    except (KeyError, IndexError, TypeError):
+        reason = None
+
+    rule = ERRORS.get((method_name, status, reason)) or \
+        ERRORS.get((None, status, reason))
+    if rule is None and (status != 404 or json is None):
+        rule = STATUS_ERRORS.get(status)
+    if rule is None:
+        rule = SERVER_ERROR if status >= 500 else DEFAULT_ERROR
+
+    exception, message = rule
+    fields = _Fields(params)
+    fields.update(
+        method=method_name, status=status,
+        message=error.get('message', '') if isinstance(error, dict) else '',
+        params={name: value for name, value in params.items()
+                if name != 'key'},
+    )
+    return exception(
+        code=status, json=json, retry_after=retry_after,
+        mess=message.format_map(fields),
+    )
+
+
+def check_empty_result(method_name: str, json: dict, params: dict):
+    """Raising exception when api method response hasn't items, if empty
+    result means that requested item doesn't exist."""
+    rules = EMPTY_RESULT_ERRORS.get(method_name)
+    if rules is None or json.get('items'):
+        return
+
+    for param, code, (exception, message) in rules:
+        if params.get(param):
+            raise exception(
+                code=code, json=json, mess=message.format_map(_Fields(params))
+            )
+
+
+def error_middleware(method_name: str,
+                     json_loads: Callable[[bytes], dict]) -> Middleware:
+    """Building middleware checking response status before decoding body.
+
+    Body of successful response is decoded, unless raw response was
+    requested. For error status exception is raised by api errors table.
+
+    Args:
+        method_name (str): Api method name.
+        json_loads (Callable): Function decoding response body bytes.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        response = await handler(request)
+
+        if response.status < 400:
+            if response.json is None and not request.raw:
+                response.json = json_loads(response.body)
+            return response
+
+        json = None
+        if 'json' in response.headers.get('Content-Type', ''):
+            try:
+                json = json_loads(response.body)
+            except ValueError:
+                pass
+        raise response_error(
+            method_name, response.status, json, request.params,
+            retry_after_converting(response.headers.get('Retry-After')),
+        )
+
+    return middleware
@@ -0,0 +1,94 @@
+import asyncio
+from typing import List
+
+from aioyoutube.exeptions import VariableValueError
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+from .error import check_empty_result
+
+# Api methods taking list of ids in request parameter "id".
+IDS_METHODS = frozenset(('channels', 'videos',))
+
+
+def _with_id(fields: str) -> str:
+    """Api "fields" selector with selected item id, which is needed for
+    merging chunks."""
+    if not fields or fields.startswith('items(id,'):
+        return fields
+    return f'{fields},items/id'
+
+
+def ids_middleware(max_ids: int, fan_out: int) -> Middleware:
+    """Building middleware sending request with list of ids split into
+    chunks of allowed size.
+
+    Repeated ids are removed, chunks are requested concurrently, response
+    items are merged in order of passed ids, ids without item are listed in
+    "missingIds". Item id is added into passed "fields" selector. Empty
+    result of request by single identifier is checked by api errors table.
+
+    Args:
+        max_ids (int): Maximum count of ids in one request.
+        fan_out (int): Maximum count of simultaneous requests of one
+            method call.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        ids = request.params.get('id')
+        if not isinstance(ids, list):
+            response = await handler(request)
+            if not request.raw:
+                check_empty_result(
+                    request.method, response.json, request.params
+                )
+            return response
+
+        ids = list(dict.fromkeys(ids))
+        if request.raw:
+            if len(ids) > max_ids:
+                raise VariableValueError(
+                    f'Raw response is allowed only for {max_ids} ids or '
+                    f'less, passed {len(ids)} ids.'
+                )
+            return await handler(request.replace(id=','.join(ids)))
+        semaphore = asyncio.Semaphore(fan_out)
+        fields = {}
+        if request.params.get('fields'):
+            fields['fields'] = _with_id(request.params['fields'])
+
+        async def send(chunk: List[str]) -> dict:
+            async with semaphore:
+                response = await handler(
+                    request.replace(id=','.join(chunk), **fields)
+                )
+            return response.json
+
+        responses = await asyncio.gather(*(
+            send(ids[i:i + max_ids])
+            for i in range(0, len(ids) or 1, max_ids)
+        ))
+
+        found = {
+            item['id']: item
+            for json in responses for item in json.get('items', ())
+            if 'id' in item
+        }
+        items = [found[i] for i in ids if i in found]
+        json = {
+            **responses[0],
+            'items': items,
+            'missingIds': [i for i in ids if i not in found],
+        }
+        if 'pageInfo' in json:
+            json['pageInfo'] = {
+                **json['pageInfo'],
+                'totalResults': len(items),
+                'resultsPerPage': len(items),
+            }
+        check_empty_result(
+            request.method, json, {**request.params, 'id': ','.join(ids)}
+        )
+
+        return Response(200, json=json)
+
+    return middleware
@@ -0,0 +1,30 @@
+from aioyoutube.exeptions import ExceededDailyLimit, VariableValueError
+from aioyoutube.key_pool import ApiKeyPool
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+
+def key_pool_middleware(key_pool: ApiKeyPool = None) -> Middleware:
+    """Building middleware taking key for request without key from api key
+    pool, on quota error request is repeated with other key of pool.
+
+    Args:
+        key_pool (ApiKeyPool, optional): Pool of application keys.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        if request.params.get('key') is not None:
+            return await handler(request)
+        elif key_pool is None:
+            raise VariableValueError(
+                'Argument "key" is required for api without key pool.'
+            )
+
+        while True:
+            key = key_pool.acquire(request.method)
+            try:
+                return await handler(request.replace(key=key))
+            except ExceededDailyLimit:
+                key_pool.exhaust(key)
+
+    return middleware
@@ -0,0 +1,49 @@
+import time
+
+from aioyoutube.limiter import ConcurrencyLimiter
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+from aioyoutube.retry import RetryPolicy
+
+
+def limiter_middleware(limiter: ConcurrencyLimiter,
+                       method_name: str) -> Middleware:
+    """Building middleware waiting for free slots of api concurrency limits
+    before request. Request failed with retryable error is reported to
+    adaptive limits as congestion.
+
+    Args:
+        limiter (ConcurrencyLimiter): Api concurrency limiter.
+        method_name (str): Api method name.
+
+    """
+    limits = limiter.limits(method_name)
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        acquired = []
+        try:
+            for limit in limits:
+                await limit.acquire()
+                acquired.append(limit)
+        except BaseException:
+            for limit in acquired:
+                limit.release()
+            raise
+
+        started = time.monotonic()
+        try:
+            response = await handler(request)
+        except Exception as err:
+            congested = RetryPolicy.is_retryable(err)
+            for limit in limits:
+                limit.release(started, congested)
+            raise
+        except BaseException:
+            for limit in limits:
+                limit.release()
+            raise
+
+        for limit in limits:
+            limit.release(started)
+        return response
+
+    return middleware
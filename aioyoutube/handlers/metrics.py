@@ -0,0 +1,36 @@
+from time import perf_counter
+
+from aioyoutube.key_pool import ApiKeyPool
+from aioyoutube.metrics import ApiMetrics
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+
+def metrics_middleware(metrics: ApiMetrics, method_name: str) -> Middleware:
+    """Building middleware recording api http requests into api metrics.
+
+    Args:
+        metrics (ApiMetrics): Api metrics.
+        method_name (str): Api method name.
+
+    """
+    method = metrics.method(method_name)
+    cost = ApiKeyPool.cost(method_name)
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        metrics.charge(request.params.get('key'), cost)
+        method.in_flight += 1
+        started = perf_counter()
+        try:
+            response = await handler(request)
+        except Exception as error:
+            method.observe(
+                perf_counter() - started, error=error.__class__.__name__
+            )
+            raise
+        finally:
+            method.in_flight -= 1
+
+        method.observe(perf_counter() - started, len(response.body or b''))
+        return response
+
+    return middleware
@@ -0,0 +1,41 @@
+from typing import Dict, Type
+
+from aioyoutube.models import (
+    Model, Video, Channel, CommentThread, Comment, PlaylistItem, Playlist,
+    SearchResult,
+)
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+
+# Model of response items by api method name.
+MODELS: Dict[str, Type[Model]] = {
+    'search': SearchResult,
+    'commentThreads': CommentThread,
+    'comments': Comment,
+    'channels': Channel,
+    'playlistItems': PlaylistItem,
+    'playlists': Playlist,
+    'videos': Video,
+}
+
+
+def models_middleware(method_name: str) -> Middleware:
+    """Building middleware converting response items into models, used for
+    method called with parameter "as_models".
+
+    Args:
+        method_name (str): Api method name.
+
+    """
+    model = MODELS[method_name]
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        response = await handler(request)
+
+        if request.raw:
+            return response
+        json = response.json
+        return Response(response.status, response.headers, response.body, {
+            **json, 'items': [model(item) for item in json.get('items', ())],
+        })
+
+    return middleware
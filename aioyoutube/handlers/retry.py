@@ -0,0 +1,23 @@
+from aioyoutube.pipeline import Handler, Middleware, Request, Response
+from aioyoutube.retry import RetryPolicy
+
+
+def retry_middleware(policy: RetryPolicy = None) -> Middleware:
+    """Building middleware repeating api request failed with transient
+    error by api retry policy or policy passed into method parameter
+    "retry".
+
+    Args:
+        policy (RetryPolicy, optional): Api retry policy.
+
+    """
+
+    async def middleware(request: Request, handler: Handler) -> Response:
+        kwargs = request.kwargs
+        current = kwargs['retry'] if 'retry' in kwargs else policy
+
+        if not current:
+            return await handler(request)
+        return await current.call(handler, request)
+
+    return middleware
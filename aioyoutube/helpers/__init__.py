@@ -1 +1,5 @@
 from .base import *
+from .pagination import *
+from .crawl import *
+from .sync import *
+from .shard import *
@@ -1,17 +1,43 @@
-from functools import wraps
+import time
+
+from email.utils import parsedate_to_datetime
 from rfc3339 import rfc3339
 from datetime import datetime
+from typing import List, NamedTuple, Union
 
 
-def insert_name(coroutine):
-    @wraps(coroutine)
-    async def wrapper(*args, **kwargs):
-        """Decorator insert class method name into this method parameters."""
-        return await coroutine(*args, **kwargs, name=coroutine.__name__)
-
-    return wrapper
+class RawResponse(NamedTuple):
+    """Undecoded body and status of successful api response."""
+    body: bytes
+    status: int
 
 
 def time_converting(time: int):
     """Converting time format from unixtime to rfc3339."""
     return rfc3339(datetime.fromtimestamp(time), utc=True)
+
+
+def fields_converting(fields: Union[str, List[str]]) -> str:
+    """Converting list of item fields in dotted notation into api "fields"
+    selector. Item id, page token and page info are always selected."""
+    if isinstance(fields, str):
+        return fields
+
+    paths = ['id']
+    paths.extend(field.replace('.', '/') for field in fields if field != 'id')
+    return f'items({",".join(paths)}),nextPageToken,pageInfo'
+
+
+def retry_after_converting(value: str):
+    """Converting "Retry-After" header value, delay seconds or http date,
+    into seconds to wait."""
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.)
+    except ValueError:
+        pass
+    try:
+        return max(parsedate_to_datetime(value).timestamp() - time.time(), 0.)
+    except (TypeError, ValueError):
+        return None
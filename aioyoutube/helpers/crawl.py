@@ -0,0 +1,259 @@
+import asyncio
+from typing import (
+    AsyncIterator, Awaitable, Callable, Iterable, List, Set, Union,
+)
+
+from aioyoutube.dedup import BaseIdSet
+from aioyoutube.models import Comment, Video
+from .pagination import _discard
+
+# Marker of finished producer in crawler queue.
+_DONE = object()
+
+
+class _Failure:
+    """Producer exception passed through crawler queue."""
+    __slots__ = ('error',)
+
+    def __init__(self, error: BaseException):
+        self.error = error
+
+
+async def _stream(produce: Callable[[asyncio.Queue], Awaitable],
+                  buffer: int) -> AsyncIterator:
+    """Yielding items of queue filled by producer in background until it
+    finishes, producer exception is raised. Producer is cancelled when
+    iteration is stopped.
+
+    Args:
+        produce: Coroutine function putting items into passed queue.
+        buffer (int): Maximum count of produced and not yielded items.
+
+    """
+    queue = asyncio.Queue(maxsize=buffer)
+
+    async def run():
+        try:
+            await produce(queue)
+        except Exception as error:
+            await queue.put(_Failure(error))
+        else:
+            await queue.put(_DONE)
+
+    producer = asyncio.ensure_future(run())
+    try:
+        while True:
+            item = await queue.get()
+            if item is _DONE:
+                break
+            if isinstance(item, _Failure):
+                raise item.error
+            yield item
+    finally:
+        _discard(producer)
+
+
+async def _wait_any(tasks: Set[asyncio.Future]):
+    """Waiting for at least one of tasks, raising exception of failed
+    task."""
+    done, _ = await asyncio.wait(tasks, return_when=asyncio.FIRST_COMPLETED)
+    for task in done:
+        tasks.discard(task)
+        task.result()
+
+
+async def _workers(count: int, work: Callable[..., Awaitable],
+                   arguments: Iterable):
+    """Calling coroutine function for every argument by several workers,
+    on error other workers are cancelled."""
+    arguments = iter(arguments)
+
+    async def worker():
+        for argument in arguments:
+            await work(argument)
+
+    tasks = [asyncio.ensure_future(worker()) for _ in range(count)]
+    try:
+        await asyncio.gather(*tasks)
+    finally:
+        for task in tasks:
+            _discard(task)
+
+
+async def crawl_comments(api, video_id: str, *, key: str = None,
+                         concurrency: int = 10, buffer: int = 1000,
+                         order: str = 'time', text_format: str = 'plainText',
+                         dedup: BaseIdSet = None, as_models: bool = False,
+                         **kwargs) -> AsyncIterator[Union[dict, Comment]]:
+    """Iterating over all comments of video, top level comments and their
+    replies.
+
+    Comment threads are requested with inline replies. Replies of thread
+    are requested by api method "comments" only when inline replies are
+    incomplete, such threads are requested concurrently. Comments are
+    yielded as they are received, not in order of threads, reply has
+    thread id in "snippet.parentId".
+
+    Args:
+        api (Api): Youtube api.
+        video_id (str): Id of youtube video.
+        key (str, optional): Key of youtube application.
+        concurrency (int, optional): Maximum count of threads which
+            replies are requested simultaneously. Default value is 10.
+        buffer (int, optional): Maximum count of received and not yielded
+            comments. Default value is 1000.
+        order (str, optional): Order of comment threads, "time" or
+            "relevance". Default value is "time".
+        text_format (str, optional): Format of comments text, "plainText"
+            or "html". Default value is "plainText".
+        dedup (BaseIdSet, optional): Set of seen ids, comments which ids
+            are in set are skipped.
+        as_models (bool, optional): Yield comments as models. Default
+            value is False.
+        **kwargs: Parameters of api methods, for example "retry".
+
+    """
+    async def put(queue: asyncio.Queue, comment: dict):
+        if dedup is None or not dedup.seen(comment['id']):
+            await queue.put(comment)
+
+    async def replies(queue: asyncio.Queue, thread_id: str):
+        async for comment in api.iter_comments(
+                key=key, part=['id', 'snippet'], parent_id=thread_id,
+                text_format=text_format, **kwargs):
+            await put(queue, comment)
+
+    async def threads(queue: asyncio.Queue):
+        pending = set()
+        try:
+            async for thread in api.iter_comment_threads(
+                    key=key, part=['id', 'snippet', 'replies'],
+                    video_id=video_id, order=order, text_format=text_format,
+                    **kwargs):
+                snippet = thread['snippet']
+                await put(queue, snippet['topLevelComment'])
+
+                inline = (thread.get('replies') or {}).get('comments') or []
+                if len(inline) >= snippet.get('totalReplyCount', 0):
+                    for comment in inline:
+                        if 'parentId' not in comment['snippet']:
+                            # Response can be cached, so it isn't changed.
+                            comment = {**comment, 'snippet': {
+                                **comment['snippet'], 'parentId': thread['id'],
+                            }}
+                        await put(queue, comment)
+                    continue
+
+                if len(pending) >= concurrency:
+                    await _wait_any(pending)
+                pending.add(
+                    asyncio.ensure_future(replies(queue, thread['id']))
+                )
+
+            while pending:
+                await _wait_any(pending)
+        finally:
+            for task in pending:
+                _discard(task)
+
+    async for comment in _stream(threads, buffer):
+        yield Comment(comment) if as_models else comment
+
+
+async def channel_videos(api, channel_id: Union[str, List[str]], *,
+                         key: str = None,
+                         part: Iterable[str] = ('snippet', 'statistics'),
+                         concurrency: int = 5, buffer: int = 500,
+                         max_videos: int = None, dedup: BaseIdSet = None,
+                         as_models: bool = False,
+                         **kwargs) -> AsyncIterator[Union[dict, Video]]:
+    """Iterating over uploaded videos of channels with details.
+
+    Uploads playlists of all channels are got by one chunked request,
+    then playlists are paged by several workers. Videos of received page
+    are requested while next page is loading. Videos of one channel are
+    yielded in order of uploads playlist, channels are mixed. Deleted
+    and private videos are skipped.
+
+    Args:
+        api (Api): Youtube api.
+        channel_id (str | List[str]): Youtube channel id or list of ids.
+        key (str, optional): Key of youtube application.
+        part (Iterable[str], optional): Sections of videos. Default value
+            is ("snippet", "statistics").
+        concurrency (int, optional): Maximum count of channels which
+            videos are requested simultaneously. Default value is 5.
+        buffer (int, optional): Maximum count of received and not yielded
+            videos. Default value is 500.
+        max_videos (int, optional): Maximum count of videos of one
+            channel.
+        dedup (BaseIdSet, optional): Set of seen ids, videos which ids
+            are in set are skipped without requesting their details.
+        as_models (bool, optional): Yield videos as models. Default value
+            is False.
+        **kwargs: Parameters of api methods, for example "retry".
+
+    """
+    channel_ids = [channel_id] if isinstance(channel_id, str) else \
+        list(channel_id)
+    part = list(part)
+
+    async def hydrate(video_ids: List[str]) -> List[dict]:
+        response = await api.videos(
+            key=key, part=part, video_ids=video_ids, as_models=as_models,
+            **kwargs
+        )
+        return response['items']
+
+    async def uploads(queue: asyncio.Queue, playlist_id: str):
+        previous = pending = None
+        left = max_videos
+        try:
+            async for page in api.iter_playlist_items(
+                    key=key, part=['contentDetails'], playlist_id=playlist_id,
+                    max_items=max_videos, pages=True, **kwargs):
+                video_ids = [
+                    item['contentDetails']['videoId']
+                    for item in page.get('items') or ()
+                ][:left]
+                if left is not None:
+                    left -= len(video_ids)
+                if dedup is not None:
+                    video_ids = [
+                        video_id for video_id in video_ids
+                        if not dedup.seen(video_id)
+                    ]
+                previous = pending
+                pending = asyncio.ensure_future(hydrate(video_ids)) \
+                    if video_ids else None
+
+                if previous is not None:
+                    for video in await previous:
+                        await queue.put(video)
+
+            if pending is not None:
+                for video in await pending:
+                    await queue.put(video)
+        finally:
+            # Page videos are awaited while next page is hydrated, both
+            # can be left running by cancelled or failed producer.
+            for task in (previous, pending):
+                if task is not None:
+                    _discard(task)
+
+    async def channels(queue: asyncio.Queue):
+        response = await api.channels(
+            key=key, part=['contentDetails'], channel_id=channel_ids,
+            **kwargs
+        )
+        playlist_ids = [
+            item['contentDetails']['relatedPlaylists']['uploads']
+            for item in response.get('items') or ()
+        ]
+        await _workers(
+            min(concurrency, len(playlist_ids)),
+            lambda playlist_id: uploads(queue, playlist_id), playlist_ids,
+        )
+
+    async for video in _stream(channels, buffer):
+        yield video
@@ -0,0 +1,92 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, List
+
+from aioyoutube.dedup import BaseIdSet, item_id
+from aioyoutube.exeptions import VariableValueError
+
+
+def _discard(task: asyncio.Future):
+    """Cancelling not needed prefetch task without leaking its error."""
+    if not task.done():
+        task.cancel()
+    elif not task.cancelled():
+        task.exception()
+
+
+def _reject_raw(kwargs: dict):
+    """Iterators read next page token from decoded page, so raw response
+    can't be iterated."""
+    if kwargs.get('raw'):
+        raise VariableValueError(
+            'Argument "raw" is not supported by iterators, pages are '
+            'always decoded.'
+        )
+
+
+def _fresh(items: List[dict], dedup: BaseIdSet, left: int = None
+           ) -> List[dict]:
+    """Not seen items of page, at most "left" items are checked in."""
+    fresh = []
+    for item in items:
+        if left is not None and len(fresh) >= left:
+            break
+        if not dedup.seen(item_id(item)):
+            fresh.append(item)
+    return fresh
+
+
+async def paginate(method: Callable[..., Awaitable[dict]], *,
+                   max_items: int = None, max_pages: int = None,
+                   pages: bool = False, dedup: BaseIdSet = None,
+                   **kwargs) -> AsyncIterator[dict]:
+    """Iterating over all pages of api method following "nextPageToken".
+
+    Next page is requested in background while current page is processed.
+
+    Args:
+        method: Api method which accept "page_token" parameter.
+        max_items (int, optional): Maximum count of yielded items.
+        max_pages (int, optional): Maximum count of requested pages.
+        pages (bool, optional): Yield whole pages instead of items.
+            Default value is False.
+        dedup (BaseIdSet, optional): Set of seen ids, items which ids
+            are in set are skipped and aren't counted in "max_items".
+            Pages are yielded without deduplication.
+        **kwargs: Parameters of api method, except "raw".
+
+    """
+    _reject_raw(kwargs)
+    if max_items is not None and max_items <= 0:
+        return
+
+    requested = 1
+    yielded = 0
+    task = asyncio.ensure_future(method(**kwargs))
+    try:
+        while task is not None:
+            page = await task
+            task = None
+
+            items = page.get('items') or []
+            token = page.get('nextPageToken')
+            left = None if max_items is None else max_items - yielded
+            if dedup is not None and not pages:
+                items = _fresh(items, dedup, left)
+
+            if token and (max_pages is None or requested < max_pages) and \
+                    (left is None or len(items) < left):
+                task = asyncio.ensure_future(
+                    method(**{**kwargs, 'page_token': token})
+                )
+                requested += 1
+
+            if pages:
+                yielded += len(items)
+                yield page
+            else:
+                for item in items[:left]:
+                    yielded += 1
+                    yield item
+    finally:
+        if task is not None:
+            _discard(task)
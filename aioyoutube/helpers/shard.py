@@ -0,0 +1,206 @@
+import asyncio
+from typing import AsyncIterator, Tuple
+
+from aioyoutube.dedup import BaseIdSet, CompactIdSet
+from aioyoutube.exeptions import VariableValueError
+from aioyoutube.key_pool import ApiKeyPool
+from aioyoutube.models import SearchResult
+from .crawl import _stream
+from .pagination import _discard, _reject_raw
+
+Window = Tuple[int, int]
+
+
+class ShardedSearch:
+    """Runner of api method "search" over time range split into windows.
+
+    Api returns limited count of results for one query, so window which
+    result count exceeds the cap is split in halves until results fit
+    into the cap or window becomes minimal. Windows are requested by
+    several workers under quota budget, results are deduplicated by id
+    and yielded in order of receiving.
+
+    Coverage is best-effort: splitting relies on "totalResults" of first
+    page, which is only an estimate of api. Window which pages ended
+    before estimated count of results is counted in stats as short
+    window, its missed results aren't requested again.
+
+    Usage:
+        async for item in ShardedSearch(api, text='text',
+                                        published_after=start,
+                                        published_before=end):
+            ...
+    """
+    __slots__ = ('_api', '_kwargs', '_published_after', '_published_before',
+                 '_windows', '_concurrency', '_quota_budget', '_result_cap',
+                 '_min_window', '_as_models', '_dedup', '_stats')
+
+    def __init__(self, api, *, published_after: int, published_before: int,
+                 windows: int = 4, concurrency: int = 4,
+                 quota_budget: int = None, result_cap: int = 500,
+                 min_window: int = 60, dedup: BaseIdSet = None,
+                 as_models: bool = False, **kwargs):
+        """
+        Args:
+            api (Api): Youtube api.
+            published_after (int): Start of time range in unixtime.
+            published_before (int): End of time range in unixtime.
+            windows (int, optional): Count of initial windows. Default
+                value is 4.
+            concurrency (int, optional): Maximum count of windows
+                requested simultaneously. Default value is 4.
+            quota_budget (int, optional): Maximum count of quota units
+                spent by runner, windows which can't be requested within
+                budget are skipped and counted in stats. By default
+                budget is unlimited.
+            result_cap (int, optional): Count of window results, after
+                which window is split. Default value is 500.
+            min_window (int, optional): Minimal seconds of window, such
+                window isn't split. Default value is 60.
+            dedup (BaseIdSet, optional): Set of seen ids, can be shared
+                by several runners. Default value is new CompactIdSet.
+            as_models (bool, optional): Yield items as models. Default
+                value is False.
+            **kwargs: Parameters of api method "search", except "raw".
+
+        """
+        _reject_raw(kwargs)
+        if published_before <= published_after:
+            raise VariableValueError(
+                'Argument "published_before" must be after '
+                '"published_after".'
+            )
+        self._api = api
+        self._kwargs = kwargs
+        self._published_after = published_after
+        self._published_before = published_before
+        self._windows = max(1, windows)
+        self._concurrency = max(1, concurrency)
+        self._quota_budget = quota_budget
+        self._result_cap = result_cap
+        self._min_window = min_window
+        self._as_models = as_models
+        self._dedup = CompactIdSet() if dedup is None else dedup
+        self._stats = {
+            'requests': 0,
+            'quota': 0,
+            'windows': 0,
+            'splits': 0,
+            'skipped_windows': 0,
+            'short_windows': 0,
+            'items': 0,
+            'duplicates': 0,
+        }
+
+    def __repr__(self):
+        return (
+            f'<class {self.__class__.__name__} '
+            f'range={self._published_after}-{self._published_before}>'
+        )
+
+    def __aiter__(self) -> AsyncIterator[dict]:
+        return self._iterate()
+
+    @property
+    def stats(self) -> dict:
+        """Counters of requests, spent quota, requested, split, skipped
+        and short windows, yielded items and skipped duplicates."""
+        return dict(self._stats)
+
+    @property
+    def dedup(self) -> BaseIdSet:
+        return self._dedup
+
+    def _initial_windows(self):
+        start, end = self._published_after, self._published_before
+        step = max(1, -(-(end - start) // self._windows))
+        return [
+            (after, min(after + step, end))
+            for after in range(start, end, step)
+        ]
+
+    def _charge(self) -> bool:
+        """Counting quota of request, False when budget is spent."""
+        cost = ApiKeyPool.cost('search')
+        if self._quota_budget is not None and \
+                self._stats['quota'] + cost > self._quota_budget:
+            return False
+        self._stats['requests'] += 1
+        self._stats['quota'] += cost
+        return True
+
+    async def _window(self, window: Window, windows: asyncio.Queue,
+                      results: asyncio.Queue):
+        """Requesting all pages of window or splitting it."""
+        after, before = window
+        page_token = None
+        expected = received = 0
+        while True:
+            if not self._charge():
+                self._stats['skipped_windows'] += 1
+                return
+            page = await self._api.search(
+                published_after=after, published_before=before,
+                page_token=page_token, **self._kwargs
+            )
+
+            if page_token is None:
+                self._stats['windows'] += 1
+                total = (page.get('pageInfo') or {}).get('totalResults', 0)
+                if total > self._result_cap and \
+                        before - after > self._min_window:
+                    middle = (after + before) // 2
+                    self._stats['splits'] += 1
+                    windows.put_nowait((after, middle))
+                    windows.put_nowait((middle, before))
+                    return
+                expected = min(total, self._result_cap)
+
+            items = page.get('items') or ()
+            received += len(items)
+            for item in items:
+                if self._dedup.seen(SearchResult(item).id):
+                    self._stats['duplicates'] += 1
+                    continue
+                self._stats['items'] += 1
+                await results.put(item)
+
+            page_token = page.get('nextPageToken')
+            if not page_token:
+                if received < expected:
+                    self._stats['short_windows'] += 1
+                return
+
+    async def _run(self, results: asyncio.Queue):
+        windows = asyncio.Queue()
+        for window in self._initial_windows():
+            windows.put_nowait(window)
+
+        async def worker():
+            while True:
+                window = await windows.get()
+                try:
+                    await self._window(window, windows, results)
+                finally:
+                    windows.task_done()
+
+        workers = [
+            asyncio.ensure_future(worker()) for _ in range(self._concurrency)
+        ]
+        done = asyncio.ensure_future(windows.join())
+        try:
+            # Windows are finished or one of workers failed.
+            await asyncio.wait(
+                [done, *workers], return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in workers:
+                if task.done():
+                    task.result()
+        finally:
+            _discard(done)
+            for task in workers:
+                _discard(task)
+
+    async def _iterate(self) -> AsyncIterator[dict]:
+        async for item in _stream(self._run, self._concurrency * 50):
+            yield SearchResult(item) if self._as_models else item
@@ -0,0 +1,164 @@
+import asyncio
+from typing import AsyncIterator, Awaitable, Callable, Tuple, Union
+
+from aioyoutube.checkpoint import BaseCheckpointStore, Checkpoint
+from aioyoutube.models import (
+    Model, PlaylistItem, SearchResult, timestamp_converting,
+)
+from .pagination import _discard, _reject_raw
+
+
+async def _sync(method: Callable[..., Awaitable[dict]],
+                store: BaseCheckpointStore, name: str,
+                identify: Callable[[dict], Tuple[str, float]],
+                stop_at_seen: bool, **kwargs) -> AsyncIterator[dict]:
+    """Iterating over pages of api method from checkpoint of query and
+    yielding only items which weren't seen by previous runs.
+
+    Checkpoint is saved after every page and when run is stopped, with
+    count of processed items of current page, so stopped run is continued
+    from the next item. Next page is requested in background while
+    current page is processed.
+
+    Args:
+        method: Api method which accept "page_token" parameter.
+        store (BaseCheckpointStore): Store of checkpoints.
+        name (str): Name of query in store.
+        identify: Function getting id and unixtime of publication of item.
+        stop_at_seen (bool): Stop run at first item older then high-water
+            time, for results ordered from newest items.
+        **kwargs: Parameters of api method, except "raw".
+
+    """
+    _reject_raw(kwargs)
+    checkpoint = await store.load(name) or Checkpoint()
+    if checkpoint.page_token:
+        kwargs['page_token'] = checkpoint.page_token
+    task = asyncio.ensure_future(method(**kwargs))
+    # Items of current page were processed after last save.
+    unsaved = False
+    try:
+        while task is not None:
+            page = await task
+            task = None
+
+            token = page.get('nextPageToken')
+            if token:
+                task = asyncio.ensure_future(
+                    method(**{**kwargs, 'page_token': token})
+                )
+
+            items = page.get('items') or ()
+            for item in items[checkpoint.page_offset:]:
+                checkpoint.page_offset += 1
+                unsaved = True
+                item_id, published_at = identify(item)
+                if checkpoint.is_new(item_id, published_at):
+                    checkpoint.observe(item_id, published_at)
+                    yield item
+                elif stop_at_seen and \
+                        published_at < checkpoint.published_at:
+                    _discard(task)
+                    task = None
+                    break
+
+            if task is None:
+                checkpoint.finish()
+            else:
+                checkpoint.page_token = token
+                checkpoint.page_offset = 0
+            await store.save(name, checkpoint)
+            unsaved = False
+    finally:
+        if task is not None:
+            _discard(task)
+        if unsaved:
+            await store.save(name, checkpoint)
+
+
+def _search_item(item: dict) -> Tuple[str, float]:
+    result = SearchResult(item)
+    return result.id, result.published_at.timestamp()
+
+
+def _playlist_item(item: dict) -> Tuple[str, float]:
+    published_at = timestamp_converting(item['snippet']['publishedAt'])
+    return item['id'], published_at.timestamp()
+
+
+async def sync_search(api, store: BaseCheckpointStore, name: str, *,
+                      as_models: bool = False, **kwargs
+                      ) -> AsyncIterator[Union[dict, Model]]:
+    """Iterating over new results of api method "search" since previous
+    run of query.
+
+    Query is requested with "published_after" of high-water time of
+    checkpoint, results published at that time and seen by previous runs
+    are skipped. Checkpoint of query must be used only with the same
+    parameters.
+
+    Args:
+        api (Api): Youtube api.
+        store (BaseCheckpointStore): Store of checkpoints.
+        name (str): Name of query in store.
+        as_models (bool, optional): Yield items as models. Default value
+            is False.
+        **kwargs: Parameters of api method "search".
+
+    """
+    checkpoint = await store.load(name)
+    if checkpoint is not None and checkpoint.published_at is not None:
+        # Publication time filter is inclusive, so boundary items are
+        # returned again and skipped by their ids.
+        kwargs['published_after'] = max(
+            int(checkpoint.published_at), kwargs.get('published_after') or 0
+        )
+
+    # Inner iterator is closed explicitly, so checkpoint of stopped run is
+    # saved before this iterator is closed.
+    items = _sync(api.search, store, name, _search_item, False, **kwargs)
+    try:
+        async for item in items:
+            yield SearchResult(item) if as_models else item
+    finally:
+        await items.aclose()
+
+
+async def sync_playlist_items(api, store: BaseCheckpointStore, name: str, *,
+                              part=('id', 'snippet', 'contentDetails'),
+                              stop_at_seen: bool = True,
+                              as_models: bool = False, **kwargs
+                              ) -> AsyncIterator[Union[dict, Model]]:
+    """Iterating over items added into playlist since previous run of
+    query.
+
+    Items are compared by time of adding into playlist. Run is stopped at
+    first item added before high-water time of checkpoint, as playlist of
+    uploads is ordered from newest videos.
+
+    Args:
+        api (Api): Youtube api.
+        store (BaseCheckpointStore): Store of checkpoints.
+        name (str): Name of query in store.
+        part (Iterable[str], optional): Sections of items, "snippet" is
+            always requested. Default value is ("id", "snippet",
+            "contentDetails").
+        stop_at_seen (bool, optional): Stop at first seen item, disable
+            it for playlist which isn't ordered from newest items.
+            Default value is True.
+        as_models (bool, optional): Yield items as models. Default value
+            is False.
+        **kwargs: Parameters of api method "playlistItems".
+
+    """
+    part = list(part)
+    if 'snippet' not in part:
+        part.append('snippet')
+
+    items = _sync(api.playlistItems, store, name, _playlist_item,
+                  stop_at_seen, part=part, **kwargs)
+    try:
+        async for item in items:
+            yield PlaylistItem(item) if as_models else item
+    finally:
+        await items.aclose()
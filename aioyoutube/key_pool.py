@@ -0,0 +1,149 @@
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, Union
+
+from aioyoutube.exeptions import ExceededDailyLimit, VariableValueError
+
+try:
+    from zoneinfo import ZoneInfo
+
+    _QUOTA_TIMEZONE = ZoneInfo('America/Los_Angeles')
+except (ImportError, KeyError):
+    _QUOTA_TIMEZONE = timezone(timedelta(hours=-8))
+
+__all__ = [
+    'ApiKeyPool',
+    'QUOTA_COSTS',
+    'QUOTA_ERROR_REASONS',
+]
+
+# Quota units spent by one request of api method, other methods cost 1.
+QUOTA_COSTS = {
+    'search': 100,
+}
+QUOTA_ERROR_REASONS = frozenset((
+    'dailyLimitExceededUnreg', 'quotaExceeded', 'dailyLimitExceeded',
+))
+
+
+def _next_reset(now: float) -> float:
+    """Unixtime of next quota reset, quota resets at midnight
+    of Pacific Time."""
+    local = datetime.fromtimestamp(now, _QUOTA_TIMEZONE)
+    midnight = datetime.combine(
+        local.date() + timedelta(days=1), datetime.min.time(),
+        tzinfo=_QUOTA_TIMEZONE,
+    )
+    return midnight.timestamp()
+
+
+class ApiKeyPool:
+    """Pool of youtube application keys with estimated quota usage.
+
+    Every request takes the key with most remaining quota and charges it
+    by method quota cost. Key which got quota error is treated as
+    exhausted until daily quota reset.
+    """
+    __slots__ = ('_quotas', '_used', '_exhausted', '_reset_at')
+
+    def __init__(self, keys: Union[Iterable[str], Dict[str, int]],
+                 daily_quota: int = 10000):
+        """
+        Args:
+            keys (Iterable[str] | Dict[str, int]): Youtube application keys,
+                or mapping of keys to their daily quota.
+            daily_quota (int, optional): Daily quota of every key passed
+                without own quota. Default value is 10000.
+
+        """
+        if isinstance(keys, dict):
+            self._quotas = dict(keys)
+        else:
+            self._quotas = dict.fromkeys(keys, daily_quota)
+        if not self._quotas:
+            raise VariableValueError('Key pool must contain at least one key.')
+
+        self._used = dict.fromkeys(self._quotas, 0)
+        self._exhausted = set()
+        self._reset_at = _next_reset(time.time())
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} keys={len(self._quotas)}>'
+
+    def __len__(self):
+        return len(self._quotas)
+
+    def __contains__(self, key: str):
+        return key in self._quotas
+
+    @property
+    def keys(self) -> tuple:
+        return tuple(self._quotas)
+
+    @property
+    def reset_at(self) -> float:
+        """Unixtime of next daily quota reset."""
+        self._check_reset()
+        return self._reset_at
+
+    @staticmethod
+    def cost(method_name: str) -> int:
+        """Quota units spent by one request of api method."""
+        return QUOTA_COSTS.get(method_name, 1)
+
+    def _check_reset(self):
+        now = time.time()
+        if now >= self._reset_at:
+            self._used = dict.fromkeys(self._quotas, 0)
+            self._exhausted.clear()
+            self._reset_at = _next_reset(now)
+
+    def remaining(self, key: str) -> int:
+        """Estimated remaining quota units of key."""
+        self._check_reset()
+        if key in self._exhausted:
+            return 0
+        return max(self._quotas[key] - self._used[key], 0)
+
+    def quota(self) -> Dict[str, dict]:
+        """Estimated quota state of every key."""
+        self._check_reset()
+        return {
+            key: {
+                'daily_quota': self._quotas[key],
+                'used': self._used[key],
+                'remaining': self.remaining(key),
+                'exhausted': key in self._exhausted,
+            }
+            for key in self._quotas
+        }
+
+    def acquire(self, method_name: str) -> str:
+        """Getting key with most remaining quota and charging it by method
+        cost.
+
+        Raises:
+            ExceededDailyLimit: All keys haven't enough quota for method.
+
+        """
+        cost = self.cost(method_name)
+        key = max(self._quotas, key=self.remaining)
+        if self.remaining(key) < cost:
+            raise ExceededDailyLimit(code=403, mess=(
+                f'Day request limit for all {len(self)} keys of pool '
+                'was exceeded.'
+            ))
+
+        self._used[key] += cost
+        return key
+
+    def charge(self, key: str, units: int):
+        """Adding spent quota units to key usage, negative units return
+        unused quota. Usage doesn't fall below zero."""
+        self._check_reset()
+        self._used[key] = max(self._used[key] + units, 0)
+
+    def exhaust(self, key: str):
+        """Marking key as exhausted until daily quota reset."""
+        self._check_reset()
+        self._exhausted.add(key)
@@ -0,0 +1,224 @@
+import asyncio
+import time
+from collections import deque
+from typing import Dict, Tuple
+
+from aioyoutube.exeptions import VariableValueError
+
+__all__ = [
+    'ConcurrencyLimit',
+    'ConcurrencyLimiter',
+]
+
+
+class ConcurrencyLimit:
+    """Limit of simultaneous requests, which can be changed while requests
+    are running.
+
+    Adaptive limit is tuned by AIMD: it grows by one after every "limit"
+    successful requests and is multiplied by "backoff" after request
+    failed with retryable error or answered slower then latency
+    threshold. Limit decreases once for requests started before previous
+    decrease.
+    """
+    __slots__ = ('_limit', '_min_limit', '_max_limit', '_adaptive',
+                 '_backoff', '_latency_threshold', '_active', '_waiters',
+                 '_successes', '_decreased_at')
+
+    def __init__(self, limit: int, adaptive: bool = False,
+                 min_limit: int = 1, max_limit: int = None,
+                 backoff: float = 0.5, latency_threshold: float = None):
+        """
+        Args:
+            limit (int): Maximum count of simultaneous requests, initial
+                value for adaptive limit.
+            adaptive (bool, optional): Tune limit by results of requests.
+                Default value is False.
+            min_limit (int, optional): Minimal value of adaptive limit.
+                Default value is 1.
+            max_limit (int, optional): Maximum value of adaptive limit.
+                Default value is initial limit.
+            backoff (float, optional): Multiplier of adaptive limit after
+                congestion. Default value is 0.5.
+            latency_threshold (float, optional): Seconds of request, after
+                which it's treated as congestion. By default only errors
+                are treated as congestion.
+
+        """
+        if limit < 1 or min_limit < 1:
+            raise VariableValueError('Concurrency limit must be positive.')
+        if not 0 < backoff < 1:
+            raise VariableValueError(
+                f'Argument "backoff" must be in range from 0 to 1, current '
+                f'value is {backoff}.'
+            )
+        self._limit = limit
+        self._min_limit = min(min_limit, limit)
+        self._max_limit = max(max_limit or limit, limit)
+        self._adaptive = adaptive
+        self._backoff = backoff
+        self._latency_threshold = latency_threshold
+        self._active = 0
+        self._waiters = deque()
+        self._successes = 0
+        self._decreased_at = 0.
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} limit={self._limit}>'
+
+    @property
+    def limit(self) -> int:
+        return self._limit
+
+    @property
+    def active(self) -> int:
+        return self._active
+
+    @property
+    def queue_depth(self) -> int:
+        """Count of requests waiting for free slot."""
+        return sum(1 for waiter in self._waiters if not waiter.done())
+
+    @property
+    def stats(self) -> dict:
+        return {
+            'limit': self._limit,
+            'active': self._active,
+            'queue_depth': self.queue_depth,
+        }
+
+    async def acquire(self):
+        """Waiting for free slot, slots are given in order of waiting."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        # Queue can contain only cancelled waiters while slot is free.
+        self._wake()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # Slot was given to cancelled waiter, pass it to next one.
+                self._active -= 1
+                self._wake()
+            raise
+
+    def release(self, started: float = None, congested: bool = False):
+        """Freeing slot and tuning adaptive limit by request result.
+
+        Args:
+            started (float, optional): Monotonic time of request start,
+                request isn't used for tuning without it.
+            congested (bool, optional): Request failed with error showing
+                api overload.
+
+        """
+        self._active -= 1
+        if self._adaptive and started is not None:
+            self._adapt(started, congested)
+        self._wake()
+
+    def _adapt(self, started: float, congested: bool):
+        now = time.monotonic()
+        if not congested and self._latency_threshold is not None:
+            congested = now - started > self._latency_threshold
+
+        if congested:
+            if started >= self._decreased_at:
+                self._limit = max(
+                    self._min_limit, int(self._limit * self._backoff)
+                )
+                self._successes = 0
+                self._decreased_at = now
+        elif self._limit < self._max_limit:
+            self._successes += 1
+            if self._successes >= self._limit:
+                self._limit += 1
+                self._successes = 0
+
+    def _wake(self):
+        waiters = self._waiters
+        while waiters and self._active < self._limit:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                self._active += 1
+                waiter.set_result(None)
+
+
+class ConcurrencyLimiter:
+    """Global and per api method limits of simultaneous api requests.
+
+    Request waits for slot of its method limit, then for slot of global
+    limit. All limits are adaptive, if limiter is adaptive.
+    """
+    __slots__ = ('_global', '_methods')
+
+    def __init__(self, limit: int = 100, method_limits: Dict[str, int] = None,
+                 adaptive: bool = False, min_limit: int = 1,
+                 max_limit: int = None, backoff: float = 0.5,
+                 latency_threshold: float = None):
+        """
+        Args:
+            limit (int, optional): Maximum count of simultaneous requests
+                of all methods. Default value is 100.
+            method_limits (Dict[str, int], optional): Maximum count of
+                simultaneous requests by api method name.
+            adaptive (bool, optional): Tune limits by results of requests.
+                Default value is False.
+            min_limit (int, optional): Minimal value of adaptive limits.
+                Default value is 1.
+            max_limit (int, optional): Maximum value of adaptive global
+                limit, method limits can't grow above their initial value.
+                Default value is initial limit.
+            backoff (float, optional): Multiplier of adaptive limit after
+                congestion. Default value is 0.5.
+            latency_threshold (float, optional): Seconds of request, after
+                which it's treated as congestion.
+
+        """
+        options = {
+            'adaptive': adaptive,
+            'min_limit': min_limit,
+            'backoff': backoff,
+            'latency_threshold': latency_threshold,
+        }
+        self._global = ConcurrencyLimit(limit, max_limit=max_limit, **options)
+        self._methods = {
+            name: ConcurrencyLimit(method_limit, **options)
+            for name, method_limit in (method_limits or {}).items()
+        }
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} ' \
+               f'limit={self._global.limit}>'
+
+    @property
+    def limit(self) -> int:
+        return self._global.limit
+
+    @property
+    def queue_depth(self) -> int:
+        return self._global.queue_depth + sum(
+            limit.queue_depth for limit in self._methods.values()
+        )
+
+    @property
+    def stats(self) -> dict:
+        """Current limit, active requests and waiting requests of global
+        limit and of method limits."""
+        return {
+            'global': self._global.stats,
+            'methods': {
+                name: limit.stats for name, limit in self._methods.items()
+            },
+        }
+
+    def limits(self, method_name: str) -> Tuple[ConcurrencyLimit, ...]:
+        """Limits of api method requests in order of acquiring."""
+        method = self._methods.get(method_name)
+        if method is None:
+            return self._global,
+        return method, self._global
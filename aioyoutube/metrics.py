@@ -0,0 +1,242 @@
+from bisect import bisect_left
+from hashlib import blake2b
+from typing import Dict, Iterable, List, Tuple
+
+__all__ = [
+    'ApiMetrics',
+    'MethodMetrics',
+    'LATENCY_BUCKETS',
+]
+
+# Upper bounds of request latency histogram buckets in seconds.
+LATENCY_BUCKETS = (
+    0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1., 2.5, 5., 10., float('inf'),
+)
+
+
+def _masked(key: str) -> str:
+    """Application key shown in metrics, only its end and short hash are
+    kept, so keys with the same end aren't merged."""
+    if not key:
+        return ''
+    digest = blake2b(key.encode(), digest_size=4).hexdigest()
+    return f'...{key[-4:]}-{digest}'
+
+
+def _label(value) -> str:
+    return str(value).replace('\\', '\\\\').replace('"', '\\"')
+
+
+class MethodMetrics:
+    """Counters of http requests of one api method."""
+    __slots__ = ('requests', 'in_flight', 'bytes_received', 'errors',
+                 'latency_sum', 'latency_counts', '_buckets')
+
+    def __init__(self, buckets: Tuple[float, ...] = LATENCY_BUCKETS):
+        self._buckets = buckets
+        self.in_flight = 0
+        self.reset()
+
+    def reset(self):
+        """Zeroing counters, in-flight gauge is kept."""
+        self.requests = 0
+        self.bytes_received = 0
+        self.errors: Dict[str, int] = {}
+        self.latency_sum = 0.
+        self.latency_counts = [0] * len(self._buckets)
+
+    def observe(self, latency: float, size: int = 0, error: str = None):
+        """Recording finished request.
+
+        Args:
+            latency (float): Seconds of waiting for response.
+            size (int, optional): Count of received body bytes.
+            error (str, optional): Class name of request exception.
+
+        """
+        self.requests += 1
+        self.bytes_received += size
+        self.latency_sum += latency
+        self.latency_counts[bisect_left(self._buckets, latency)] += 1
+        if error is not None:
+            self.errors[error] = self.errors.get(error, 0) + 1
+
+    def snapshot(self) -> dict:
+        """Copy of counters. Latency buckets are cumulative like in
+        Prometheus: count of requests not slower than bucket bound."""
+        cumulative, total = [], 0
+        for count in self.latency_counts:
+            total += count
+            cumulative.append(total)
+        return {
+            'requests': self.requests,
+            'in_flight': self.in_flight,
+            'bytes_received': self.bytes_received,
+            'errors': dict(self.errors),
+            'latency': {
+                'sum': self.latency_sum,
+                'buckets': dict(zip(self._buckets, cumulative)),
+            },
+        }
+
+
+class ApiMetrics:
+    """Metrics of api http requests.
+
+    Requests are counted by api method: count, in-flight gauge, received
+    bytes, cumulative latency histogram with fixed buckets and errors by
+    exception class name. Quota units are estimated by application key. Every
+    repeated or chunked request is counted, responses from cache aren't.
+    """
+    __slots__ = ('_buckets', '_methods', '_quota')
+
+    def __init__(self, buckets: Iterable[float] = LATENCY_BUCKETS):
+        """
+        Args:
+            buckets (Iterable[float], optional): Upper bounds of latency
+                histogram buckets in seconds, infinite bucket is added.
+
+        """
+        buckets = tuple(sorted(buckets))
+        if not buckets or buckets[-1] != float('inf'):
+            buckets += (float('inf'),)
+        self._buckets = buckets
+        self._methods: Dict[str, MethodMetrics] = {}
+        self._quota: Dict[str, int] = {}
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} ' \
+               f'methods={len(self._methods)}>'
+
+    @property
+    def buckets(self) -> Tuple[float, ...]:
+        return self._buckets
+
+    def method(self, method_name: str) -> MethodMetrics:
+        """Metrics of api method, created on first access."""
+        metrics = self._methods.get(method_name)
+        if metrics is None:
+            metrics = self._methods[method_name] = MethodMetrics(
+                self._buckets
+            )
+        return metrics
+
+    def charge(self, key: str, units: int):
+        """Adding estimated spent quota units to key."""
+        self._quota[key] = self._quota.get(key, 0) + units
+
+    def reset(self):
+        """Zeroing all metrics. Metrics of methods are zeroed in place,
+        because pipelines of api keep them since first request."""
+        for metrics in self._methods.values():
+            metrics.reset()
+        self._quota.clear()
+
+    def snapshot(self) -> dict:
+        """Copy of current metrics: by api method name, quota units by
+        masked application key and totals."""
+        methods = {
+            name: metrics.snapshot()
+            for name, metrics in self._methods.items()
+        }
+        errors = {}
+        for metrics in self._methods.values():
+            for name, count in metrics.errors.items():
+                errors[name] = errors.get(name, 0) + count
+
+        return {
+            'methods': methods,
+            'quota': {
+                _masked(key): units for key, units in self._quota.items()
+            },
+            'totals': {
+                'requests': sum(m['requests'] for m in methods.values()),
+                'in_flight': sum(m['in_flight'] for m in methods.values()),
+                'bytes_received': sum(
+                    m['bytes_received'] for m in methods.values()
+                ),
+                'quota': sum(self._quota.values()),
+                'errors': errors,
+            },
+        }
+
+    def prometheus(self, prefix: str = 'aioyoutube') -> str:
+        """Metrics in Prometheus text exposition format. Application keys
+        are shown by last four characters and short hash.
+
+        Args:
+            prefix (str, optional): Prefix of metrics names. Default value
+                is "aioyoutube".
+
+        """
+        lines: List[str] = []
+
+        def family(name: str, kind: str, text: str):
+            lines.append(f'# HELP {prefix}_{name} {text}')
+            lines.append(f'# TYPE {prefix}_{name} {kind}')
+
+        methods = sorted(self._methods.items())
+
+        family('requests_total', 'counter', 'Count of api http requests.')
+        for name, metrics in methods:
+            lines.append(
+                f'{prefix}_requests_total{{method="{_label(name)}"}} '
+                f'{metrics.requests}'
+            )
+
+        family('requests_in_flight', 'gauge',
+               'Count of api http requests waiting for response.')
+        for name, metrics in methods:
+            lines.append(
+                f'{prefix}_requests_in_flight{{method="{_label(name)}"}} '
+                f'{metrics.in_flight}'
+            )
+
+        family('received_bytes_total', 'counter',
+               'Count of received response body bytes.')
+        for name, metrics in methods:
+            lines.append(
+                f'{prefix}_received_bytes_total{{method="{_label(name)}"}} '
+                f'{metrics.bytes_received}'
+            )
+
+        family('errors_total', 'counter',
+               'Count of failed api http requests by exception class.')
+        for name, metrics in methods:
+            for error, count in sorted(metrics.errors.items()):
+                lines.append(
+                    f'{prefix}_errors_total{{method="{_label(name)}",'
+                    f'error="{_label(error)}"}} {count}'
+                )
+
+        family('request_duration_seconds', 'histogram',
+               'Latency of api http requests.')
+        for name, metrics in methods:
+            label = f'method="{_label(name)}"'
+            total = 0
+            for bound, count in zip(self._buckets, metrics.latency_counts):
+                total += count
+                shown = '+Inf' if bound == float('inf') else repr(bound)
+                lines.append(
+                    f'{prefix}_request_duration_seconds_bucket'
+                    f'{{{label},le="{shown}"}} {total}'
+                )
+            lines.append(
+                f'{prefix}_request_duration_seconds_sum{{{label}}} '
+                f'{metrics.latency_sum!r}'
+            )
+            lines.append(
+                f'{prefix}_request_duration_seconds_count{{{label}}} '
+                f'{metrics.requests}'
+            )
+
+        family('quota_units_total', 'counter',
+               'Estimated quota units used by application key.')
+        for key, units in sorted(
+            (_masked(key), units) for key, units in self._quota.items()
+        ):
+            lines.append(
+                f'{prefix}_quota_units_total{{key="{_label(key)}"}} {units}'
+            )
+
+        return '\n'.join(lines) + '\n'
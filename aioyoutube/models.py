@@ -0,0 +1,262 @@
+import re
+from datetime import datetime, timedelta, timezone
+from typing import Callable, List, Optional
+
+__all__ = [
+    'Model',
+    'Video',
+    'Channel',
+    'CommentThread',
+    'Comment',
+    'PlaylistItem',
+    'Playlist',
+    'SearchResult',
+]
+
+_DURATION = re.compile(
+    r'P(?:(?P<days>\d+)D)?'
+    r'(?:T(?:(?P<hours>\d+)H)?(?:(?P<minutes>\d+)M)?(?:(?P<seconds>\d+)S)?)?'
+)
+
+
+_TIMESTAMP = re.compile(
+    r'(\d{4})-(\d\d)-(\d\d)[Tt ](\d\d):(\d\d):(\d\d)(?:\.(\d+))?'
+    r'(?:[Zz]|([+-])(\d\d):(\d\d))?'
+)
+
+
+def timestamp_converting(value: str) -> datetime:
+    """Converting rfc3339 api timestamp into aware datetime. Fraction of
+    second can have any count of digits, timestamp without offset is
+    UTC."""
+    match = _TIMESTAMP.fullmatch(value)
+    if match is None:
+        raise ValueError(f'Invalid rfc3339 timestamp: {value}.')
+    *date, fraction, sign, hours, minutes = match.groups()
+
+    tz = timezone.utc
+    if sign is not None:
+        offset = timedelta(hours=int(hours), minutes=int(minutes))
+        tz = timezone(-offset if sign == '-' else offset)
+    microsecond = int((fraction or '')[:6].ljust(6, '0'))
+    return datetime(*map(int, date), microsecond, tzinfo=tz)
+
+
+def _duration(value: str) -> Optional[timedelta]:
+    """Converting iso 8601 api duration into timedelta."""
+    match = _DURATION.fullmatch(value)
+    if match is None:
+        return None
+    return timedelta(**{
+        name: int(count) for name, count in match.groupdict().items() if count
+    })
+
+
+def _bool(value) -> bool:
+    if isinstance(value, str):
+        return value.lower() == 'true'
+    return bool(value)
+
+
+class Field:
+    """Descriptor of model attribute taken from api item by dotted path.
+
+    Value of field with converter is converted on first access and
+    remembered in own slot of model, field without converter is read from
+    item every time.
+    """
+    __slots__ = ('_paths', '_converter', '_slot')
+
+    def __init__(self, *paths: str, converter: Callable = None):
+        """
+        Args:
+            *paths (str): Dotted paths of value in api item, first
+                existing value is taken.
+            converter (Callable, optional): Function converting value.
+
+        """
+        self._paths = tuple(tuple(path.split('.')) for path in paths)
+        self._converter = converter
+        self._slot = None
+
+    def __set_name__(self, owner, name: str):
+        if self._converter is not None:
+            self._slot = owner.__dict__[f'_{name}']
+
+    def _extract(self, data: dict):
+        for path in self._paths:
+            value = data
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key)
+            if value is not None:
+                return value
+        return None
+
+    def __get__(self, instance, owner):
+        if instance is None:
+            return self
+        if self._converter is None:
+            return self._extract(instance._data)
+
+        # Empty slot means that value wasn't converted yet.
+        try:
+            return self._slot.__get__(instance, owner)
+        except AttributeError:
+            pass
+        value = self._extract(instance._data)
+        if value is not None:
+            value = self._converter(value)
+        self._slot.__set__(instance, value)
+        return value
+
+
+class _ModelMeta(type):
+    """Adding slot of converted value for every model field with
+    converter."""
+
+    def __new__(mcs, name: str, bases: tuple, namespace: dict):
+        namespace['__slots__'] = tuple(namespace.get('__slots__', ())) + \
+            tuple(
+                f'_{attribute}' for attribute, value in namespace.items()
+                if isinstance(value, Field) and value._converter is not None
+            )
+        return super().__new__(mcs, name, bases, namespace)
+
+
+class Model(metaclass=_ModelMeta):
+    """Base class of typed api items.
+
+    Model keeps reference to original api item without copying it,
+    attributes are read from item on access.
+    """
+    __slots__ = ('_data',)
+
+    def __init__(self, data: dict):
+        self._data = data
+
+    def __repr__(self):
+        return f'<{self.__class__.__name__} id={self.id}>'
+
+    id = Field('id')
+    etag = Field('etag')
+
+    def to_dict(self) -> dict:
+        """Original api item, not copied."""
+        return self._data
+
+
+class Comment(Model):
+    """Youtube comment."""
+    __slots__ = ()
+
+    video_id = Field('snippet.videoId')
+    channel_id = Field('snippet.channelId')
+    parent_id = Field('snippet.parentId')
+    text_display = Field('snippet.textDisplay')
+    text_original = Field('snippet.textOriginal')
+    author_display_name = Field('snippet.authorDisplayName')
+    author_channel_id = Field('snippet.authorChannelId.value')
+    like_count = Field('snippet.likeCount', converter=int)
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
+    updated_at = Field('snippet.updatedAt', converter=timestamp_converting)
+
+
+def _comment(data: dict) -> Comment:
+    return Comment(data)
+
+
+def _comments(data: List[dict]) -> List[Comment]:
+    return [Comment(item) for item in data]
+
+
+class CommentThread(Model):
+    """Youtube video comment thread."""
+    __slots__ = ()
+
+    video_id = Field('snippet.videoId')
+    channel_id = Field('snippet.channelId')
+    can_reply = Field('snippet.canReply', converter=_bool)
+    is_public = Field('snippet.isPublic', converter=_bool)
+    total_reply_count = Field('snippet.totalReplyCount', converter=int)
+    top_level_comment = Field('snippet.topLevelComment', converter=_comment)
+    replies = Field('replies.comments', converter=_comments)
+
+
+class Video(Model):
+    """Youtube video."""
+    __slots__ = ()
+
+    channel_id = Field('snippet.channelId')
+    channel_title = Field('snippet.channelTitle')
+    title = Field('snippet.title')
+    description = Field('snippet.description')
+    tags = Field('snippet.tags')
+    category_id = Field('snippet.categoryId')
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
+    duration = Field('contentDetails.duration', converter=_duration)
+    view_count = Field('statistics.viewCount', converter=int)
+    like_count = Field('statistics.likeCount', converter=int)
+    favorite_count = Field('statistics.favoriteCount', converter=int)
+    comment_count = Field('statistics.commentCount', converter=int)
+
+
+class Channel(Model):
+    """Youtube channel."""
+    __slots__ = ()
+
+    title = Field('snippet.title')
+    description = Field('snippet.description')
+    custom_url = Field('snippet.customUrl')
+    country = Field('snippet.country')
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
+    uploads_playlist_id = Field('contentDetails.relatedPlaylists.uploads')
+    view_count = Field('statistics.viewCount', converter=int)
+    subscriber_count = Field('statistics.subscriberCount', converter=int)
+    hidden_subscriber_count = Field(
+        'statistics.hiddenSubscriberCount', converter=_bool
+    )
+    video_count = Field('statistics.videoCount', converter=int)
+
+
+class PlaylistItem(Model):
+    """Item of youtube playlist."""
+    __slots__ = ()
+
+    playlist_id = Field('snippet.playlistId')
+    channel_id = Field('snippet.channelId')
+    title = Field('snippet.title')
+    description = Field('snippet.description')
+    position = Field('snippet.position', converter=int)
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
+    video_id = Field('contentDetails.videoId', 'snippet.resourceId.videoId')
+    video_published_at = Field(
+        'contentDetails.videoPublishedAt', converter=timestamp_converting
+    )
+
+
+class Playlist(Model):
+    """Youtube playlist."""
+    __slots__ = ()
+
+    channel_id = Field('snippet.channelId')
+    channel_title = Field('snippet.channelTitle')
+    title = Field('snippet.title')
+    description = Field('snippet.description')
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
+    item_count = Field('contentDetails.itemCount', converter=int)
+
+
+class SearchResult(Model):
+    """Item of youtube search result."""
+    __slots__ = ()
+
+    id = Field('id.videoId', 'id.channelId', 'id.playlistId')
+    kind = Field('id.kind')
+    channel_id = Field('snippet.channelId')
+    channel_title = Field('snippet.channelTitle')
+    title = Field('snippet.title')
+    description = Field('snippet.description')
+    published_at = Field('snippet.publishedAt', converter=timestamp_converting)
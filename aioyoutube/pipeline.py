@@ -0,0 +1,120 @@
+from functools import wraps
+from typing import Awaitable, Callable, Iterable, Optional
+
+__all__ = [
+    'Request',
+    'Response',
+    'Handler',
+    'Middleware',
+    'build_pipeline',
+    'api_method',
+]
+
+
+class Request:
+    """Api request passed through api pipeline.
+
+    Request parameters are built on first access, so middlewares can
+    check method arguments before building.
+    """
+    __slots__ = ('method', 'kwargs', '_params', '_build')
+
+    def __init__(self, method: str, kwargs: dict, params: dict = None,
+                 build: Callable[..., dict] = None):
+        """
+        Args:
+            method (str): Api method name.
+            kwargs (dict): Arguments passed into api method.
+            params (dict, optional): Request parameters.
+            build (Callable, optional): Function building request
+                parameters from method arguments, if parameters weren't
+                passed.
+
+        """
+        self.method = method
+        self.kwargs = kwargs
+        self._params = params
+        self._build = build
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} method={self.method}>'
+
+    @property
+    def params(self) -> dict:
+        if self._params is None:
+            self._params = self._build(**self.kwargs)
+        return self._params
+
+    @property
+    def key(self) -> Optional[str]:
+        return self.params.get('key')
+
+    @property
+    def raw(self) -> bool:
+        return bool(self.kwargs.get('raw'))
+
+    def replace(self, **params) -> 'Request':
+        """Copy of request with replaced parameters."""
+        return self.__class__(
+            self.method, self.kwargs, {**self.params, **params}
+        )
+
+
+class Response:
+    """Api response passed back through api pipeline."""
+    __slots__ = ('status', 'headers', 'body', 'json')
+
+    def __init__(self, status: int, headers=None, body: bytes = None,
+                 json: dict = None):
+        """
+        Args:
+            status (int): Http status.
+            headers (Mapping, optional): Http headers.
+            body (bytes, optional): Undecoded body, None for response which
+                wasn't received from api server.
+            json (dict, optional): Decoded body.
+
+        """
+        self.status = status
+        self.headers = headers or {}
+        self.body = body
+        self.json = json
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} status={self.status}>'
+
+
+Handler = Callable[[Request], Awaitable[Response]]
+# Middleware takes request and handler of the next pipeline step.
+Middleware = Callable[[Request, Handler], Awaitable[Response]]
+
+
+def _link(middleware: Middleware, handler: Handler) -> Handler:
+    def step(request: Request) -> Awaitable[Response]:
+        return middleware(request, handler)
+
+    return step
+
+
+def build_pipeline(middlewares: Iterable[Middleware],
+                   endpoint: Handler) -> Handler:
+    """Assembling middlewares into one handler, first middleware is
+    called first."""
+    handler = endpoint
+    for middleware in reversed(list(middlewares)):
+        handler = _link(middleware, handler)
+    return handler
+
+
+def api_method(build: Callable[..., dict]):
+    """Decorator turn function building request parameters into api method
+    sending request through api pipeline."""
+    method = build.__name__
+
+    @wraps(build)
+    async def wrapper(self, **kwargs):
+        return await self._call(
+            Request(method, kwargs, build=build.__get__(self))
+        )
+
+    return wrapper
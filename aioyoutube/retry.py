@@ -0,0 +1,116 @@
+import asyncio
+import random
+from typing import Awaitable, Callable
+
+from aiohttp import ClientConnectionError, ClientPayloadError
+
+from aioyoutube.exeptions import YoutubeApiError
+
+__all__ = [
+    'RetryPolicy',
+]
+
+# Transport errors which are retried like retryable api exceptions.
+_TRANSIENT_ERRORS = (
+    ClientConnectionError, ClientPayloadError, asyncio.TimeoutError,
+)
+
+
+class RetryPolicy:
+    """Policy of repeating requests failed with transient errors.
+
+    Delay before attempt is random value from 0 to exponentially growing
+    limit (full jitter), but not less then "Retry-After" value passed by
+    api. Counters of attempts, retries and delays are collected in
+    "stats".
+    """
+    __slots__ = ('_max_attempts', '_base_delay', '_max_delay',
+                 '_respect_retry_after', '_stats')
+
+    def __init__(self, max_attempts: int = 3, base_delay: float = 0.5,
+                 max_delay: float = 30., respect_retry_after: bool = True):
+        """
+        Args:
+            max_attempts (int, optional): Maximum count of request attempts,
+                including first one. Default value is 3.
+            base_delay (float, optional): Delay limit in seconds before
+                first retry, doubled for every next retry. Default value
+                is 0.5.
+            max_delay (float, optional): Maximum delay limit in seconds.
+                Default value is 30.
+            respect_retry_after (bool, optional): Wait at least seconds
+                passed by api in "Retry-After" header. Default value is True.
+
+        """
+        self._max_attempts = max_attempts
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._respect_retry_after = respect_retry_after
+        self._stats = {
+            'calls': 0,
+            'attempts': 0,
+            'retries': 0,
+            'gave_up': 0,
+            'delay': 0.,
+            'errors': {},
+        }
+
+    def __repr__(self):
+        return (
+            f'<class {self.__class__.__name__} '
+            f'max_attempts={self._max_attempts}>'
+        )
+
+    @property
+    def max_attempts(self) -> int:
+        return self._max_attempts
+
+    @property
+    def stats(self) -> dict:
+        """Counters of calls, attempts, retries, calls which gave up
+        after last attempt, total delay seconds and retried errors by
+        exception class name."""
+        return {**self._stats, 'errors': dict(self._stats['errors'])}
+
+    @staticmethod
+    def is_retryable(err: BaseException) -> bool:
+        """Checking that request failed with passed error can be repeated."""
+        if isinstance(err, YoutubeApiError):
+            return err.retryable
+        return isinstance(err, _TRANSIENT_ERRORS)
+
+    def delay(self, retry: int, err: BaseException = None) -> float:
+        """Seconds to wait before retry with passed number, from 0."""
+        delay = random.uniform(
+            0, min(self._max_delay, self._base_delay * 2 ** retry)
+        )
+        retry_after = getattr(err, 'retry_after', None)
+        if self._respect_retry_after and retry_after:
+            delay = max(delay, retry_after)
+        return delay
+
+    async def call(self, coroutine: Callable[..., Awaitable],
+                   *args, **kwargs):
+        """Calling coroutine function and repeating it, while it fails
+        with retryable error and attempts aren't over."""
+        stats = self._stats
+        stats['calls'] += 1
+        retry = 0
+        while True:
+            stats['attempts'] += 1
+            try:
+                return await coroutine(*args, **kwargs)
+            except Exception as err:
+                if not self.is_retryable(err):
+                    raise
+                if retry + 1 >= self._max_attempts:
+                    stats['gave_up'] += 1
+                    raise
+
+                name = err.__class__.__name__
+                stats['errors'][name] = stats['errors'].get(name, 0) + 1
+                delay = self.delay(retry, err)
+                stats['retries'] += 1
+                stats['delay'] += delay
+                retry += 1
+                await asyncio.sleep(delay)
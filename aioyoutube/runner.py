@@ -0,0 +1,516 @@
+import asyncio
+import multiprocessing
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing.connection import Connection, wait
+from typing import (
+    Any, AsyncIterator, Callable, Dict, Iterable, List, Optional, Union,
+)
+
+from aioyoutube.api import Api
+from aioyoutube.exeptions import ExceededDailyLimit, VariableValueError
+from aioyoutube.key_pool import ApiKeyPool
+
+__all__ = [
+    'QuotaCoordinator',
+    'LeasedKeyPool',
+    'ProcessRunner',
+]
+
+# Function processing one item of workload by api, coroutine function
+# or async generator function, it must be importable by child processes.
+Work = Callable[[Api, Any], Union[AsyncIterator, Any]]
+
+
+class QuotaCoordinator:
+    """Daily quota of application keys shared by processes.
+
+    Processes lease quota units of key by blocks, so coordinator is asked
+    once per block instead of every request. Key with most remaining
+    quota is leased, unused units are returned by process when it
+    finishes. Leases are served by thread of coordinator process through
+    pipes of processes.
+    """
+    __slots__ = ('_pool', '_lease_size', '_connections', '_lock', '_thread',
+                 '_stop_reader', '_stop_writer', '_leases')
+
+    def __init__(self, keys: Union[Iterable[str], Dict[str, int]],
+                 daily_quota: int = 10000, lease_size: int = 100):
+        """
+        Args:
+            keys (Iterable[str] | Dict[str, int]): Youtube application keys,
+                or mapping of keys to their daily quota.
+            daily_quota (int, optional): Daily quota of every key passed
+                without own quota. Default value is 10000.
+            lease_size (int, optional): Quota units leased to process by
+                one request. Default value is 100.
+
+        """
+        self._pool = ApiKeyPool(keys, daily_quota=daily_quota)
+        self._lease_size = lease_size
+        self._connections: List[Connection] = []
+        self._lock = threading.Lock()
+        self._thread = None
+        self._stop_reader, self._stop_writer = multiprocessing.Pipe(
+            duplex=False
+        )
+        self._leases = 0
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} keys={len(self._pool)}>'
+
+    @property
+    def stats(self) -> dict:
+        """Count of leases and quota state of every key. Key which quota
+        is fully leased is shown as exhausted too."""
+        with self._lock:
+            quota = self._pool.quota()
+        for state in quota.values():
+            state['exhausted'] = state['exhausted'] or not state['remaining']
+        return {'leases': self._leases, 'quota': quota}
+
+    def lease(self, units: int) -> Optional[tuple]:
+        """Key, leased units, at least "units", and time of next quota
+        reset, which tags lease. None when no key has enough quota."""
+        with self._lock:
+            pool = self._pool
+            key = max(pool.keys, key=pool.remaining)
+            remaining = pool.remaining(key)
+            if remaining < units:
+                return None
+            granted = min(max(units, self._lease_size), remaining)
+            pool.charge(key, granted)
+            self._leases += 1
+            return key, granted, pool.reset_at
+
+    def release(self, key: str, units: int, reset_at: float = None):
+        """Returning unused leased units. Units of lease taken before
+        daily quota reset are dropped, they were reset with quota.
+
+        Args:
+            key (str): Leased key.
+            units (int): Unused units of lease.
+            reset_at (float, optional): Time of quota reset of lease.
+
+        """
+        with self._lock:
+            pool = self._pool
+            if key not in pool or units <= 0:
+                return
+            if reset_at is not None and reset_at != pool.reset_at:
+                return
+            pool.charge(key, -units)
+
+    def exhaust(self, key: str):
+        """Marking key as exhausted until daily quota reset."""
+        with self._lock:
+            if key in self._pool:
+                self._pool.exhaust(key)
+
+    def connect(self) -> Connection:
+        """Pipe end for child process, must be called before start."""
+        parent, child = multiprocessing.Pipe()
+        self._connections.append(parent)
+        return child
+
+    def start(self):
+        self._thread = threading.Thread(
+            target=self._serve, name='aioyoutube-quota', daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        if self._thread is not None:
+            self._stop_writer.send(None)
+            self._thread.join()
+            self._thread = None
+        for connection in self._connections:
+            connection.close()
+        self._connections.clear()
+
+    def _serve(self):
+        connections = list(self._connections)
+        while connections:
+            for connection in wait([self._stop_reader, *connections]):
+                if connection is self._stop_reader:
+                    self._stop_reader.recv()
+                    return
+                try:
+                    message = connection.recv()
+                except EOFError:
+                    connections.remove(connection)
+                    continue
+                connection.send(self._handle(message))
+
+    def _handle(self, message: tuple):
+        command, *args = message
+        if command == 'lease':
+            units, key, unused, reset_at = args
+            if key is not None:
+                self.release(key, unused, reset_at)
+            return self.lease(units)
+        if command == 'exhaust':
+            self.exhaust(*args)
+        elif command == 'release':
+            self.release(*args)
+        return None
+
+
+class LeasedKeyPool:
+    """Key pool of child process leasing quota from QuotaCoordinator.
+
+    Pool is used by api instead of ApiKeyPool. Request is charged from
+    current lease, new lease is requested when it is spent. Request of
+    lease blocks event loop for one round trip to coordinator process,
+    which is done once per leased block.
+    """
+    __slots__ = ('_connection', '_key', '_units', '_reset_at')
+
+    cost = staticmethod(ApiKeyPool.cost)
+
+    def __init__(self, connection: Connection):
+        """
+        Args:
+            connection (Connection): Pipe end got from coordinator.
+
+        """
+        self._connection = connection
+        self._key = None
+        self._units = 0
+        self._reset_at = None
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} units={self._units}>'
+
+    def _request(self, *message):
+        self._connection.send(message)
+        return self._connection.recv()
+
+    def acquire(self, method_name: str) -> str:
+        """Getting leased key and charging it by method cost.
+
+        Raises:
+            ExceededDailyLimit: All keys haven't enough quota for method.
+
+        """
+        cost = self.cost(method_name)
+        if self._key is None or self._units < cost:
+            lease = self._request(
+                'lease', cost, self._key, self._units, self._reset_at
+            )
+            self._key, self._units, self._reset_at = lease or (None, 0, None)
+            if lease is None:
+                raise ExceededDailyLimit(code=403, mess=(
+                    'Day request limit for all keys of coordinator was '
+                    'exceeded.'
+                ))
+        self._units -= cost
+        return self._key
+
+    def exhaust(self, key: str):
+        """Marking key as exhausted in coordinator, lease of key is
+        dropped."""
+        self._request('exhaust', key)
+        if key == self._key:
+            self._key, self._units = None, 0
+
+    def release(self):
+        """Returning unused units of current lease."""
+        if self._key is not None:
+            self._request(
+                'release', self._key, self._units, self._reset_at
+            )
+            self._key, self._units = None, 0
+
+
+async def _process(work: Work, api: Api, item, results: multiprocessing.Queue,
+                   batch: int) -> int:
+    """Calling work for item and sending its results by batches."""
+    output = work(api, item)
+    count = 0
+    if hasattr(output, '__aiter__'):
+        values = []
+        async for value in output:
+            values.append(value)
+            if len(values) >= batch:
+                results.put(('results', values))
+                count += len(values)
+                values = []
+        if values:
+            results.put(('results', values))
+            count += len(values)
+    else:
+        value = await output
+        if value is not None:
+            results.put(('results', [value]))
+            count += 1
+    return count
+
+
+async def _worker(number: int, work: Work, items: multiprocessing.Queue,
+                  results: multiprocessing.Queue, connection: Connection,
+                  concurrency: int, batch: int, api_options: dict):
+    key_pool = LeasedKeyPool(connection)
+    loop = asyncio.get_event_loop()
+    # Waiting for items blocks thread, so tasks of process wait in turn
+    # in one own thread instead of occupying default executor.
+    executor = ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix='aioyoutube-items'
+    )
+    stopped = False
+
+    async def consume():
+        nonlocal stopped
+        while not stopped:
+            entry = await loop.run_in_executor(executor, items.get)
+            if entry is None:
+                # Marker is returned for other tasks of process.
+                items.put(None)
+                return
+            index, item = entry
+            results.put(('taken', number, index))
+            try:
+                count = await _process(work, api, item, results, batch)
+            except ExceededDailyLimit as err:
+                stopped = True
+                results.put(('failed', number, index, repr(err)))
+            except Exception as err:
+                results.put(('failed', number, index, repr(err)))
+            else:
+                results.put(('done', number, index, count))
+
+    try:
+        async with Api(key_pool=key_pool, **api_options) as api:
+            await asyncio.gather(*(consume() for _ in range(concurrency)))
+    finally:
+        executor.shutdown(wait=False)
+        key_pool.release()
+        connection.close()
+
+
+def _worker_main(number: int, work: Work, items: multiprocessing.Queue,
+                 results: multiprocessing.Queue, *args):
+    try:
+        asyncio.run(_worker(number, work, items, results, *args))
+    finally:
+        # Results queue is flushed before process exits.
+        results.put(('exit', number))
+        results.close()
+        results.join_thread()
+
+
+class ProcessRunner:
+    """Runner of workload split between processes, every process has own
+    api, session and event loop.
+
+    Items of workload (channel ids, video ids, search windows) are taken
+    by processes from shared queue, so faster processes take more items.
+    Work function is called for item with api of process, its results
+    are sent into runner process and yielded in order of receiving.
+    Quota of keys is leased to processes by QuotaCoordinator, run stops
+    taking items when quota of all keys is spent. Items taken by process
+    which exited without finishing them are failed, RuntimeError is
+    raised after run, if such process left items not processed.
+
+    Quota isn't reserved per item: requests of all items in flight are
+    charged from the same leases. Run with budget smaller then needs of
+    taken items can leave most of them failed with ExceededDailyLimit
+    instead of finishing fewer items, so budget should cover
+    "processes" * "concurrency" items or concurrency should be lowered.
+
+    Work function must be defined at module level, processes are
+    started by "spawn" method.
+
+    Usage:
+        async def videos(api, channel_id):
+            async for video in api.iter_channel_videos(channel_id):
+                yield video
+
+        runner = ProcessRunner(videos, channel_ids, keys=['key'])
+        async for video in runner:
+            ...
+    """
+    __slots__ = ('_work', '_items', '_processes', '_concurrency', '_batch',
+                 '_api_options', '_coordinator', '_stats', '_errors')
+
+    def __init__(self, work: Work, items: Iterable, *,
+                 keys: Union[Iterable[str], Dict[str, int]] = None,
+                 coordinator: QuotaCoordinator = None,
+                 processes: int = None, concurrency: int = 10,
+                 batch: int = 100, api_options: dict = None):
+        """
+        Args:
+            work (Work): Coroutine function or async generator function
+                taking api and item, must be importable.
+            items (Iterable): Picklable items of workload.
+            keys (Iterable[str] | Dict[str, int], optional): Youtube
+                application keys or mapping of keys to daily quota, for
+                coordinator with default settings.
+            coordinator (QuotaCoordinator, optional): Coordinator of keys
+                quota, replaces "keys".
+            processes (int, optional): Count of processes. Default value
+                is count of cpu cores.
+            concurrency (int, optional): Count of items processed
+                simultaneously by one process. Default value is 10.
+            batch (int, optional): Maximum count of results sent by one
+                message. Default value is 100.
+            api_options (dict, optional): Picklable parameters of api of
+                processes, except "key_pool".
+
+        """
+        if coordinator is None:
+            if keys is None:
+                raise VariableValueError(
+                    'Argument "keys" or "coordinator" must be passed.'
+                )
+            coordinator = QuotaCoordinator(keys)
+        self._work = work
+        self._items = list(items)
+        self._processes = max(1, min(
+            processes or os.cpu_count() or 1, len(self._items) or 1
+        ))
+        self._concurrency = max(1, concurrency)
+        self._batch = max(1, batch)
+        self._api_options = api_options or {}
+        self._coordinator = coordinator
+        self._errors: Dict[int, str] = {}
+        self._stats = {
+            'items': len(self._items),
+            'done': 0,
+            'failed': 0,
+            'results': 0,
+            'workers': {},
+        }
+
+    def __repr__(self):
+        return f'<class {self.__class__.__name__} ' \
+               f'items={len(self._items)} processes={self._processes}>'
+
+    def __aiter__(self) -> AsyncIterator:
+        return self._iterate()
+
+    @property
+    def coordinator(self) -> QuotaCoordinator:
+        return self._coordinator
+
+    @property
+    def errors(self) -> Dict[int, str]:
+        """Errors of failed items by item index."""
+        return dict(self._errors)
+
+    @property
+    def stats(self) -> dict:
+        """Count of items, processed and failed items, results, counters
+        of every process and quota state of keys."""
+        stats = dict(self._stats)
+        stats['workers'] = {
+            number: dict(counters)
+            for number, counters in self._stats['workers'].items()
+        }
+        stats['pending'] = stats['items'] - stats['done'] - stats['failed']
+        stats['quota'] = self._coordinator.stats['quota']
+        return stats
+
+    def _count(self, number: int, name: str):
+        counters = self._stats['workers'].setdefault(
+            number, {'done': 0, 'failed': 0}
+        )
+        counters[name] += 1
+        self._stats[name] += 1
+
+    async def _iterate(self) -> AsyncIterator:
+        context = multiprocessing.get_context('spawn')
+        items = context.Queue()
+        results = context.Queue()
+        for entry in enumerate(self._items):
+            items.put(entry)
+        items.put(None)
+
+        coordinator = self._coordinator
+        processes = []
+        connections = []
+        for number in range(self._processes):
+            connections.append(coordinator.connect())
+            processes.append(context.Process(
+                target=_worker_main, name=f'aioyoutube-worker-{number}',
+                args=(number, self._work, items, results, connections[-1],
+                      self._concurrency, self._batch, self._api_options),
+                daemon=True,
+            ))
+        coordinator.start()
+        for process in processes:
+            process.start()
+        for connection in connections:
+            connection.close()
+
+        loop = asyncio.get_event_loop()
+
+        def receive():
+            try:
+                return results.get(timeout=0.5)
+            except queue.Empty:
+                return None
+
+        running = set(range(len(processes)))
+        # Indexes of items taken and not reported by every process.
+        taken: Dict[int, set] = {number: set() for number in running}
+        crashed = []
+        try:
+            while running:
+                message = await loop.run_in_executor(None, receive)
+                if message is None:
+                    # Process killed without exit message, its taken
+                    # items are failed.
+                    for number in list(running):
+                        process = processes[number]
+                        if process.is_alive():
+                            continue
+                        running.discard(number)
+                        crashed.append(number)
+                        for index in taken[number]:
+                            self._count(number, 'failed')
+                            self._errors[index] = (
+                                f'Worker {number} exited with code '
+                                f'{process.exitcode}.'
+                            )
+                        taken[number].clear()
+                    continue
+                kind = message[0]
+                if kind == 'results':
+                    self._stats['results'] += len(message[1])
+                    for value in message[1]:
+                        yield value
+                elif kind == 'taken':
+                    taken[message[1]].add(message[2])
+                elif kind == 'done':
+                    taken[message[1]].discard(message[2])
+                    self._count(message[1], 'done')
+                elif kind == 'failed':
+                    taken[message[1]].discard(message[2])
+                    self._count(message[1], 'failed')
+                    self._errors[message[2]] = message[3]
+                elif kind == 'exit':
+                    running.discard(message[1])
+
+            pending = self.stats['pending']
+            if crashed and pending:
+                codes = ', '.join(
+                    f'{number}: {processes[number].exitcode}'
+                    for number in crashed
+                )
+                raise RuntimeError(
+                    f'{pending} items not processed, workers exited with '
+                    f'codes {codes}.'
+                )
+        finally:
+            for process in processes:
+                if process.is_alive():
+                    process.terminate()
+                process.join()
+            coordinator.stop()
+            # Items left after quota is spent aren't flushed into pipe.
+            items.cancel_join_thread()
+            items.close()
+            results.close()
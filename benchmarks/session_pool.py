@@ -0,0 +1,88 @@
+"""Requests per second of per-call sessions against pooled api session.
+
+Runs a local stub server and sends the same "videos" request through:
+    - new ClientSession per request (previous Api behaviour);
+    - Api with long-lived pooled session.
+
+Repository root is added into import path, so benchmark of working tree
+runs without installing package.
+
+Usage:
+    python benchmarks/session_pool.py [--requests 2000] [--concurrency 50]
+"""
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+from aiohttp import ClientSession, web
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+)
+
+from aioyoutube import Api
+
+_BODY = {
+    'kind': 'youtube#videoListResponse',
+    'items': [{'kind': 'youtube#video', 'id': 'Ks-_Mh1QhMc'}],
+}
+
+
+async def _videos(request: web.Request) -> web.Response:
+    return web.json_response(_BODY)
+
+
+async def _start_server() -> (web.AppRunner, int):
+    app = web.Application()
+    app.router.add_get('/youtube/v3/videos', _videos)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, '127.0.0.1', 0)
+    await site.start()
+    port = site._server.sockets[0].getsockname()[1]
+    return runner, port
+
+
+async def _run(request, count: int, concurrency: int) -> float:
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await request()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(count)))
+    return count / (time.perf_counter() - start)
+
+
+async def main(count: int, concurrency: int):
+    runner, port = await _start_server()
+    base_url = f'http://127.0.0.1:{port}/youtube/v{{version}}/'
+    params = {'key': 'key', 'part': ['id'], 'video_ids': ['Ks-_Mh1QhMc']}
+
+    try:
+        url = base_url.format(version=3) + 'videos'
+
+        async def per_call_session():
+            async with ClientSession() as sess:
+                async with sess.get(url, params={'id': 'Ks-_Mh1QhMc'}) as res:
+                    await res.json()
+
+        rps = await _run(per_call_session, count, concurrency)
+        print(f'session per request: {rps:10.1f} req/s')
+
+        async with Api(base_url=base_url) as api:
+            rps = await _run(lambda: api.videos(**params), count, concurrency)
+        print(f'pooled api session:  {rps:10.1f} req/s')
+    finally:
+        await runner.cleanup()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--requests', type=int, default=2000)
+    parser.add_argument('--concurrency', type=int, default=50)
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency))
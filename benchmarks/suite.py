@@ -0,0 +1,395 @@
+"""Microbenchmarks of request hot path, saved for comparison between
+releases.
+
+Cases:
+    - validation middleware of api methods;
+    - error middleware on successful and error responses;
+    - api method dispatch overhead;
+    - time_converting;
+    - json decoding of large "commentThreads" page;
+    - Api.videos and Api.search throughput against in-process fake
+      server and against cassette replay without network.
+
+Every case is repeated seven times, best and median values are
+saved as json with python version, platform and git revision.
+Comparison with saved results exits with status 1 when best and median
+values of some case are both worse then threshold, so single noisy run
+isn't reported as regression.
+
+Package is imported from repository containing "benchmarks" directory,
+so suite runs without installing package. To measure older revision,
+copy "benchmarks" directory into its checkout and run suite there.
+Cases using features missing in measured revision are skipped, older
+revisions without middleware pipeline are measured by their
+decorators.
+
+Usage:
+    python benchmarks/suite.py [--quick] [--only validation,error]
+        [--output benchmarks/results/0.1.6.json]
+        [--compare benchmarks/results/0.1.6.json] [--threshold 0.25]
+"""
+import argparse
+import asyncio
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import timeit
+from typing import Callable, Dict, List, Tuple
+
+_BENCHMARKS_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path[:0] = [os.path.dirname(_BENCHMARKS_DIR), _BENCHMARKS_DIR]
+
+from aioyoutube.helpers import time_converting
+
+from validation import _CASES as _VALIDATION_CASES, _calls, _run
+
+# Count of runs of every case.
+REPEAT = 7
+
+# Best value, its unit and median value, "ns" is better when lower,
+# "req/s" when higher.
+Result = Tuple[float, str, float]
+
+
+def _measure(function: Callable, number: int) -> Tuple[float, float]:
+    """Best and median runs, nanoseconds per call."""
+    runs = [
+        run / number * 1e9
+        for run in timeit.repeat(function, number=number, repeat=REPEAT)
+    ]
+    return min(runs), statistics.median(runs)
+
+
+def _result(measured: Tuple[float, float], unit: str = 'ns') -> Result:
+    best, median = measured
+    return best, unit, median
+
+
+def _overhead(call: Callable, base: Callable, number: int) -> Result:
+    """Nanoseconds spent by call in addition to base call."""
+    spent, base = _measure(call, number), _measure(base, number)
+    return _result((spent[0] - base[0], spent[1] - base[1]))
+
+
+def bench_validation(number: int) -> Dict[str, Result]:
+    results = {}
+    for name, kwargs in _VALIDATION_CASES.items():
+        base, enabled, _ = _calls(name, kwargs)
+        results[name] = _overhead(enabled, base, number)
+    return results
+
+
+def bench_error(number: int) -> Dict[str, Result]:
+    body = json.dumps({
+        'kind': 'youtube#videoListResponse',
+        'items': [{'kind': 'youtube#video', 'id': 'Ks-_Mh1QhMc'}],
+    }).encode()
+    error_body = json.dumps({'error': {
+        'code': 403, 'message': 'Quota exceeded.',
+        'errors': [{'reason': 'quotaExceeded', 'message': 'Quota.'}],
+    }}).encode()
+    headers = {'Content-Type': 'application/json; charset=UTF-8'}
+    params = {'key': 'key', 'id': 'Ks-_Mh1QhMc'}
+    try:
+        from aioyoutube.handlers import error_middleware
+        from aioyoutube.pipeline import Request, Response
+    except ImportError:
+        # Revisions before api methods pipeline check decoded body by
+        # decorator.
+        from aioyoutube.handlers import response_error_handler
+
+        @response_error_handler
+        async def success(**kwargs):
+            return json.loads(body)
+
+        @response_error_handler
+        async def failure(**kwargs):
+            return json.loads(error_body)
+
+        def succeed():
+            _run(success(**params))
+
+        def fail():
+            _run(failure(**params))
+    else:
+        request = Request('videos', {}, params)
+        middleware = error_middleware('videos', json.loads)
+
+        async def send(request):
+            return Response(200, headers, body)
+
+        async def send_error(request):
+            return Response(403, headers, error_body)
+
+        def succeed():
+            _run(middleware(request, send))
+
+        def fail():
+            _run(middleware(request, send_error))
+
+    def raise_error():
+        try:
+            fail()
+        except Exception:
+            pass
+
+    return {
+        'success': _result(_measure(succeed, number)),
+        'failure': _result(_measure(raise_error, number // 10)),
+    }
+
+
+def bench_dispatch(number: int) -> Dict[str, Result]:
+    async def method(**kwargs):
+        return kwargs
+
+    try:
+        from aioyoutube.pipeline import api_method
+    except ImportError:
+        # Revisions before api methods pipeline dispatch methods by
+        # decorator inserting method name.
+        from aioyoutube.helpers import insert_name
+
+        wrapped = insert_name(method)
+    else:
+        class Methods:
+            async def _call(self, request):
+                return request.params
+
+            @api_method
+            def videos(self, **kwargs):
+                return kwargs
+
+        wrapped = Methods().videos
+    return {'overhead': _overhead(
+        lambda: _run(wrapped(key='key')), lambda: _run(method(key='key')),
+        number,
+    )}
+
+
+def bench_time_converting(number: int) -> Dict[str, Result]:
+    return {'call': _result(
+        _measure(lambda: time_converting(1577836800), number // 10)
+    )}
+
+
+def _comment_threads_page(count: int, replies: int) -> bytes:
+    """Body of "commentThreads" page, built without package, so every
+    revision decodes the same bytes."""
+    def comment(comment_id: str, parent_id: str = None) -> dict:
+        snippet = {
+            'videoId': 'Ks-_Mh1QhMc',
+            'textDisplay': f'Comment {comment_id} text.',
+            'textOriginal': f'Comment {comment_id} text.',
+            'authorDisplayName': f'Author {comment_id}',
+            'authorChannelId': {'value': 'UC' + comment_id[-22:]},
+            'canRate': True,
+            'viewerRating': 'none',
+            'likeCount': len(comment_id),
+            'publishedAt': '2020-01-01T00:00:00Z',
+            'updatedAt': '2020-01-01T00:00:00Z',
+        }
+        if parent_id is not None:
+            snippet['parentId'] = parent_id
+        return {'kind': 'youtube#comment', 'etag': comment_id[::-1],
+                'id': comment_id, 'snippet': snippet}
+
+    items = []
+    for thread in range(count):
+        thread_id = f'Ugz{thread:022d}'
+        items.append({
+            'kind': 'youtube#commentThread', 'etag': thread_id[::-1],
+            'id': thread_id,
+            'snippet': {
+                'videoId': 'Ks-_Mh1QhMc',
+                'topLevelComment': comment(thread_id),
+                'canReply': True, 'totalReplyCount': replies,
+                'isPublic': True,
+            },
+            'replies': {'comments': [
+                comment(f'{thread_id}.{reply:04d}', thread_id)
+                for reply in range(replies)
+            ]},
+        })
+    return json.dumps({
+        'kind': 'youtube#commentThreadListResponse',
+        'pageInfo': {'totalResults': count, 'resultsPerPage': count},
+        'items': items,
+    }).encode()
+
+
+def bench_json(number: int) -> Dict[str, Result]:
+    page = _comment_threads_page(100, 5)
+    return {'comment_threads_100': _result(
+        _measure(lambda: json.loads(page), max(1, number // 1000))
+    )}
+
+
+async def _throughput(request: Callable, count: int,
+                      concurrency: int) -> Result:
+    """Best and median requests per second."""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await request()
+
+    runs: List[float] = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(count)))
+        runs.append(count / (time.perf_counter() - start))
+    return max(runs), 'req/s', statistics.median(runs)
+
+
+async def _bench_e2e(count: int) -> Dict[str, Result]:
+    from aioyoutube import Api, Cassette
+    from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+
+    dataset = FakeDataset(channels=10, videos_per_channel=1000)
+    calls = {
+        'videos': lambda api: api.videos(
+            key='key', part=['snippet', 'statistics'],
+            video_ids=[dataset.video_id(0, video) for video in range(50)],
+        ),
+        'search': lambda api: api.search(key='key', text='text'),
+    }
+    results = {}
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, 'suite.cassette')
+        async with FakeYoutubeServer(dataset) as server:
+            cassette = Cassette(path, mode='record')
+            async with Api(base_url=server.base_url) as api:
+                for name, call in calls.items():
+                    results[f'{name}_server'] = await _throughput(
+                        lambda: call(api), count, 50
+                    )
+            async with Api(base_url=server.base_url,
+                           cassette=cassette) as api:
+                for call in calls.values():
+                    await call(api)
+            await cassette.close()
+
+        cassette = Cassette(path)
+        async with Api(base_url=server.base_url, cassette=cassette) as api:
+            for name, call in calls.items():
+                results[f'{name}_replay'] = await _throughput(
+                    lambda: call(api), count * 5, 50
+                )
+        await cassette.close()
+    return results
+
+
+def bench_e2e(number: int) -> Dict[str, Result]:
+    return asyncio.run(_bench_e2e(max(100, number // 50)))
+
+
+BENCHMARKS = {
+    'validation': bench_validation,
+    'error': bench_error,
+    'dispatch': bench_dispatch,
+    'time_converting': bench_time_converting,
+    'json': bench_json,
+    'e2e': bench_e2e,
+}
+
+
+def _revision() -> str:
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True,
+            cwd=_BENCHMARKS_DIR,
+            text=True, check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return ''
+
+
+def _change(value: float, base: float, unit: str) -> float:
+    """Share of slowdown, negative for speedup."""
+    if base <= 0:
+        return 0.
+    if unit == 'ns':
+        return (value - base) / base
+    return (base - value) / base
+
+
+def _compare(results: Dict[str, list], baseline: Dict[str, list],
+             threshold: float) -> bool:
+    """Printing change of every case, True when best and median values
+    of some case are both worse then threshold."""
+    regressed = False
+    for name, (value, unit, median) in results.items():
+        if name not in baseline:
+            continue
+        # Results saved before medians were added have only best value.
+        base, _, *base_median = baseline[name]
+        change = _change(value, base, unit)
+        median_change = _change(
+            median, base_median[0] if base_median else base, unit
+        )
+        mark = ''
+        if min(change, median_change) > threshold:
+            mark = '  REGRESSION'
+            regressed = True
+        print(f'{name:35} {base:14.1f} -> {value:14.1f} {unit:6}'
+              f'{-change:+8.1%} median {-median_change:+8.1%}{mark}')
+    return regressed
+
+
+def main(args) -> int:
+    number = 20000 if args.quick else 200000
+    names = args.only.split(',') if args.only else list(BENCHMARKS)
+    results = {}
+    for name in names:
+        try:
+            cases = BENCHMARKS[name](number)
+        except ImportError as err:
+            print(f'{name:35} skipped, {err}')
+            continue
+        for case, (value, unit, median) in cases.items():
+            results[f'{name}.{case}'] = [
+                round(value, 1), unit, round(median, 1),
+            ]
+            print(f'{name + "." + case:35} {value:14.1f} {unit:6} '
+                  f'median {median:14.1f}')
+
+    if args.output:
+        os.makedirs(os.path.dirname(args.output) or '.', exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as file:
+            json.dump({
+                'meta': {
+                    'revision': _revision(),
+                    'python': platform.python_version(),
+                    'platform': platform.platform(),
+                    'created_at': time.strftime('%Y-%m-%dT%H:%M:%SZ',
+                                                time.gmtime()),
+                },
+                'results': results,
+            }, file, indent=2)
+
+    if args.compare:
+        with open(args.compare, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        print(f'\ncompared with {args.compare}, positive change is faster:')
+        if _compare(results, baseline, args.threshold):
+            return 1
+    return 0
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--quick', action='store_true',
+                        help='fewer iterations, for smoke runs')
+    parser.add_argument('--only', help='comma separated benchmark names: '
+                                       + ','.join(BENCHMARKS))
+    parser.add_argument('--output', help='path of saved results')
+    parser.add_argument('--compare', help='path of baseline results')
+    parser.add_argument('--threshold', type=float, default=0.25,
+                        help='allowed slowdown share, default 0.25')
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,112 @@
+"""Cost of parameters validation per call.
+
+Validation wraps handler doing nothing, so only validation overhead is
+measured, with validation enabled and disabled. Revisions with
+validation middleware and older revisions with validation decorators
+are both supported, run it on two revisions to compare them.
+
+Usage:
+    python benchmarks/validation.py [--number 100000]
+"""
+import argparse
+import timeit
+
+try:
+    from aioyoutube.handlers import validation_middleware
+    from aioyoutube.pipeline import Request
+    _DECORATORS = None
+except ImportError:
+    # Revisions before api methods pipeline validate by decorators.
+    from aioyoutube.handlers import (
+        search_validation,
+        comment_threads_validation,
+        channels_validation,
+        videos_validation,
+    )
+    _DECORATORS = {
+        'search': search_validation,
+        'commentThreads': comment_threads_validation,
+        'channels': channels_validation,
+        'videos': videos_validation,
+    }
+
+
+class _Api:
+    validate = True
+
+
+class _NoValidationApi:
+    validate = False
+
+
+async def _noop(*args, **kwargs):
+    return None
+
+
+def _run(coroutine):
+    try:
+        coroutine.send(None)
+    except StopIteration as stop:
+        return stop.value
+
+
+_CASES = {
+    'search': {
+        'key': 'key', 'text': 'text', 'max_results': 50, 'order': 'date',
+        'search_by': 'video', 'page_token': 'token',
+    },
+    'commentThreads': {
+        'key': 'key', 'part': ['id', 'snippet', 'replies'],
+        'video_id': 'video', 'max_results': 100, 'order': 'time',
+        'text_format': 'plainText',
+    },
+    'channels': {
+        'key': 'key', 'part': ['snippet', 'statistics', 'contentDetails'],
+        'channel_id': 'channel',
+    },
+    'videos': {
+        'key': 'key', 'part': ['snippet', 'statistics'],
+        'video_ids': ['video'] * 50,
+    },
+}
+
+
+def _measure(function, number: int) -> float:
+    """Best of five runs, seconds per call."""
+    return min(timeit.repeat(function, number=number, repeat=5)) / number
+
+
+def _calls(name: str, kwargs: dict):
+    """Base call and calls with enabled and disabled validation."""
+    if _DECORATORS is None:
+        request = Request(name, kwargs, {})
+        middleware = validation_middleware(name)
+        # Api without validation doesn't add middleware into pipeline.
+        return (
+            lambda: _run(_noop(request)),
+            lambda: _run(middleware(request, _noop)),
+            lambda: _run(_noop(request)),
+        )
+
+    wrapped = _DECORATORS[name](_noop)
+    return (
+        lambda: _run(_noop(_Api(), **kwargs)),
+        lambda: _run(wrapped(_Api(), **kwargs)),
+        lambda: _run(wrapped(_NoValidationApi(), **kwargs)),
+    )
+
+
+def main(number: int):
+    for name, kwargs in _CASES.items():
+        base, enabled, disabled = _calls(name, kwargs)
+        base = _measure(base, number)
+        for validate, call in ((True, enabled), (False, disabled)):
+            per_call = (_measure(call, number) - base) * 1e9
+            print(f'{name:15} validate={validate!s:5} '
+                  f'{per_call:8.0f} ns/call')
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser()
+    parser.add_argument('--number', type=int, default=100000)
+    main(parser.parse_args().number)
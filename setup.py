@@ -7,7 +7,9 @@ setup(
     name='aioyoutube',
     version='0.1.6',
     packages=['aioyoutube', 'aioyoutube.helpers', 'aioyoutube.handlers',
-              'aioyoutube.exeptions'],
+              'aioyoutube.exeptions', 'aioyoutube.cache',
+              'aioyoutube.checkpoint', 'aioyoutube.export',
+              'aioyoutube.fake'],
     url='https://github.com/diarts/aioyoutube.git',
     license='MIT',
     author='konstantin',
@@ -22,4 +24,8 @@ setup(
     install_requires=[
         'rfc3339>=6.2',
     ],
+    extras_require={
+        'parquet': ['pyarrow'],
+        'zstd': ['zstandard'],
+    },
 )
@@ -0,0 +1,26 @@
+import asyncio
+
+from aioyoutube import Api, MemoryCache
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+
+DATASET = FakeDataset(channels=1, videos_per_channel=1, comments_per_video=0)
+VIDEO_ID = DATASET.video_id(0, 0)
+
+
+def test_close_cancels_refreshes():
+    cache = MemoryCache(ttl=0.05, stale_ttl=60)
+
+    async def main():
+        async with FakeYoutubeServer(DATASET, latency=0.2) as server:
+            api = Api(base_url=server.base_url, cache=cache)
+            for _ in range(2):
+                await api.videos(key='key', part=['id'],
+                                 video_ids=[VIDEO_ID])
+                await asyncio.sleep(0.1)
+            assert cache._refreshing
+            await api.close()
+            assert cache._refreshing == {}
+
+    asyncio.run(main())
+    assert cache.stats['stale_hits'] == 1
+    assert cache.stats['refreshes'] == cache.stats['refresh_errors'] == 0
@@ -0,0 +1,69 @@
+import asyncio
+
+import pytest
+
+from aioyoutube import Api, CompactIdSet
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+from aioyoutube.models import Model
+
+DATASET = FakeDataset(channels=2, videos_per_channel=12,
+                      playlists_per_channel=1, comments_per_video=7,
+                      max_replies=3, interval=86400)
+VIDEO_ID = DATASET.video_id(0, 1)
+THREAD_ID = DATASET.thread_id(VIDEO_ID, 1)
+
+ITERATORS = {
+    'iter_search': lambda api, **kwargs: api.iter_search(
+        text='video', max_results=5, **kwargs
+    ),
+    'iter_comment_threads': lambda api, **kwargs: api.iter_comment_threads(
+        part=['snippet'], video_id=VIDEO_ID, max_results=5, **kwargs
+    ),
+    'iter_comments': lambda api, **kwargs: api.iter_comments(
+        part=['snippet'], parent_id=THREAD_ID, max_results=2, **kwargs
+    ),
+    'iter_playlist_items': lambda api, **kwargs: api.iter_playlist_items(
+        part=['snippet'], playlist_id=DATASET.uploads_id(0), max_results=5,
+        **kwargs
+    ),
+    'iter_playlists': lambda api, **kwargs: api.iter_playlists(
+        part=['snippet'], channel_id=DATASET.channel_id(0), max_results=1,
+        **kwargs
+    ),
+    'crawl_comments': lambda api, **kwargs: api.crawl_comments(
+        VIDEO_ID, **kwargs
+    ),
+    'iter_channel_videos': lambda api, **kwargs: api.iter_channel_videos(
+        DATASET.channel_id(0), **kwargs
+    ),
+    'sharded_search': lambda api, **kwargs: api.sharded_search(
+        text='video', published_after=DATASET.video_published(0, 0) - 1,
+        published_before=DATASET.video_published(1, 11) + 1, **kwargs
+    ),
+}
+
+
+async def _collect(iterator) -> list:
+    return [item async for item in iterator]
+
+
+@pytest.mark.parametrize('name', sorted(ITERATORS))
+def test_dedup_with_models(name):
+    dedup = CompactIdSet()
+
+    async def main():
+        async with FakeYoutubeServer(DATASET) as server:
+            async with Api(base_url=server.base_url) as api:
+                first = await _collect(ITERATORS[name](
+                    api, key='key', dedup=dedup, as_models=True
+                ))
+                second = await _collect(ITERATORS[name](
+                    api, key='key', dedup=dedup, as_models=True
+                ))
+        return first, second
+
+    first, second = asyncio.run(main())
+    assert first
+    assert all(isinstance(item, Model) for item in first)
+    assert len({item.id for item in first}) == len(first) == len(dedup)
+    assert second == []
@@ -0,0 +1,113 @@
+import asyncio
+
+import pytest
+
+from aioyoutube import Api
+from aioyoutube.exeptions import *
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+from aioyoutube.handlers.error import response_error
+
+DATASET = FakeDataset(channels=1, videos_per_channel=2, comments_per_video=1,
+                      comments_disabled_every=2)
+UNKNOWN_ID = 'x' * 24
+
+# Exceptions raised by error decorators of version 0.1.6 by api method,
+# http status and error reason.
+BASELINE_ERRORS = [
+    ('search', 400, 'keyInvalid', InvalidApiKey),
+    ('search', 400, 'unknownPart', UnknownField),
+    ('search', 400, 'invalidParameter', InvalidParameterValue),
+    ('search', 400, 'invalidPageToken', InvalidPageToken),
+    ('search', 400, 'processingFailure', ProcessingFailure),
+    ('search', 400, 'missingRequiredParameter', MissingRequiredParameter),
+    ('search', 400, 'unexpectedParameter', UnexpectedParameter),
+    ('search', 401, 'authorizationRequired', NoAuthorized),
+    ('search', 403, 'dailyLimitExceededUnreg', ExceededDailyLimit),
+    ('search', 403, 'quotaExceeded', ExceededDailyLimit),
+    ('search', 403, 'dailyLimitExceeded', ExceededDailyLimit),
+    ('search', 403, 'channelClosed', ChannelClosed),
+    ('search', 403, 'channelSuspended', ChannelSuspended),
+    ('search', 403, 'forbidden', ForbiddenError),
+    ('search', 404, 'channelNotFound', ChannelNotExist),
+    ('search', 404, 'contentOwnerAccountNotFound', InvalidOwnerAccount),
+    ('search', 404, 'videoNotFound', InvalidVideoId),
+    ('commentThreads', 403, 'commentsDisabled', CommentsDisabled),
+    ('commentThreads', 404, 'videoNotFound', InvalidVideoId),
+    ('comments', 404, 'commentNotFound', InvalidCommentThreadId),
+    ('channels', 400, 'invalidChannelId', InvalidChannelId),
+    ('channels', 403, 'channelForbidden', ChannelForbidden),
+    ('channels', 404, 'channelNotFound', ChannelNotExist),
+    ('playlistItems', 403, 'playlistItemsNotAccessible',
+     PlaylistItemsNotAccessible),
+    ('playlistItems', 403, 'watchHistoryNotAccessible',
+     HistoryNotAccessible),
+    ('playlistItems', 403, 'watchLaterNotAccessible',
+     WatchLaterNotAccessible),
+    ('playlistItems', 404, 'playlistNotFound', InvalidPlaylistId),
+    ('playlists', 403, 'playlistForbidden', PlaylistForbidden),
+    ('videos', 404, 'videoNotFound', InvalidVideoId),
+]
+
+
+def _error_json(status: int, reason: str) -> dict:
+    return {'error': {
+        'code': status,
+        'message': f'Api message of {reason}.',
+        'errors': [{'message': '', 'domain': 'youtube', 'reason': reason}],
+    }}
+
+
+@pytest.mark.parametrize('method, status, reason, exception',
+                         BASELINE_ERRORS)
+def test_baseline_errors(method, status, reason, exception):
+    err = response_error(method, status, _error_json(status, reason), {})
+    assert type(err) is exception
+    assert err.code == status
+
+
+def test_not_found_with_json_body():
+    json = _error_json(404, 'somethingNotFound')
+    err = response_error('videos', 404, json, {})
+    assert type(err) is ResponseApiError
+    assert 'Api message of somethingNotFound.' in err.mess
+
+
+def test_not_found_without_json_body():
+    err = response_error('video', 404, None, {})
+    assert type(err) is WrongApiName
+    assert '"video"' in err.mess
+
+
+@pytest.mark.parametrize('status, exception', [
+    (429, RateLimitExceeded),
+    (500, ServerError),
+    (503, ServerError),
+    (418, ResponseApiError),
+])
+def test_status_errors(status, exception):
+    assert type(response_error('videos', status, None, {})) is exception
+
+
+async def _call(method: str, **kwargs):
+    async with FakeYoutubeServer(DATASET, keys=['key']) as server:
+        async with Api(base_url=server.base_url) as api:
+            return await getattr(api, method)(**{'key': 'key', **kwargs})
+
+
+@pytest.mark.parametrize('method, kwargs, exception, code', [
+    ('channels', {'channel_id': UNKNOWN_ID}, ChannelNotExist, 404),
+    ('channels', {'user_name': 'unknown'}, InvalidUserName, None),
+    ('playlists', {'channel_id': UNKNOWN_ID}, ChannelNotExist, 404),
+    ('playlistItems', {'playlist_id': UNKNOWN_ID}, InvalidPlaylistId, 404),
+    ('commentThreads', {'video_id': 'x' * 11}, InvalidVideoId, 404),
+    ('commentThreads', {'video_id': DATASET.video_id(0, 1)},
+     CommentsDisabled, 403),
+    ('comments', {'parent_id': UNKNOWN_ID}, InvalidCommentThreadId, 404),
+    ('channels', {'channel_id': DATASET.channel_id(0), 'key': 'invalid'},
+     InvalidApiKey, 400),
+])
+def test_fake_server_errors(method, kwargs, exception, code):
+    with pytest.raises(exception) as info:
+        asyncio.run(_call(method, part=['snippet'], **kwargs))
+    assert type(info.value) is exception
+    assert info.value.code == code
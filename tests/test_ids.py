@@ -0,0 +1,101 @@
+import asyncio
+
+import pytest
+
+from aioyoutube import Api
+from aioyoutube.exeptions import VariableValueError
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+from aioyoutube.pipeline import Response
+
+DATASET = FakeDataset(channels=2, videos_per_channel=40,
+                      playlists_per_channel=1, comments_per_video=0)
+VIDEO_IDS = [
+    DATASET.video_id(channel, video)
+    for video in range(40) for channel in range(2)
+]
+
+
+async def _videos(*middlewares, fan_out: int = 10, **kwargs) -> dict:
+    async with FakeYoutubeServer(DATASET) as server:
+        async with Api(base_url=server.base_url, fan_out=fan_out,
+                       middlewares=middlewares) as api:
+            return await api.videos(key='key', **kwargs)
+
+
+def test_items_merged_in_order_of_ids():
+    json = asyncio.run(_videos(part=['snippet'], video_ids=VIDEO_IDS))
+    assert [item['id'] for item in json['items']] == VIDEO_IDS
+    assert json['missingIds'] == []
+    assert json['pageInfo']['totalResults'] == len(VIDEO_IDS)
+
+
+def test_duplicate_ids_requested_once():
+    json = asyncio.run(_videos(
+        part=['snippet'], video_ids=VIDEO_IDS[:3] + VIDEO_IDS[:2]
+    ))
+    assert [item['id'] for item in json['items']] == VIDEO_IDS[:3]
+
+
+def test_missing_ids():
+    unknown = ['x' * 11, 'y' * 11]
+    json = asyncio.run(_videos(
+        part=['snippet'], video_ids=[unknown[0]] + VIDEO_IDS + [unknown[1]]
+    ))
+    assert [item['id'] for item in json['items']] == VIDEO_IDS
+    assert json['missingIds'] == unknown
+
+
+def test_fields_without_id():
+    requested = []
+
+    async def fields_selector(request, handler):
+        # Fake server ignores "fields", item ids are dropped here as api
+        # does when they aren't selected.
+        fields = request.params['fields']
+        requested.append(fields)
+        response = await handler(request)
+        if 'items/id' not in fields.split(','):
+            for item in response.json['items']:
+                del item['id']
+        return response
+
+    json = asyncio.run(_videos(
+        fields_selector, part=['snippet'], video_ids=VIDEO_IDS,
+        fields='items(snippet/title)',
+    ))
+    assert requested == ['items(snippet/title),items/id'] * 2
+    assert [item['id'] for item in json['items']] == VIDEO_IDS
+    assert all('title' in item['snippet'] for item in json['items'])
+
+
+def test_fan_out_limit():
+    running = 0
+    concurrency = []
+
+    async def counter(request, handler):
+        nonlocal running
+        running += 1
+        concurrency.append(running)
+        try:
+            await asyncio.sleep(0.01)
+            return await handler(request)
+        finally:
+            running -= 1
+
+    ids = VIDEO_IDS + [f'z{i:010d}' for i in range(200)]
+    json = asyncio.run(_videos(
+        counter, fan_out=2, part=['id'], video_ids=ids
+    ))
+    assert len(concurrency) == 6
+    assert max(concurrency) == 2
+    assert len(json['items']) + len(json['missingIds']) == len(ids)
+
+
+def test_raw_limit():
+    json = asyncio.run(_videos(
+        part=['id'], video_ids=VIDEO_IDS[:50], raw=True
+    ))
+    assert json.status == 200
+
+    with pytest.raises(VariableValueError, match='only for 50 ids'):
+        asyncio.run(_videos(part=['id'], video_ids=VIDEO_IDS[:51], raw=True))
@@ -0,0 +1,90 @@
+import asyncio
+from datetime import datetime, timezone
+
+import pytest
+
+from aioyoutube import Api, ApiKeyPool
+from aioyoutube import key_pool as key_pool_module
+from aioyoutube.exeptions import ExceededDailyLimit
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+
+DATASET = FakeDataset(channels=1, videos_per_channel=1, comments_per_video=0)
+VIDEO_ID = DATASET.video_id(0, 0)
+
+
+async def _requests(pool: ApiKeyPool, count: int, **options) -> dict:
+    """Sending requests until count or quota error, returning server
+    stats and error."""
+    error = None
+    async with FakeYoutubeServer(DATASET, **options) as server:
+        async with Api(base_url=server.base_url, key_pool=pool) as api:
+            for _ in range(count):
+                try:
+                    await api.videos(part=['id'], video_ids=[VIDEO_ID])
+                except ExceededDailyLimit as exc:
+                    error = exc
+                    break
+        return server.stats, error
+
+
+def _timestamp(*args) -> float:
+    return datetime(*args, tzinfo=timezone.utc).timestamp()
+
+
+def test_rotation_on_exceeded_quota():
+    # Pool overestimates quota, server refuses requests over 3 units.
+    pool = ApiKeyPool({'a': 10, 'b': 5})
+    stats, error = asyncio.run(_requests(pool, 6, quota=3))
+    assert error is None
+    assert stats['quota'] == {'a': 3, 'b': 3}
+    assert stats['errors'] == {'quotaExceeded': 1}
+    assert pool.quota()['a']['exhausted']
+    assert not pool.quota()['b']['exhausted']
+
+
+def test_exhausted_key_skipped():
+    pool = ApiKeyPool(['a', 'b'])
+    pool.exhaust('a')
+    stats, error = asyncio.run(_requests(pool, 3))
+    assert error is None
+    assert stats['quota'] == {'b': 3}
+    assert pool.remaining('a') == 0
+    assert pool.remaining('b') == 10000 - 3
+
+
+def test_all_keys_exhausted():
+    pool = ApiKeyPool({'a': 2, 'b': 2})
+    stats, error = asyncio.run(_requests(pool, 10, quota=2))
+    assert 'all 2 keys' in error.mess
+    assert stats['quota'] == {'a': 2, 'b': 2}
+    assert stats['errors'] == {}
+
+
+@pytest.mark.parametrize('now, reset_at', [
+    # 23:59 of Pacific standard time.
+    (_timestamp(2026, 1, 15, 7, 59), _timestamp(2026, 1, 15, 8)),
+    # 00:00 of Pacific daylight time, next day reset.
+    (_timestamp(2026, 7, 15, 7), _timestamp(2026, 7, 16, 7)),
+])
+def test_reset_at_pacific_midnight(now, reset_at):
+    assert key_pool_module._next_reset(now) == reset_at
+
+
+def test_reset_of_used_quota(monkeypatch):
+    now = _timestamp(2026, 1, 15, 7, 59)
+    monkeypatch.setattr(key_pool_module.time, 'time', lambda: now)
+    pool = ApiKeyPool({'a': 100, 'b': 100})
+    pool.acquire('search')
+    pool.exhaust('b')
+    assert pool.reset_at == _timestamp(2026, 1, 15, 8)
+    with pytest.raises(ExceededDailyLimit):
+        pool.acquire('search')
+
+    now = _timestamp(2026, 1, 15, 8)
+    assert pool.quota() == {
+        key: {'daily_quota': 100, 'used': 0, 'remaining': 100,
+              'exhausted': False}
+        for key in 'ab'
+    }
+    assert pool.reset_at == _timestamp(2026, 1, 16, 8)
+    assert pool.acquire('search') in ('a', 'b')
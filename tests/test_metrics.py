@@ -0,0 +1,55 @@
+import asyncio
+
+from aioyoutube import Api, ApiMetrics
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+from aioyoutube.metrics import _masked
+
+
+async def _videos(api: Api, dataset: FakeDataset):
+    await api.videos(
+        key='key', part=['id'], video_ids=[dataset.video_id(0, 0)]
+    )
+
+
+def test_reset_then_record():
+    dataset = FakeDataset(channels=1, videos_per_channel=5)
+    metrics = ApiMetrics()
+
+    async def main():
+        async with FakeYoutubeServer(dataset) as server:
+            async with Api(base_url=server.base_url, metrics=metrics) as api:
+                await _videos(api, dataset)
+                metrics.reset()
+                assert metrics.snapshot()['totals']['requests'] == 0
+                await _videos(api, dataset)
+
+    asyncio.run(main())
+    snapshot = metrics.snapshot()
+    assert snapshot['methods']['videos']['requests'] == 1
+    assert snapshot['totals']['requests'] == 1
+    assert snapshot['quota'] == {_masked('key'): 1}
+    assert 'aioyoutube_requests_total{method="videos"} 1' in \
+        metrics.prometheus()
+
+
+def test_buckets_are_cumulative():
+    metrics = ApiMetrics(buckets=(0.1, 1.))
+    method = metrics.method('videos')
+    method.observe(0.05)
+    method.observe(0.5)
+    method.observe(5.)
+    buckets = metrics.snapshot()['methods']['videos']['latency']['buckets']
+    assert buckets == {0.1: 1, 1.: 2, float('inf'): 3}
+    assert 'le="1.0"} 2' in metrics.prometheus()
+
+
+def test_keys_are_masked():
+    metrics = ApiMetrics()
+    metrics.charge('first-secret-key', 1)
+    metrics.charge('other-secret-key', 100)
+    quota = metrics.snapshot()['quota']
+    assert sorted(quota.values()) == [1, 100]
+    assert all(key.startswith('...-key-') for key in quota)
+    exported = metrics.prometheus()
+    assert 'secret' not in str(quota) and 'secret' not in exported
+    assert exported.count('aioyoutube_quota_units_total{') == 2
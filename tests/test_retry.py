@@ -0,0 +1,122 @@
+import asyncio
+import random
+
+import pytest
+from aiohttp import ClientConnectionError
+
+from aioyoutube import Api, RetryPolicy
+from aioyoutube.exeptions import (
+    ExceededDailyLimit, ForbiddenError, InvalidParameterValue,
+    InvalidVideoId, ProcessingFailure, RateLimitExceeded, ServerError,
+)
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+
+DATASET = FakeDataset(channels=1, videos_per_channel=1, comments_per_video=0)
+VIDEO_ID = DATASET.video_id(0, 0)
+
+
+async def _videos(count: int, policy: RetryPolicy = None,
+                  call_options: dict = None, **options) -> dict:
+    async with FakeYoutubeServer(DATASET, **options) as server:
+        async with Api(base_url=server.base_url,
+                       retry_policy=policy) as api:
+            for _ in range(count):
+                await api.videos(key='key', part=['id'],
+                                 video_ids=[VIDEO_ID], **call_options or {})
+        return server.stats
+
+
+def test_full_jitter_delays():
+    policy = RetryPolicy(base_delay=0.5, max_delay=3.)
+    random.seed(1)
+    for retry, limit in enumerate((0.5, 1., 2., 3., 3.)):
+        delays = [policy.delay(retry) for _ in range(1000)]
+        assert all(0 <= delay <= limit for delay in delays)
+        assert max(delays) > limit * 0.9
+        assert min(delays) < limit * 0.1
+
+
+def test_retry_after_delay():
+    err = RateLimitExceeded(mess='Too many requests', retry_after=2.)
+    assert RetryPolicy(base_delay=0.1).delay(0, err) == 2.
+    assert RetryPolicy(
+        base_delay=0.1, respect_retry_after=False
+    ).delay(0, err) <= 0.1
+
+
+def test_retry_after_of_rate_limit():
+    policy = RetryPolicy(base_delay=0.001)
+    stats = asyncio.run(_videos(25, policy, rate_limit=20.))
+    assert stats['errors']['rateLimitExceeded'] >= 1
+    assert policy.stats['errors'] == {
+        'RateLimitExceeded': stats['errors']['rateLimitExceeded'],
+    }
+    # Waited by "Retry-After" header, not by jitter limit.
+    assert policy.stats['delay'] > 0.001 * policy.stats['retries']
+
+
+def test_seeded_server_errors():
+    policy = RetryPolicy(max_attempts=10, base_delay=0.001)
+    stats = asyncio.run(_videos(30, policy, error_rate=0.3, seed=1))
+    errors = stats['errors']['backendError']
+    assert errors > 0
+    assert policy.stats == {
+        'calls': 30,
+        'attempts': 30 + errors,
+        'retries': errors,
+        'gave_up': 0,
+        'delay': policy.stats['delay'],
+        'errors': {'ServerError': errors},
+    }
+    assert stats['requests'] == {'videos': 30 + errors}
+
+
+def test_gave_up_after_max_attempts():
+    policy = RetryPolicy(max_attempts=3, base_delay=0.001)
+    with pytest.raises(ServerError):
+        asyncio.run(_videos(1, policy, error_rate=1.))
+    assert policy.stats['attempts'] == 3
+    assert policy.stats['retries'] == 2
+    assert policy.stats['gave_up'] == 1
+
+
+def test_retry_disabled_by_call():
+    policy = RetryPolicy(base_delay=0.001)
+    with pytest.raises(ServerError):
+        asyncio.run(_videos(
+            1, policy, call_options={'retry': None}, error_rate=1.
+        ))
+    assert policy.stats['calls'] == 0
+
+
+def test_retry_policy_of_call():
+    policy = RetryPolicy(base_delay=0.001)
+    call_policy = RetryPolicy(max_attempts=5, base_delay=0.001)
+    with pytest.raises(ServerError):
+        asyncio.run(_videos(
+            1, policy, call_options={'retry': call_policy}, error_rate=1.
+        ))
+    assert policy.stats['calls'] == 0
+    assert call_policy.stats['attempts'] == 5
+
+    stats = asyncio.run(_videos(
+        1, call_options={'retry': call_policy}, error_rate=0.5, seed=3
+    ))
+    assert call_policy.stats['calls'] == 2
+    assert call_policy.stats['attempts'] == 5 + stats['requests']['videos']
+
+
+@pytest.mark.parametrize('err, retryable', [
+    (ServerError(mess=''), True),
+    (RateLimitExceeded(mess=''), True),
+    (ProcessingFailure(mess=''), True),
+    (ExceededDailyLimit(mess=''), False),
+    (ForbiddenError(mess=''), False),
+    (InvalidParameterValue(mess=''), False),
+    (InvalidVideoId(mess=''), False),
+    (ClientConnectionError(), True),
+    (asyncio.TimeoutError(), True),
+    (ValueError(), False),
+])
+def test_retryable_errors(err, retryable):
+    assert RetryPolicy.is_retryable(err) is retryable
@@ -0,0 +1,45 @@
+import asyncio
+import os
+
+import pytest
+
+from aioyoutube import ProcessRunner, QuotaCoordinator
+
+
+async def crash(api, item):
+    if item == 'crash':
+        # Message of taken item is flushed before exit.
+        await asyncio.sleep(0.5)
+        os._exit(3)
+    return item
+
+
+def test_crashed_worker():
+    runner = ProcessRunner(crash, ['a', 'crash', 'b', 'c'], keys=['key'],
+                           processes=1, concurrency=1)
+
+    async def main():
+        return [item async for item in runner]
+
+    with pytest.raises(RuntimeError, match=r'items not processed.*0: 3'):
+        asyncio.run(main())
+    assert runner.errors == {1: 'Worker 0 exited with code 3.'}
+    stats = runner.stats
+    assert (stats['done'], stats['failed'], stats['pending']) == (1, 1, 2)
+
+
+def test_release_after_quota_reset():
+    coordinator = QuotaCoordinator({'key': 1000}, lease_size=100)
+    key, units, reset_at = coordinator.lease(1)
+    assert (key, units) == ('key', 100)
+
+    # Quota is reset before unused units are returned.
+    coordinator._pool._reset_at = 0
+    coordinator.release(key, 60, reset_at)
+    quota = coordinator.stats['quota']['key']
+    assert (quota['used'], quota['remaining']) == (0, 1000)
+
+    key, units, reset_at = coordinator.lease(1)
+    coordinator.release(key, 60, reset_at)
+    quota = coordinator.stats['quota']['key']
+    assert (quota['used'], quota['remaining']) == (40, 960)
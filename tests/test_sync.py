@@ -0,0 +1,73 @@
+import asyncio
+
+import pytest
+
+from aioyoutube import Api, FileCheckpointStore, SqliteCheckpointStore
+from aioyoutube.fake import FakeDataset, FakeYoutubeServer
+
+DATASET = FakeDataset(channels=2, videos_per_channel=12, comments_per_video=0)
+
+STORES = {
+    'file': lambda path: FileCheckpointStore(str(path / 'checkpoints.json')),
+    'sqlite': lambda path: SqliteCheckpointStore(str(path / 'checkpoints.db')),
+}
+QUERIES = {
+    'sync_search': lambda api, store: api.sync_search(
+        store, 'search', key='key', text='video', max_results=5,
+    ),
+    'sync_playlist_items': lambda api, store: api.sync_playlist_items(
+        store, 'uploads', key='key', playlist_id=DATASET.uploads_id(0),
+        max_results=5,
+    ),
+}
+
+
+def _item_id(item: dict) -> str:
+    return item['id']['videoId'] if isinstance(item['id'], dict) \
+        else item['id']
+
+
+async def _take(iterator, count: int = None) -> list:
+    """Taking count of items from iterator and closing it."""
+    items = []
+    try:
+        while count is None or len(items) < count:
+            try:
+                items.append(_item_id(await iterator.__anext__()))
+            except StopAsyncIteration:
+                break
+    finally:
+        await iterator.aclose()
+    return items
+
+
+async def _runs(query: str, store_factory, path, *counts) -> list:
+    """Items of query runs stopped after passed counts of items, stores
+    are reopened for every run."""
+    runs = []
+    async with FakeYoutubeServer(DATASET) as server:
+        async with Api(base_url=server.base_url) as api:
+            for count in counts:
+                store = store_factory(path)
+                try:
+                    runs.append(await _take(
+                        QUERIES[query](api, store), count
+                    ))
+                finally:
+                    await store.close()
+    return runs
+
+
+@pytest.mark.parametrize('store', sorted(STORES))
+@pytest.mark.parametrize('query', sorted(QUERIES))
+@pytest.mark.parametrize('stop', [1, 5, 7])
+def test_resume_of_stopped_run(tmp_path, store, query, stop):
+    (tmp_path / 'full').mkdir()
+    full, = asyncio.run(_runs(query, STORES[store], tmp_path / 'full', None))
+    stopped, resumed, repeated = asyncio.run(_runs(
+        query, STORES[store], tmp_path, stop, None, None
+    ))
+    assert len(full) > 5
+    assert stopped == full[:stop]
+    assert stopped + resumed == full
+    assert repeated == []